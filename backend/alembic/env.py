@@ -22,6 +22,28 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Schemas owned by the application (see init_db in app/main.py)
+APP_SCHEMAS = {"auth", "organization", "assessments", "correctives", "analysis", "jobs"}
+
+
+def include_name(name, type_, parent_names):
+    """Compare only the application's schemas, not public or pg_catalog."""
+    if type_ == "schema":
+        return name in APP_SCHEMAS
+    return True
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip indexes that exist only in revisions, not on the models.
+
+    The player search trigram indexes and the KAMS measurement expression
+    indexes are created by revisions, not declared on the models, so
+    autogenerate would otherwise offer to drop them.
+    """
+    if type_ == "index" and reflected and compare_to is None:
+        return False
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -31,6 +53,9 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_schemas=True,
+        include_name=include_name,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -38,7 +63,16 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
+    """Run migrations in 'online' mode.
+
+    Uses the connection passed in ``config.attributes["connection"]`` when
+    there is one (the tests migrate a scratch database that way).
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -46,10 +80,20 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        do_run_migrations(connection)
 
-        with context.begin_transaction():
-            context.run_migrations()
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_schemas=True,
+        include_name=include_name,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
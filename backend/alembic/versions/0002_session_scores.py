@@ -0,0 +1,30 @@
+"""persist session scores
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 04:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sessions', sa.Column('overall_score', sa.Numeric(precision=5, scale=2), nullable=True), schema='assessments')
+    op.add_column('sessions', sa.Column('color', sa.String(length=10), nullable=True), schema='assessments')
+    op.add_column('sessions', sa.Column('category_scores', postgresql.JSONB(astext_type=sa.Text()), nullable=True), schema='assessments')
+
+
+def downgrade() -> None:
+    op.drop_column('sessions', 'category_scores', schema='assessments')
+    op.drop_column('sessions', 'color', schema='assessments')
+    op.drop_column('sessions', 'overall_score', schema='assessments')
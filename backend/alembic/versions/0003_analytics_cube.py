@@ -0,0 +1,51 @@
+"""analytics cube
+
+Existing sessions are scored and the cube filled by
+``python -m app.scripts.backfill_session_scores``, not by this revision.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 04:31:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('session_score_aggregates',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('grouping_id', sa.Integer(), nullable=False),
+    sa.Column('bucket_date', sa.Date(), nullable=False),
+    sa.Column('assessment_type', sa.String(length=50), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=True),
+    sa.Column('sport_id', sa.Integer(), nullable=True),
+    sa.Column('position_group', sa.String(length=20), nullable=True),
+    sa.Column('graduation_year', sa.Integer(), nullable=True),
+    sa.Column('session_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Numeric(precision=14, scale=4), nullable=False),
+    sa.Column('score_sum_sq', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('score_min', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('score_max', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_session_score_aggregates')),
+    schema='analysis'
+    )
+    op.create_index('ix_session_score_aggregates_slice', 'session_score_aggregates', ['bucket_date', 'assessment_type'], unique=False, schema='analysis')
+    op.create_index('ix_session_score_aggregates_sport', 'session_score_aggregates', ['grouping_id', 'assessment_type', 'sport_id', 'bucket_date'], unique=False, schema='analysis')
+    op.create_index('ix_session_score_aggregates_team', 'session_score_aggregates', ['grouping_id', 'assessment_type', 'team_id', 'bucket_date'], unique=False, schema='analysis')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_session_score_aggregates_team', table_name='session_score_aggregates', schema='analysis')
+    op.drop_index('ix_session_score_aggregates_sport', table_name='session_score_aggregates', schema='analysis')
+    op.drop_index('ix_session_score_aggregates_slice', table_name='session_score_aggregates', schema='analysis')
+    op.drop_table('session_score_aggregates', schema='analysis')
@@ -0,0 +1,43 @@
+"""rescore checkpoints
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 04:32:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('rescore_checkpoints',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_name', sa.String(length=100), nullable=False),
+    sa.Column('result_type', sa.String(length=50), nullable=False),
+    sa.Column('last_id', sa.UUID(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('total_rows', sa.Integer(), nullable=True),
+    sa.Column('rows_processed', sa.Integer(), nullable=False),
+    sa.Column('rows_changed', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_rescore_checkpoints')),
+    sa.UniqueConstraint('job_name', 'result_type', name='uq_rescore_checkpoint_job_type'),
+    schema='assessments'
+    )
+    op.create_index(op.f('ix_assessments_rescore_checkpoints_job_name'), 'rescore_checkpoints', ['job_name'], unique=False, schema='assessments')
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_assessments_rescore_checkpoints_job_name'), table_name='rescore_checkpoints', schema='assessments')
+    op.drop_table('rescore_checkpoints', schema='assessments')
@@ -0,0 +1,29 @@
+"""keyset pagination indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 04:33:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_players_name_order', 'players', ['last_name', 'first_name', 'id'], unique=False, schema='organization')
+    op.create_index('ix_teams_name_order', 'teams', ['name', 'id'], unique=False, schema='organization')
+    op.create_index('ix_sessions_date_order', 'sessions', ['assessment_date', 'id'], unique=False, schema='assessments')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sessions_date_order', table_name='sessions', schema='assessments')
+    op.drop_index('ix_teams_name_order', table_name='teams', schema='organization')
+    op.drop_index('ix_players_name_order', table_name='players', schema='organization')
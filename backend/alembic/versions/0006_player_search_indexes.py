@@ -0,0 +1,43 @@
+"""player search trigram indexes
+
+Skipped on a server without the pg_trgm extension; search then falls back
+to plain substring matching, as it does for the startup bootstrap.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 04:34:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        print("Migration: pg_trgm is not available, player search uses substring matching")
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_players_search_name_trgm
+        ON organization.players USING gin ((first_name || ' ' || last_name) gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_players_code_trgm
+        ON organization.players USING gin (player_code gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS organization.ix_players_code_trgm")
+    op.execute("DROP INDEX IF EXISTS organization.ix_players_search_name_trgm")
@@ -0,0 +1,53 @@
+"""treat a NULL side as a value in the result unique keys
+
+Needs PostgreSQL 15+. The old key let a test have several results without
+a side; only the newest of those is kept.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 04:35:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINTS = [
+    ("onbaseu_results", "uq_onbaseu_session_test_side"),
+    ("pitcher_onbaseu_results", "uq_pitcher_onbaseu_session_test_side"),
+    ("tpi_power_results", "uq_tpi_power_session_test_side"),
+]
+
+
+def upgrade() -> None:
+    for table_name, constraint_name in CONSTRAINTS:
+        removed = op.get_bind().execute(sa.text(f"""
+            DELETE FROM assessments.{table_name} r
+            USING (
+                SELECT id, row_number() OVER (
+                    PARTITION BY session_id, test_code
+                    ORDER BY created_at DESC NULLS LAST, id DESC
+                ) AS rn
+                FROM assessments.{table_name}
+                WHERE side IS NULL
+            ) d
+            WHERE r.id = d.id AND d.rn > 1
+        """)).rowcount
+        if removed:
+            print(f"Migration: Removed {removed} duplicate results without a side "
+                  f"from {table_name}, keeping the newest per session and test")
+        op.drop_constraint(constraint_name, table_name, schema='assessments', type_='unique')
+        op.create_unique_constraint(constraint_name, table_name, ['session_id', 'test_code', 'side'], schema='assessments', postgresql_nulls_not_distinct=True)
+
+
+def downgrade() -> None:
+    for table_name, constraint_name in CONSTRAINTS:
+        op.drop_constraint(constraint_name, table_name, schema='assessments', type_='unique')
+        op.create_unique_constraint(constraint_name, table_name, ['session_id', 'test_code', 'side'], schema='assessments')
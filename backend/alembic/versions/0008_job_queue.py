@@ -0,0 +1,69 @@
+"""job queue and shared cache generation
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 04:36:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SCHEMA IF NOT EXISTS jobs")
+    op.create_table('jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('job_type', sa.String(length=50), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('run_at', sa.DateTime(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+    sa.Column('locked_by', sa.String(length=255), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.Column('progress_current', sa.Integer(), nullable=True),
+    sa.Column('progress_total', sa.Integer(), nullable=True),
+    sa.Column('progress_message', sa.String(length=255), nullable=True),
+    sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['auth.users.id'], name=op.f('fk_jobs_created_by_users'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_jobs')),
+    schema='jobs'
+    )
+    op.create_index('ix_jobs_claim_order', 'jobs', [sa.text('priority DESC'), 'run_at', 'id'], unique=False, schema='jobs', postgresql_where=sa.text("status = 'queued'"))
+    op.create_index('ix_jobs_created_order', 'jobs', ['created_at', 'id'], unique=False, schema='jobs')
+    op.create_index(op.f('ix_jobs_jobs_job_type'), 'jobs', ['job_type'], unique=False, schema='jobs')
+    op.create_index('ix_jobs_running_heartbeat', 'jobs', ['heartbeat_at'], unique=False, schema='jobs', postgresql_where=sa.text("status = 'running'"))
+    op.create_table('cache_generation',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('generation', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_cache_generation')),
+    schema='analysis'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cache_generation', schema='analysis')
+    op.drop_index('ix_jobs_running_heartbeat', table_name='jobs', schema='jobs', postgresql_where=sa.text("status = 'running'"))
+    op.drop_index(op.f('ix_jobs_jobs_job_type'), table_name='jobs', schema='jobs')
+    op.drop_index('ix_jobs_created_order', table_name='jobs', schema='jobs')
+    op.drop_index('ix_jobs_claim_order', table_name='jobs', schema='jobs', postgresql_where=sa.text("status = 'queued'"))
+    op.drop_table('jobs', schema='jobs')
+    op.execute("DROP SCHEMA IF EXISTS jobs")
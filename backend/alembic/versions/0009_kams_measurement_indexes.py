@@ -0,0 +1,34 @@
+"""KAMS measurement expression indexes
+
+The index expressions come from the query code, so they always match what
+measurement queries ask the planner for; a change to them needs a revision
+that rebuilds the indexes.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 04:37:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.services.assessment.kams_query import create_measurement_indexes, measurement_indexes
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_measurement_indexes(Session(bind=op.get_bind()))
+
+
+def downgrade() -> None:
+    for name, _test_type, _expression in measurement_indexes():
+        op.execute(f"DROP STATISTICS IF EXISTS assessments.st{name[2:]}")
+        op.execute(f"DROP INDEX IF EXISTS assessments.{name}")
@@ -1,35 +1,34 @@
-from typing import Generator, Optional
+from typing import AsyncGenerator, Optional
+from threading import BoundedSemaphore
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.config import get_settings
-from app.db.session import SessionLocal
+from app.db.session import get_db
+from app.db.async_session import get_async_db
 from app.models import User
 from app.schemas.auth import TokenPayload
-from app.core.exceptions import UnauthorizedException, ForbiddenException
+from app.core.exceptions import UnauthorizedException, ForbiddenException, TooManyRequestsException
+from app.core.security import password_hash_metrics
+from app.core.auth_cache import principal_cache, token_cache, cache_principal, cache_token
 
 settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
+_login_slots = BoundedSemaphore(settings.LOGIN_MAX_CONCURRENCY)
 
-def get_db() -> Generator:
-    """Dependency for getting database sessions."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
+def _get_token_user_id(token: str) -> UUID:
+    """Decode an access token and return its user id."""
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme),
-) -> User:
-    """Get the current authenticated user from JWT token."""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         token_data = TokenPayload(**payload)
@@ -43,7 +42,12 @@ def get_current_user(
     except JWTError:
         raise UnauthorizedException()
 
-    user = db.query(User).filter(User.id == UUID(token_data.sub)).first()
+    user_id = UUID(token_data.sub)
+    cache_token(token, user_id, token_data.exp)
+    return user_id
+
+
+def _check_user(user: Optional[User]) -> User:
     if not user:
         raise UnauthorizedException("User not found")
 
@@ -53,6 +57,41 @@ def get_current_user(
     return user
 
 
+def get_current_user(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+) -> User:
+    """Get the current authenticated user from JWT token.
+
+    Active users are served from the principal cache without a database
+    round trip. The returned user is detached from the session, so routes
+    that modify the account must load it themselves.
+    """
+    user_id = _get_token_user_id(token)
+    user = principal_cache.get(user_id)
+    if user is None:
+        user = db.query(User).options(selectinload(User.roles)).filter(User.id == user_id).first()
+        if user:
+            db.expunge(user)
+            cache_principal(user)
+    return _check_user(user)
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(oauth2_scheme),
+) -> User:
+    """Get the current authenticated user from JWT token (async mode)."""
+    user_id = _get_token_user_id(token)
+    user = principal_cache.get(user_id)
+    if user is None:
+        user = await db.get(User, user_id, options=[selectinload(User.roles)])
+        if user:
+            db.expunge(user)
+            cache_principal(user)
+    return _check_user(user)
+
+
 def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -71,6 +110,24 @@ def get_current_superuser(
     return current_user
 
 
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """Ensure the current user is active (async mode)."""
+    if not current_user.is_active:
+        raise ForbiddenException("Inactive user")
+    return current_user
+
+
+async def get_current_superuser_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """Ensure the current user is a superuser (async mode)."""
+    if not current_user.is_superuser:
+        raise ForbiddenException("Not enough permissions")
+    return current_user
+
+
 def get_optional_current_user(
     db: Session = Depends(get_db),
     token: Optional[str] = Depends(oauth2_scheme),
@@ -91,3 +148,17 @@ def get_optional_current_user(
 
     except JWTError:
         return None
+
+
+async def limit_login_concurrency() -> AsyncGenerator[None, None]:
+    """Admit a login, or reject it with 429 while too many are in progress.
+
+    Runs on the event loop, so rejected requests never take a worker thread.
+    """
+    if not _login_slots.acquire(blocking=False):
+        password_hash_metrics.record_rejected_login()
+        raise TooManyRequestsException("Too many concurrent logins, please retry")
+    try:
+        yield
+    finally:
+        _login_slots.release()
@@ -0,0 +1,202 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from uuid import UUID
+from datetime import date
+
+from app.api.deps import get_current_active_user_async, get_current_superuser_async
+from app.db.async_session import get_async_db
+from app.core.exceptions import NotFoundException, BadRequestException
+from app.services.analysis.async_analysis import AsyncAnalysisService
+from app.services.analysis.cache import analysis_cache
+from app.api.v1.analysis.router import MAX_COMPARE_PLAYERS
+
+router = APIRouter()
+
+
+# Player Analysis Endpoints
+
+@router.get("/player/{player_id}/progress")
+async def get_player_progress(
+    player_id: UUID,
+    assessment_type: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Get player progress over time for a specific assessment type."""
+    service = AsyncAnalysisService(db)
+    return await analysis_cache.get_or_set_async(
+        ("player_progress", str(player_id), assessment_type, start_date, end_date),
+        lambda: service.get_player_progress(player_id, assessment_type, start_date, end_date),
+        players=[player_id],
+    )
+
+
+@router.get("/player/{player_id}/summary")
+async def get_player_summary(
+    player_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Get comprehensive player assessment summary."""
+    service = AsyncAnalysisService(db)
+    summary = await analysis_cache.get_or_set_async(
+        ("player_summary", str(player_id)),
+        lambda: service.get_player_summary(player_id),
+        players=[player_id],
+    )
+    if not summary:
+        raise NotFoundException("Player not found")
+    return summary
+
+
+@router.get("/compare")
+async def compare_players(
+    player_ids: List[UUID] = Query(...),
+    assessment_type: str = Query(...),
+    as_of_date: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Compare multiple players on an assessment."""
+    if len(player_ids) > MAX_COMPARE_PLAYERS:
+        raise BadRequestException(f"Cannot compare more than {MAX_COMPARE_PLAYERS} players")
+
+    service = AsyncAnalysisService(db)
+    return await analysis_cache.get_or_set_async(
+        ("compare", tuple(str(p) for p in player_ids), assessment_type, as_of_date),
+        lambda: service.compare_players(player_ids, assessment_type, as_of_date),
+        players=player_ids,
+    )
+
+
+# Team Analysis Endpoints
+
+@router.get("/team/{team_id}/overview")
+async def get_team_overview(
+    team_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Get comprehensive team overview."""
+    service = AsyncAnalysisService(db)
+    overview = await analysis_cache.get_or_set_async(
+        ("team_overview", team_id),
+        lambda: service.get_team_overview(team_id),
+        teams=[team_id],
+    )
+    if not overview:
+        raise NotFoundException("Team not found")
+    return overview
+
+
+@router.get("/team/{team_id}/trends")
+async def get_team_trends(
+    team_id: int,
+    assessment_type: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Get team performance trends over time."""
+    service = AsyncAnalysisService(db)
+    trends = await analysis_cache.get_or_set_async(
+        ("team_trends", team_id, assessment_type, start_date, end_date),
+        lambda: service.get_team_trends(team_id, assessment_type, start_date, end_date),
+        teams=[team_id],
+    )
+    if not trends:
+        raise NotFoundException("Team not found")
+    return trends
+
+
+@router.get("/team/{team_id}/rankings")
+async def get_team_rankings(
+    team_id: int,
+    assessment_type: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Get player rankings within a team."""
+    service = AsyncAnalysisService(db)
+    rankings = await analysis_cache.get_or_set_async(
+        ("team_rankings", team_id, assessment_type),
+        lambda: service.get_player_rankings(team_id, assessment_type),
+        teams=[team_id],
+    )
+    if not rankings:
+        raise NotFoundException("Team not found")
+    return rankings
+
+
+@router.get("/team/{team_id}/asymmetry")
+async def get_team_asymmetry(
+    team_id: int,
+    include_unflagged: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Rank a team's athletes by left/right asymmetry across all assessment types."""
+    service = AsyncAnalysisService(db)
+    report = await analysis_cache.get_or_set_async(
+        ("team_asymmetry", team_id, include_unflagged),
+        lambda: service.get_asymmetry_report(team_id=team_id, include_unflagged=include_unflagged),
+        teams=[team_id],
+    )
+    if not report:
+        raise NotFoundException("Team not found")
+    return report
+
+
+# Sport Analysis Endpoints
+
+@router.get("/sport/{sport_id}/dashboard")
+async def get_sport_dashboard(
+    sport_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Get sport-wide assessment statistics by position group and class year."""
+    service = AsyncAnalysisService(db)
+    dashboard = await analysis_cache.get_or_set_async(
+        ("sport_dashboard", sport_id, start_date, end_date),
+        lambda: service.get_sport_dashboard(sport_id, start_date, end_date),
+        sports=[sport_id],
+    )
+    if not dashboard:
+        raise NotFoundException("Sport not found")
+    return dashboard
+
+
+@router.get("/sport/{sport_id}/asymmetry")
+async def get_sport_asymmetry(
+    sport_id: int,
+    include_unflagged: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Rank a sport's athletes by left/right asymmetry across all assessment types."""
+    service = AsyncAnalysisService(db)
+    report = await analysis_cache.get_or_set_async(
+        ("sport_asymmetry", sport_id, include_unflagged),
+        lambda: service.get_asymmetry_report(sport_id=sport_id, include_unflagged=include_unflagged),
+        sports=[sport_id],
+    )
+    if not report:
+        raise NotFoundException("Sport not found")
+    return report
+
+
+# Cache Endpoints
+
+@router.get("/cache/stats")
+async def get_cache_stats(
+    current_user=Depends(get_current_superuser_async),
+):
+    """Get analysis cache hit/miss/eviction counters (admin only)."""
+    return analysis_cache.stats()
@@ -4,13 +4,16 @@ from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
-from app.api.deps import get_db, get_current_active_user
-from app.core.exceptions import NotFoundException
+from app.api.deps import get_db, get_current_active_user, get_current_superuser
+from app.core.exceptions import NotFoundException, BadRequestException
 from app.services.analysis.player_analysis import PlayerAnalysisService
 from app.services.analysis.team_analysis import TeamAnalysisService
+from app.services.analysis.cache import analysis_cache
 
 router = APIRouter()
 
+MAX_COMPARE_PLAYERS = 200
+
 
 # Player Analysis Endpoints
 
@@ -25,7 +28,11 @@ def get_player_progress(
 ):
     """Get player progress over time for a specific assessment type."""
     service = PlayerAnalysisService(db)
-    return service.get_player_progress(player_id, assessment_type, start_date, end_date)
+    return analysis_cache.get_or_set(
+        ("player_progress", str(player_id), assessment_type, start_date, end_date),
+        lambda: service.get_player_progress(player_id, assessment_type, start_date, end_date),
+        players=[player_id],
+    )
 
 
 @router.get("/player/{player_id}/summary")
@@ -36,7 +43,11 @@ def get_player_summary(
 ):
     """Get comprehensive player assessment summary."""
     service = PlayerAnalysisService(db)
-    summary = service.get_player_summary(player_id)
+    summary = analysis_cache.get_or_set(
+        ("player_summary", str(player_id)),
+        lambda: service.get_player_summary(player_id),
+        players=[player_id],
+    )
     if not summary:
         raise NotFoundException("Player not found")
     return summary
@@ -51,8 +62,15 @@ def compare_players(
     current_user=Depends(get_current_active_user),
 ):
     """Compare multiple players on an assessment."""
+    if len(player_ids) > MAX_COMPARE_PLAYERS:
+        raise BadRequestException(f"Cannot compare more than {MAX_COMPARE_PLAYERS} players")
+
     service = PlayerAnalysisService(db)
-    return service.compare_players(player_ids, assessment_type, as_of_date)
+    return analysis_cache.get_or_set(
+        ("compare", tuple(str(p) for p in player_ids), assessment_type, as_of_date),
+        lambda: service.compare_players(player_ids, assessment_type, as_of_date),
+        players=player_ids,
+    )
 
 
 # Team Analysis Endpoints
@@ -65,7 +83,11 @@ def get_team_overview(
 ):
     """Get comprehensive team overview."""
     service = TeamAnalysisService(db)
-    overview = service.get_team_overview(team_id)
+    overview = analysis_cache.get_or_set(
+        ("team_overview", team_id),
+        lambda: service.get_team_overview(team_id),
+        teams=[team_id],
+    )
     if not overview:
         raise NotFoundException("Team not found")
     return overview
@@ -82,7 +104,11 @@ def get_team_trends(
 ):
     """Get team performance trends over time."""
     service = TeamAnalysisService(db)
-    trends = service.get_team_trends(team_id, assessment_type, start_date, end_date)
+    trends = analysis_cache.get_or_set(
+        ("team_trends", team_id, assessment_type, start_date, end_date),
+        lambda: service.get_team_trends(team_id, assessment_type, start_date, end_date),
+        teams=[team_id],
+    )
     if not trends:
         raise NotFoundException("Team not found")
     return trends
@@ -97,7 +123,81 @@ def get_team_rankings(
 ):
     """Get player rankings within a team."""
     service = TeamAnalysisService(db)
-    rankings = service.get_player_rankings(team_id, assessment_type)
+    rankings = analysis_cache.get_or_set(
+        ("team_rankings", team_id, assessment_type),
+        lambda: service.get_player_rankings(team_id, assessment_type),
+        teams=[team_id],
+    )
     if not rankings:
         raise NotFoundException("Team not found")
     return rankings
+
+
+@router.get("/team/{team_id}/asymmetry")
+def get_team_asymmetry(
+    team_id: int,
+    include_unflagged: bool = False,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Rank a team's athletes by left/right asymmetry across all assessment types."""
+    service = TeamAnalysisService(db)
+    report = analysis_cache.get_or_set(
+        ("team_asymmetry", team_id, include_unflagged),
+        lambda: service.get_asymmetry_report(team_id=team_id, include_unflagged=include_unflagged),
+        teams=[team_id],
+    )
+    if not report:
+        raise NotFoundException("Team not found")
+    return report
+
+
+# Sport Analysis Endpoints
+
+@router.get("/sport/{sport_id}/dashboard")
+def get_sport_dashboard(
+    sport_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Get sport-wide assessment statistics by position group and class year."""
+    service = TeamAnalysisService(db)
+    dashboard = analysis_cache.get_or_set(
+        ("sport_dashboard", sport_id, start_date, end_date),
+        lambda: service.get_sport_dashboard(sport_id, start_date, end_date),
+        sports=[sport_id],
+    )
+    if not dashboard:
+        raise NotFoundException("Sport not found")
+    return dashboard
+
+
+@router.get("/sport/{sport_id}/asymmetry")
+def get_sport_asymmetry(
+    sport_id: int,
+    include_unflagged: bool = False,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Rank a sport's athletes by left/right asymmetry across all assessment types."""
+    service = TeamAnalysisService(db)
+    report = analysis_cache.get_or_set(
+        ("sport_asymmetry", sport_id, include_unflagged),
+        lambda: service.get_asymmetry_report(sport_id=sport_id, include_unflagged=include_unflagged),
+        sports=[sport_id],
+    )
+    if not report:
+        raise NotFoundException("Sport not found")
+    return report
+
+
+# Cache Endpoints
+
+@router.get("/cache/stats")
+def get_cache_stats(
+    current_user=Depends(get_current_superuser),
+):
+    """Get analysis cache hit/miss/eviction counters (admin only)."""
+    return analysis_cache.stats()
@@ -0,0 +1,126 @@
+from fastapi import APIRouter, Depends, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from uuid import UUID
+from datetime import date
+
+from app.api.deps import get_current_active_user_async
+from app.api.v1.assessments import sessions
+from app.db.async_session import get_async_db
+from app.schemas.assessment.session import (
+    SessionCreate,
+    SessionUpdate,
+    SessionResponse,
+    SessionWithResults,
+)
+
+# Async mode versions of the session routes. Each handler runs the sync
+# implementation on the request's asyncpg connection via run_sync, so the
+# two stay identical without holding a threadpool thread per request.
+router = APIRouter()
+
+
+@router.get("", response_model=List[SessionResponse])
+async def list_sessions(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    player_id: Optional[UUID] = None,
+    assessment_type: Optional[str] = None,
+    is_complete: Optional[bool] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """List all assessment sessions with optional filters, newest first."""
+    return await db.run_sync(
+        lambda sync_db: sessions.list_sessions(
+            response=response,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            player_id=player_id,
+            assessment_type=assessment_type,
+            is_complete=is_complete,
+            start_date=start_date,
+            end_date=end_date,
+            db=sync_db,
+            current_user=current_user,
+        )
+    )
+
+
+@router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
+async def create_session(
+    session_data: SessionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Create a new assessment session."""
+    return await db.run_sync(
+        lambda sync_db: sessions.create_session(
+            session_data=session_data, db=sync_db, current_user=current_user
+        )
+    )
+
+
+@router.get("/{session_id}", response_model=SessionWithResults)
+async def get_session(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Get a specific session with all results."""
+    return await db.run_sync(
+        lambda sync_db: sessions.get_session(
+            session_id=session_id, db=sync_db, current_user=current_user
+        )
+    )
+
+
+@router.put("/{session_id}", response_model=SessionResponse)
+async def update_session(
+    session_id: UUID,
+    session_update: SessionUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Update a session."""
+    return await db.run_sync(
+        lambda sync_db: sessions.update_session(
+            session_id=session_id,
+            session_update=session_update,
+            db=sync_db,
+            current_user=current_user,
+        )
+    )
+
+
+@router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_session(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Delete a session and all its results."""
+    await db.run_sync(
+        lambda sync_db: sessions.delete_session(
+            session_id=session_id, db=sync_db, current_user=current_user
+        )
+    )
+
+
+@router.post("/{session_id}/complete", response_model=SessionResponse)
+async def mark_session_complete(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_active_user_async),
+):
+    """Mark a session as complete."""
+    return await db.run_sync(
+        lambda sync_db: sessions.mark_session_complete(
+            session_id=session_id, db=sync_db, current_user=current_user
+        )
+    )
@@ -0,0 +1,59 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import get_current_active_user
+from app.schemas.assessment.session import AssessmentType
+from app.services.assessment.result_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    build_export_query,
+    stream_export,
+)
+
+router = APIRouter()
+
+
+@router.get("")
+def export_results(
+    assessment_type: AssessmentType,
+    file_format: ExportFormat = Query("csv", alias="format"),
+    gzip: bool = False,
+    team_id: Optional[int] = None,
+    sport_id: Optional[int] = None,
+    player_id: Optional[UUID] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    is_complete: Optional[bool] = None,
+    current_user=Depends(get_current_active_user),
+):
+    """Export one assessment type's results with their session and player as CSV or NDJSON.
+
+    The file is streamed as it is read from the database, so exports of
+    any size start immediately and use constant memory. With gzip the body
+    is a gzip-compressed file.
+    """
+    stmt = build_export_query(
+        assessment_type,
+        team_id=team_id,
+        sport_id=sport_id,
+        player_id=player_id,
+        start_date=start_date,
+        end_date=end_date,
+        is_complete=is_complete,
+    )
+
+    filename = f"{assessment_type}_results.{file_format}"
+    media_type = EXPORT_MEDIA_TYPES[file_format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream_export(stmt, file_format, compress=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,198 @@
+from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional
+from datetime import date
+
+from app.api.deps import get_db, get_current_active_user
+from app.api.v1.assessments import onbaseu, pitcher_onbaseu, tpi_power, sprint, kams
+from app.api.v1.assessments.sessions import (
+    RESULT_RELATIONSHIPS,
+    _session_query,
+    _build_session_with_results,
+)
+from app.core.exceptions import NotFoundException, BadRequestException
+from app.models import AssessmentSession, Player, Team
+from app.schemas.assessment.group import (
+    GroupAssessmentCreate,
+    GroupAssessmentResponse,
+    GroupPlayerOutcome,
+)
+from app.schemas.assessment.session import AssessmentType, SessionWithResults
+from app.schemas.assessment.onbaseu import OnBaseUResultCreate
+from app.schemas.assessment.pitcher_onbaseu import PitcherOnBaseUResultCreate
+from app.schemas.assessment.tpi_power import TPIPowerResultCreate
+from app.schemas.assessment.sprint import SprintResultCreate
+from app.schemas.assessment.kams import KAMSResultCreate
+from app.services.analysis.cache import analysis_cache
+from app.services.analysis.player_analysis import PlayerAnalysisService, RESULT_MODELS
+from app.services.assessment.bulk_ingest import SESSION_KEY, upsert_rows
+
+router = APIRouter()
+
+# Per assessment type: results router (for scoring and the result key) and
+# the schema each submitted result is validated against
+GROUP_ASSESSMENT_TYPES = {
+    "onbaseu": (onbaseu, TypeAdapter(List[OnBaseUResultCreate])),
+    "pitcher_onbaseu": (pitcher_onbaseu, TypeAdapter(List[PitcherOnBaseUResultCreate])),
+    "tpi_power": (tpi_power, TypeAdapter(List[TPIPowerResultCreate])),
+    "sprint": (sprint, TypeAdapter(List[SprintResultCreate])),
+    "kams": (kams, TypeAdapter(List[KAMSResultCreate])),
+}
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"results.{location}: {first['msg']}"
+
+
+@router.post("", response_model=GroupAssessmentResponse)
+def submit_group_assessment(
+    group_data: GroupAssessmentCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Create or resume a team's sessions for one day and record their results.
+
+    Every listed player's session is created (or resumed if it already
+    exists), their results are scored and upserted, and the sessions are
+    optionally completed, all in one transaction. Players that are not on
+    the team or whose results do not validate are reported as errors and
+    left out; everyone else is saved.
+    """
+    team = db.query(Team).filter(Team.id == group_data.team_id).first()
+    if not team:
+        raise NotFoundException("Team not found")
+
+    player_ids = [entry.player_id for entry in group_data.players]
+    if len(set(player_ids)) != len(player_ids):
+        raise BadRequestException("Each player can only be listed once")
+
+    results_router, results_adapter = GROUP_ASSESSMENT_TYPES[group_data.assessment_type]
+    roster = {
+        row.id: row
+        for row in db.query(Player.id, Player.first_name, Player.last_name, Player.sport_id)
+        .filter(Player.id.in_(player_ids), Player.team_id == group_data.team_id)
+    }
+
+    outcomes = {}
+    accepted = []
+    for entry in group_data.players:
+        player = roster.get(entry.player_id)
+        if player is None:
+            outcomes[entry.player_id] = GroupPlayerOutcome(
+                player_id=entry.player_id, status="error", error="Player is not on this team"
+            )
+            continue
+        try:
+            results = results_adapter.validate_python(entry.results)
+        except ValidationError as e:
+            outcomes[entry.player_id] = GroupPlayerOutcome(
+                player_id=entry.player_id,
+                player_name=f"{player.first_name} {player.last_name}",
+                status="error",
+                error=_validation_message(e),
+            )
+            continue
+        accepted.append((entry, results))
+
+    if accepted:
+        # Existing sessions are resumed as they are, never overwritten
+        stored_sessions = upsert_rows(
+            db,
+            AssessmentSession,
+            [
+                dict(
+                    player_id=entry.player_id,
+                    assessment_type=group_data.assessment_type,
+                    assessment_date=group_data.assessment_date,
+                    notes=entry.notes,
+                    assessed_by=current_user.id,
+                )
+                for entry, _ in accepted
+            ],
+            SESSION_KEY,
+        )
+
+        result_rows = []
+        for (entry, results), (session, _) in zip(accepted, stored_sessions):
+            result_rows += results_router.score_bulk_results(session.id, results)
+        stored_results = upsert_rows(
+            db,
+            RESULT_MODELS[group_data.assessment_type],
+            result_rows,
+            results_router.RESULT_KEY,
+            group_data.on_conflict,
+        )
+        counts = {}
+        for result, inserted in stored_results:
+            session_counts = counts.setdefault(result.session_id, [0, 0])
+            session_counts[0 if inserted else 1] += 1
+
+        sessions = [session for session, _ in stored_sessions]
+        if group_data.complete:
+            for session in sessions:
+                session.is_complete = True
+        PlayerAnalysisService(db).refresh_many_session_scores(sessions)
+
+        # Build outcomes now, before the commit expires the sessions
+        for (entry, _), (session, created) in zip(accepted, stored_sessions):
+            player = roster[entry.player_id]
+            inserted, existing = counts.get(session.id, (0, 0))
+            outcomes[entry.player_id] = GroupPlayerOutcome(
+                player_id=entry.player_id,
+                player_name=f"{player.first_name} {player.last_name}",
+                status="created" if created else "resumed",
+                session_id=session.id,
+                results_inserted=inserted,
+                results_existing=existing,
+                is_complete=session.is_complete,
+                overall_score=session.overall_score,
+                color=session.color,
+            )
+
+        db.commit()
+        analysis_cache.invalidate(
+            players=[entry.player_id for entry, _ in accepted],
+            teams=[group_data.team_id],
+            sports={roster[entry.player_id].sport_id for entry, _ in accepted},
+        )
+
+    return GroupAssessmentResponse(
+        team_id=group_data.team_id,
+        assessment_type=group_data.assessment_type,
+        assessment_date=group_data.assessment_date,
+        players=[outcomes[player_id] for player_id in player_ids],
+    )
+
+
+@router.get("", response_model=List[SessionWithResults])
+def get_group_sessions(
+    team_id: int,
+    assessment_date: date,
+    assessment_type: Optional[AssessmentType] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Get a team's sessions for one day with their results, to resume a group assessment."""
+    team = db.query(Team).filter(Team.id == team_id).first()
+    if not team:
+        raise NotFoundException("Team not found")
+
+    types = [assessment_type] if assessment_type else list(RESULT_RELATIONSHIPS)
+    query = (
+        _session_query(db)
+        .filter(
+            AssessmentSession.player_id.in_(select(Player.id).where(Player.team_id == team_id)),
+            AssessmentSession.assessment_date == assessment_date,
+        )
+        .options(*(
+            selectinload(getattr(AssessmentSession, RESULT_RELATIONSHIPS[t][0])) for t in types
+        ))
+    )
+    if assessment_type:
+        query = query.filter(AssessmentSession.assessment_type == assessment_type)
+
+    sessions = [_build_session_with_results(session) for session in query.all()]
+    return sorted(sessions, key=lambda s: (s.player_name or "", s.assessment_type))
@@ -0,0 +1,100 @@
+import io
+from typing import Optional
+
+from fastapi import APIRouter, Depends, UploadFile, File, Query
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, get_current_active_user
+from app.api.v1.assessments import onbaseu, pitcher_onbaseu, tpi_power, sprint, kams
+from app.core.exceptions import BadRequestException
+from app.models import OnBaseUResult, PitcherOnBaseUResult, TPIPowerResult, SprintResult, KAMSResult
+from app.schemas.assessment.imports import ResultImportSummary
+from app.schemas.assessment.session import AssessmentType
+from app.schemas.assessment.onbaseu import OnBaseUResultCreate
+from app.schemas.assessment.pitcher_onbaseu import PitcherOnBaseUResultCreate
+from app.schemas.assessment.tpi_power import TPIPowerResultCreate
+from app.schemas.assessment.sprint import SprintResultCreate
+from app.schemas.assessment.kams import KAMSResultCreate
+from app.services.analysis.cache import analysis_cache, bump_shared_generation
+from app.services.assessment.bulk_import import ImportFormat, ResultImportService
+from app.services.assessment.bulk_ingest import BulkConflictMode
+
+router = APIRouter()
+
+# Per assessment type: results router (for scoring and the result key),
+# the schema each row is validated against and the results model
+IMPORT_TYPES = {
+    "onbaseu": (onbaseu, OnBaseUResultCreate, OnBaseUResult),
+    "pitcher_onbaseu": (pitcher_onbaseu, PitcherOnBaseUResultCreate, PitcherOnBaseUResult),
+    "tpi_power": (tpi_power, TPIPowerResultCreate, TPIPowerResult),
+    "sprint": (sprint, SprintResultCreate, SprintResult),
+    "kams": (kams, KAMSResultCreate, KAMSResult),
+}
+
+FORMAT_EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+@router.post("", response_model=ResultImportSummary)
+def import_results(
+    assessment_type: AssessmentType,
+    file: UploadFile = File(...),
+    file_format: Optional[ImportFormat] = Query(None, alias="format"),
+    dry_run: bool = False,
+    on_conflict: BulkConflictMode = "skip",
+    complete: bool = True,
+    batch_size: int = Query(5000, ge=100, le=50000),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Import historical results of one assessment type from a CSV or NDJSON file.
+
+    Each row is one result with the ``player_code`` and ``assessment_date``
+    of its session; sessions are created or resumed as needed. The format
+    comes from the file extension unless given. Rows that fail validation
+    are listed in the summary and skipped. With dry_run the whole import is
+    carried out and reported, then rolled back.
+    """
+    if file_format is None:
+        extension = "." + (file.filename or "").rsplit(".", 1)[-1].lower()
+        file_format = FORMAT_EXTENSIONS.get(extension)
+        if file_format is None:
+            raise BadRequestException("Pass format=csv or format=ndjson for this file")
+
+    results_router, schema, model = IMPORT_TYPES[assessment_type]
+    service = ResultImportService(
+        db,
+        assessment_type,
+        schema,
+        model,
+        results_router.RESULT_KEY,
+        results_router.score_bulk_results,
+        assessed_by=current_user.id,
+        on_conflict=on_conflict,
+        complete=complete,
+        dry_run=dry_run,
+        batch_size=batch_size,
+    )
+
+    # The upload is spooled to disk by the framework; read it line by line
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        summary = service.run(stream, file_format)
+    except ValueError as e:
+        db.rollback()
+        raise BadRequestException(f"Could not read file: {e}")
+    except DBAPIError as e:
+        db.rollback()
+        raise BadRequestException(f"Import failed: {e.orig}")
+    finally:
+        stream.detach()
+
+    if dry_run:
+        db.rollback()
+    else:
+        # Imports span many players; start every process's analysis cache afresh
+        bump_shared_generation(db)
+        db.commit()
+        analysis_cache.clear()
+
+    return summary
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date
 from uuid import UUID
 
 from app.api.deps import get_db, get_current_active_user
+from app.api.pagination import paginate, set_next_cursor
 from app.core.exceptions import NotFoundException, BadRequestException
 from app.models import AssessmentSession, KAMSResult
 from app.schemas.assessment.kams import (
@@ -12,13 +14,22 @@ from app.schemas.assessment.kams import (
     KAMSResultResponse,
     KAMSBulkCreate,
     KAMSTestDefinition,
+    KAMSMeasurementQuery,
+    KAMSMeasurementMatch,
     KAMS_TESTS,
 )
 from app.services.assessment.kams_service import KAMSScoringService
+from app.services.assessment.kams_query import build_measurement_query, filter_key
+from app.services.assessment.bulk_ingest import BulkConflictMode, set_ingest_headers, upsert_results
+from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.services.analysis.cache import invalidate_session_analysis
 
 router = APIRouter()
 scoring_service = KAMSScoringService()
 
+# Unique key of a result, matched by bulk upserts
+RESULT_KEY = ["session_id", "test_type"]
+
 
 @router.get("/tests", response_model=List[KAMSTestDefinition])
 def get_test_definitions(
@@ -28,6 +39,49 @@ def get_test_definitions(
     return KAMS_TESTS
 
 
+@router.post("/query", response_model=List[KAMSMeasurementMatch])
+def query_measurements(
+    query: KAMSMeasurementQuery,
+    response: Response,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = Query(100, le=1000),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Find KAMS sessions by measurement thresholds and left/right asymmetry.
+
+    Filters are evaluated in SQL against indexed measurement expressions.
+    Sessions are returned newest first with the value each filter compared;
+    pass the X-Next-Cursor header back as ``cursor`` for the next page.
+    """
+    rows = paginate(
+        build_measurement_query(db, query),
+        [AssessmentSession.assessment_date, AssessmentSession.id],
+        [date, UUID],
+        cursor,
+        skip,
+        limit,
+        descending=True,
+    ).all()
+    set_next_cursor(response, rows, limit, lambda row: (row.assessment_date, row.session_id))
+
+    keys = [filter_key(f) for f in query.filters]
+    return [
+        KAMSMeasurementMatch(
+            session_id=row.session_id,
+            assessment_date=row.assessment_date,
+            player_id=row.player_id,
+            player_code=row.player_code,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            team_id=row.team_id,
+            values={key: row._mapping[key] for key in keys},
+        )
+        for row in rows
+    ]
+
+
 @router.get("/{session_id}/results", response_model=List[KAMSResultResponse])
 def get_session_results(
     session_id: UUID,
@@ -85,20 +139,46 @@ def create_result(
     )
 
     db.add(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
 
 
+def score_bulk_results(session_id: UUID, results: List[KAMSResultCreate]) -> List[dict]:
+    """Score a batch of submitted results into rows for upsert_results."""
+    rows = []
+    for result_data in results:
+        overall_score, symmetry_score = scoring_service.score_result(
+            result_data.test_type,
+            result_data.measurements,
+        )
+        rows.append(dict(
+            session_id=session_id,
+            **result_data.model_dump(),
+            overall_score=overall_score,
+            symmetry_score=symmetry_score,
+        ))
+
+    return rows
+
+
 @router.post("/{session_id}/results/bulk", response_model=List[KAMSResultResponse], status_code=status.HTTP_201_CREATED)
 def create_bulk_results(
     session_id: UUID,
+    response: Response,
     bulk_data: KAMSBulkCreate,
+    on_conflict: BulkConflictMode = "skip",
     db: Session = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    """Create multiple results for a session at once."""
+    """Create multiple results for a session at once.
+
+    Results that already exist are kept (on_conflict=skip) or replaced
+    (on_conflict=overwrite); either way all submitted results are returned.
+    """
     session = db.query(AssessmentSession).filter(
         AssessmentSession.id == session_id,
         AssessmentSession.assessment_type == "kams",
@@ -107,35 +187,14 @@ def create_bulk_results(
     if not session:
         raise NotFoundException("Session not found or is not a KAMS session")
 
-    results = []
-    for result_data in bulk_data.results:
-        existing = db.query(KAMSResult).filter(
-            KAMSResult.session_id == session_id,
-            KAMSResult.test_type == result_data.test_type,
-        ).first()
-
-        if existing:
-            continue
-
-        overall_score, symmetry_score = scoring_service.score_result(
-            result_data.test_type,
-            result_data.measurements,
-        )
-
-        result = KAMSResult(
-            session_id=session_id,
-            **result_data.model_dump(),
-            overall_score=overall_score,
-            symmetry_score=symmetry_score,
-        )
-
-        db.add(result)
-        results.append(result)
-
+    rows = score_bulk_results(session_id, bulk_data.results)
+    results, existing = upsert_results(db, KAMSResult, rows, RESULT_KEY, on_conflict)
+    # Serialise now, before the commit expires the returned rows
+    results = [KAMSResultResponse.model_validate(result) for result in results]
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
-
-    for result in results:
-        db.refresh(result)
+    invalidate_session_analysis(db, session_id)
+    set_ingest_headers(response, results, existing)
 
     return results
 
@@ -170,7 +229,9 @@ def update_result(
     for field, value in update_data.items():
         setattr(result, field, value)
 
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
@@ -193,7 +254,9 @@ def delete_result(
         raise NotFoundException("Result not found")
 
     db.delete(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
 
 
 @router.post("/upload", status_code=status.HTTP_202_ACCEPTED)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -15,10 +15,16 @@ from app.schemas.assessment.pitcher_onbaseu import (
     PITCHER_ONBASEU_TESTS,
 )
 from app.services.assessment.pitcher_onbaseu_service import PitcherOnBaseUScoringService
+from app.services.assessment.bulk_ingest import BulkConflictMode, set_ingest_headers, upsert_results
+from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.services.analysis.cache import invalidate_session_analysis
 
 router = APIRouter()
 scoring_service = PitcherOnBaseUScoringService()
 
+# Unique key of a result, matched by bulk upserts
+RESULT_KEY = ["session_id", "test_code", "side"]
+
 
 @router.get("/tests", response_model=List[PitcherOnBaseUTestDefinition])
 def get_test_definitions(
@@ -83,20 +89,43 @@ def create_result(
     )
 
     db.add(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
 
 
+def score_bulk_results(session_id: UUID, results: List[PitcherOnBaseUResultCreate]) -> List[dict]:
+    """Score a batch of submitted results into rows for upsert_results."""
+    rows = []
+    for result_data in results:
+        score, color = scoring_service.score_result(result_data.result)
+        rows.append(dict(
+            session_id=session_id,
+            **result_data.model_dump(),
+            score=score,
+            color=color,
+        ))
+
+    return rows
+
+
 @router.post("/{session_id}/results/bulk", response_model=List[PitcherOnBaseUResultResponse], status_code=status.HTTP_201_CREATED)
 def create_bulk_results(
     session_id: UUID,
+    response: Response,
     bulk_data: PitcherOnBaseUBulkCreate,
+    on_conflict: BulkConflictMode = "skip",
     db: Session = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    """Create multiple results for a session at once."""
+    """Create multiple results for a session at once.
+
+    Results that already exist are kept (on_conflict=skip) or replaced
+    (on_conflict=overwrite); either way all submitted results are returned.
+    """
     session = db.query(AssessmentSession).filter(
         AssessmentSession.id == session_id,
         AssessmentSession.assessment_type == "pitcher_onbaseu",
@@ -105,33 +134,14 @@ def create_bulk_results(
     if not session:
         raise NotFoundException("Session not found or is not a Pitcher OnBaseU session")
 
-    results = []
-    for result_data in bulk_data.results:
-        existing = db.query(PitcherOnBaseUResult).filter(
-            PitcherOnBaseUResult.session_id == session_id,
-            PitcherOnBaseUResult.test_code == result_data.test_code,
-            PitcherOnBaseUResult.side == result_data.side,
-        ).first()
-
-        if existing:
-            continue
-
-        score, color = scoring_service.score_result(result_data.result)
-
-        result = PitcherOnBaseUResult(
-            session_id=session_id,
-            **result_data.model_dump(),
-            score=score,
-            color=color,
-        )
-
-        db.add(result)
-        results.append(result)
-
+    rows = score_bulk_results(session_id, bulk_data.results)
+    results, existing = upsert_results(db, PitcherOnBaseUResult, rows, RESULT_KEY, on_conflict)
+    # Serialise now, before the commit expires the returned rows
+    results = [PitcherOnBaseUResultResponse.model_validate(result) for result in results]
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
-
-    for result in results:
-        db.refresh(result)
+    invalidate_session_analysis(db, session_id)
+    set_ingest_headers(response, results, existing)
 
     return results
 
@@ -163,7 +173,9 @@ def update_result(
     for field, value in update_data.items():
         setattr(result, field, value)
 
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
@@ -186,4 +198,6 @@ def delete_result(
         raise NotFoundException("Result not found")
 
     db.delete(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
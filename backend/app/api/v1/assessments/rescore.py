@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.api.deps import get_db, get_current_superuser
+from app.config import get_settings
+from app.core.exceptions import NotFoundException, BadRequestException
+from app.schemas.assessment.rescore import RescoreRequest, RescoreCheckpointResponse
+from app.services.assessment.rescoring_service import RescoringService
+from app.services.jobs import enqueue_job, find_active_job
+
+settings = get_settings()
+
+router = APIRouter()
+
+
+@router.post("", response_model=List[RescoreCheckpointResponse], status_code=status.HTTP_202_ACCEPTED)
+def start_rescore(
+    rescore_request: RescoreRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Rescore stored results against the current thresholds (admin only).
+
+    The work runs as a "rescore" background job; the Location header points
+    at it under /jobs. Re-posting an unfinished job_name resumes it from its
+    last checkpoint, also when the run was interrupted; while a job for the
+    name is queued or running, posting it again is rejected.
+    """
+    if rescore_request.batch_size < 1:
+        raise BadRequestException("batch_size must be positive")
+
+    active = find_active_job(db, "rescore", {"job_name": rescore_request.job_name})
+    if active is not None:
+        raise BadRequestException(
+            f"Rescoring job {rescore_request.job_name} is already {active.status} "
+            f"({settings.API_V1_PREFIX}/jobs/{active.id})"
+        )
+
+    service = RescoringService(db, batch_size=rescore_request.batch_size)
+    checkpoints = service.prepare(
+        rescore_request.job_name, rescore_request.result_types, restart=rescore_request.restart
+    )
+    job = enqueue_job(
+        db,
+        "rescore",
+        {
+            "job_name": rescore_request.job_name,
+            "result_types": rescore_request.result_types,
+            "batch_size": rescore_request.batch_size,
+        },
+        created_by=current_user.id,
+    )
+    db.commit()
+    response.headers["Location"] = f"{settings.API_V1_PREFIX}/jobs/{job.id}"
+    return checkpoints
+
+
+@router.get("/{job_name}", response_model=List[RescoreCheckpointResponse])
+def get_rescore_status(
+    job_name: str,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Get progress of a rescoring job (admin only)."""
+    checkpoints = RescoringService(db).get_status(job_name)
+    if not checkpoints:
+        raise NotFoundException("Rescoring job not found")
+    return checkpoints
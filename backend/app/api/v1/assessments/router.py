@@ -1,11 +1,20 @@
 from fastapi import APIRouter
-from app.api.v1.assessments import sessions, onbaseu, pitcher_onbaseu, tpi_power, sprint, kams
+from app.config import get_settings
+from app.api.v1.assessments import sessions, async_sessions, onbaseu, pitcher_onbaseu, tpi_power, sprint, kams, rescore, group, imports, exports
+
+settings = get_settings()
 
 router = APIRouter()
 
-router.include_router(sessions.router, prefix="/sessions", tags=["Assessment Sessions"])
+sessions_router = async_sessions.router if settings.ASYNC_DB_ENABLED else sessions.router
+
+router.include_router(sessions_router, prefix="/sessions", tags=["Assessment Sessions"])
 router.include_router(onbaseu.router, prefix="/onbaseu", tags=["OnBaseU"])
 router.include_router(pitcher_onbaseu.router, prefix="/pitcher-onbaseu", tags=["Pitcher OnBaseU"])
 router.include_router(tpi_power.router, prefix="/tpi-power", tags=["TPI Power"])
 router.include_router(sprint.router, prefix="/sprint", tags=["Sprint"])
 router.include_router(kams.router, prefix="/kams", tags=["KAMS"])
+router.include_router(rescore.router, prefix="/rescore", tags=["Rescoring"])
+router.include_router(group.router, prefix="/group", tags=["Group Assessments"])
+router.include_router(imports.router, prefix="/import", tags=["Result Import"])
+router.include_router(exports.router, prefix="/export", tags=["Result Export"])
@@ -1,26 +1,69 @@
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, status, Query, Response
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
 from app.api.deps import get_db, get_current_active_user
+from app.api.pagination import paginate, set_next_cursor
 from app.core.exceptions import NotFoundException, BadRequestException
-from app.models import AssessmentSession, Player
+from app.models import AssessmentSession, Player, User
 from app.schemas.assessment.session import (
     SessionCreate,
     SessionUpdate,
     SessionResponse,
     SessionWithResults,
 )
+from app.schemas.assessment.onbaseu import OnBaseUResultResponse
+from app.schemas.assessment.pitcher_onbaseu import PitcherOnBaseUResultResponse
+from app.schemas.assessment.tpi_power import TPIPowerResultResponse
+from app.schemas.assessment.sprint import SprintResultResponse
+from app.schemas.assessment.kams import KAMSResultResponse
+from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.services.analysis.analytics_cube import AnalyticsCubeService
+from app.services.analysis.cache import invalidate_player_analysis, invalidate_session_analysis
 
 router = APIRouter()
 
+# Session relationship and response schema holding each assessment type's results
+RESULT_RELATIONSHIPS = {
+    "onbaseu": ("onbaseu_results", OnBaseUResultResponse),
+    "pitcher_onbaseu": ("pitcher_onbaseu_results", PitcherOnBaseUResultResponse),
+    "tpi_power": ("tpi_power_results", TPIPowerResultResponse),
+    "sprint": ("sprint_results", SprintResultResponse),
+    "kams": ("kams_results", KAMSResultResponse),
+}
+
+
+def _session_query(db: Session):
+    """Sessions with player and assessor names joined into the same query."""
+    return db.query(AssessmentSession).options(
+        joinedload(AssessmentSession.player).load_only(Player.first_name, Player.last_name),
+        joinedload(AssessmentSession.assessed_by_user).load_only(
+            User.first_name, User.last_name, User.email
+        ),
+    )
+
+
+def _get_session(db: Session, session_id: UUID) -> AssessmentSession:
+    """Get a session with player and assessor loaded, or raise 404."""
+    session = (
+        _session_query(db)
+        .filter(AssessmentSession.id == session_id)
+        .populate_existing()
+        .first()
+    )
+    if not session:
+        raise NotFoundException("Session not found")
+    return session
+
 
 @router.get("", response_model=List[SessionResponse])
 def list_sessions(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     player_id: Optional[UUID] = None,
     assessment_type: Optional[str] = None,
     is_complete: Optional[bool] = None,
@@ -29,8 +72,8 @@ def list_sessions(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    """List all assessment sessions with optional filters."""
-    query = db.query(AssessmentSession)
+    """List all assessment sessions with optional filters, newest first."""
+    query = _session_query(db)
 
     if player_id:
         query = query.filter(AssessmentSession.player_id == player_id)
@@ -47,14 +90,18 @@ def list_sessions(
     if end_date:
         query = query.filter(AssessmentSession.assessment_date <= end_date)
 
-    sessions = query.order_by(AssessmentSession.assessment_date.desc()).offset(skip).limit(limit).all()
+    sessions = paginate(
+        query,
+        [AssessmentSession.assessment_date, AssessmentSession.id],
+        [date, UUID],
+        cursor,
+        skip,
+        limit,
+        descending=True,
+    ).all()
+    set_next_cursor(response, sessions, limit, lambda session: (session.assessment_date, session.id))
 
-    result = []
-    for session in sessions:
-        session_data = _build_session_response(session, db)
-        result.append(session_data)
-
-    return result
+    return [_build_session_response(session) for session in sessions]
 
 
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
@@ -78,7 +125,7 @@ def create_session(
 
     if existing:
         # Return existing session instead of error - allows resuming incomplete assessments
-        return _build_session_response(existing, db)
+        return _build_session_response(_get_session(db, existing.id))
 
     session = AssessmentSession(
         **session_data.model_dump(),
@@ -87,9 +134,9 @@ def create_session(
 
     db.add(session)
     db.commit()
-    db.refresh(session)
+    invalidate_player_analysis(db, session.player_id)
 
-    return _build_session_response(session, db)
+    return _build_session_response(_get_session(db, session.id))
 
 
 @router.get("/{session_id}", response_model=SessionWithResults)
@@ -99,11 +146,7 @@ def get_session(
     current_user=Depends(get_current_active_user),
 ):
     """Get a specific session with all results."""
-    session = db.query(AssessmentSession).filter(AssessmentSession.id == session_id).first()
-    if not session:
-        raise NotFoundException("Session not found")
-
-    return _build_session_with_results(session, db)
+    return _build_session_with_results(_get_session(db, session_id))
 
 
 @router.put("/{session_id}", response_model=SessionResponse)
@@ -118,14 +161,27 @@ def update_session(
     if not session:
         raise NotFoundException("Session not found")
 
+    previous_date = session.assessment_date
+
     update_data = session_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(session, field, value)
 
+    if update_data.get("is_complete"):
+        PlayerAnalysisService(db).refresh_session_scores(session.id)
+
+    # Keep the analytics cube in sync when the session moves or changes state
+    if "assessment_date" in update_data or "is_complete" in update_data:
+        db.flush()
+        AnalyticsCubeService(db).refresh_slices([
+            (previous_date, session.assessment_type),
+            (session.assessment_date, session.assessment_type),
+        ])
+
     db.commit()
-    db.refresh(session)
+    invalidate_session_analysis(db, session_id)
 
-    return _build_session_response(session, db)
+    return _build_session_response(_get_session(db, session_id))
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -139,8 +195,15 @@ def delete_session(
     if not session:
         raise NotFoundException("Session not found")
 
+    player_id = session.player_id
     db.delete(session)
+
+    if session.is_complete:
+        db.flush()
+        AnalyticsCubeService(db).refresh_slice(session.assessment_date, session.assessment_type)
+
     db.commit()
+    invalidate_player_analysis(db, player_id)
 
 
 @router.post("/{session_id}/complete", response_model=SessionResponse)
@@ -155,20 +218,19 @@ def mark_session_complete(
         raise NotFoundException("Session not found")
 
     session.is_complete = True
+    PlayerAnalysisService(db).refresh_session_scores(session.id)
     db.commit()
-    db.refresh(session)
+    invalidate_session_analysis(db, session_id)
 
-    return _build_session_response(session, db)
+    return _build_session_response(_get_session(db, session_id))
 
 
-def _build_session_response(session: AssessmentSession, db: Session) -> SessionResponse:
-    """Build a SessionResponse from a session model."""
-    player = db.query(Player).filter(Player.id == session.player_id).first()
-
+def _build_session_response(session: AssessmentSession) -> SessionResponse:
+    """Build a SessionResponse from a session loaded by _session_query."""
     return SessionResponse(
         id=session.id,
         player_id=session.player_id,
-        player_name=player.full_name if player else None,
+        player_name=session.player.full_name if session.player else None,
         assessment_type=session.assessment_type,
         assessment_date=session.assessment_date,
         assessed_by=session.assessed_by,
@@ -177,29 +239,22 @@ def _build_session_response(session: AssessmentSession, db: Session) -> SessionR
         ),
         notes=session.notes,
         is_complete=session.is_complete,
+        overall_score=session.overall_score,
+        color=session.color,
         created_at=session.created_at,
         updated_at=session.updated_at,
     )
 
 
-def _build_session_with_results(session: AssessmentSession, db: Session) -> SessionWithResults:
-    """Build a SessionWithResults from a session model."""
-    base_response = _build_session_response(session, db)
-
-    # Get results based on assessment type
+def _build_session_with_results(session: AssessmentSession) -> SessionWithResults:
+    """Build a SessionWithResults with the typed results of the session's assessment."""
     results = []
-    if session.assessment_type == "onbaseu":
-        results = [r.__dict__ for r in session.onbaseu_results]
-    elif session.assessment_type == "pitcher_onbaseu":
-        results = [r.__dict__ for r in session.pitcher_onbaseu_results]
-    elif session.assessment_type == "tpi_power":
-        results = [r.__dict__ for r in session.tpi_power_results]
-    elif session.assessment_type == "sprint":
-        results = [r.__dict__ for r in session.sprint_results]
-    elif session.assessment_type == "kams":
-        results = [r.__dict__ for r in session.kams_results]
+    if session.assessment_type in RESULT_RELATIONSHIPS:
+        relationship, schema = RESULT_RELATIONSHIPS[session.assessment_type]
+        # Only this type's relationship is loaded: one query for the results
+        results = [schema.model_validate(r) for r in getattr(session, relationship)]
 
     return SessionWithResults(
-        **base_response.model_dump(),
+        **_build_session_response(session).model_dump(),
         results=results,
     )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -15,10 +15,16 @@ from app.schemas.assessment.sprint import (
     SPRINT_TESTS,
 )
 from app.services.assessment.sprint_service import SprintScoringService
+from app.services.assessment.bulk_ingest import BulkConflictMode, set_ingest_headers, upsert_results
+from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.services.analysis.cache import invalidate_session_analysis
 
 router = APIRouter()
 scoring_service = SprintScoringService()
 
+# Unique key of a result, matched by bulk upserts
+RESULT_KEY = ["session_id", "test_code"]
+
 
 @router.get("/tests", response_model=List[SprintTestDefinition])
 def get_test_definitions(
@@ -89,20 +95,50 @@ def create_result(
     )
 
     db.add(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
 
 
+def score_bulk_results(session_id: UUID, results: List[SprintResultCreate]) -> List[dict]:
+    """Score a batch of submitted results into rows for upsert_results."""
+    rows = []
+    for result_data in results:
+        times = [t for t in [result_data.run_1_time, result_data.run_2_time, result_data.run_3_time] if t is not None]
+        best_time = min(times) if times else None
+
+        percentage, color = None, None
+        if best_time:
+            percentage, color = scoring_service.score_result(result_data.test_name, best_time)
+
+        rows.append(dict(
+            session_id=session_id,
+            **result_data.model_dump(),
+            best_time=best_time,
+            score_percentage=percentage,
+            color=color,
+        ))
+
+    return rows
+
+
 @router.post("/{session_id}/results/bulk", response_model=List[SprintResultResponse], status_code=status.HTTP_201_CREATED)
 def create_bulk_results(
     session_id: UUID,
+    response: Response,
     bulk_data: SprintBulkCreate,
+    on_conflict: BulkConflictMode = "skip",
     db: Session = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    """Create multiple results for a session at once."""
+    """Create multiple results for a session at once.
+
+    Results that already exist are kept (on_conflict=skip) or replaced
+    (on_conflict=overwrite); either way all submitted results are returned.
+    """
     session = db.query(AssessmentSession).filter(
         AssessmentSession.id == session_id,
         AssessmentSession.assessment_type == "sprint",
@@ -111,38 +147,14 @@ def create_bulk_results(
     if not session:
         raise NotFoundException("Session not found or is not a Sprint session")
 
-    results = []
-    for result_data in bulk_data.results:
-        existing = db.query(SprintResult).filter(
-            SprintResult.session_id == session_id,
-            SprintResult.test_code == result_data.test_code,
-        ).first()
-
-        if existing:
-            continue
-
-        times = [t for t in [result_data.run_1_time, result_data.run_2_time, result_data.run_3_time] if t is not None]
-        best_time = min(times) if times else None
-
-        percentage, color = None, None
-        if best_time:
-            percentage, color = scoring_service.score_result(result_data.test_name, best_time)
-
-        result = SprintResult(
-            session_id=session_id,
-            **result_data.model_dump(),
-            best_time=best_time,
-            score_percentage=percentage,
-            color=color,
-        )
-
-        db.add(result)
-        results.append(result)
-
+    rows = score_bulk_results(session_id, bulk_data.results)
+    results, existing = upsert_results(db, SprintResult, rows, RESULT_KEY, on_conflict)
+    # Serialise now, before the commit expires the returned rows
+    results = [SprintResultResponse.model_validate(result) for result in results]
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
-
-    for result in results:
-        db.refresh(result)
+    invalidate_session_analysis(db, session_id)
+    set_ingest_headers(response, results, existing)
 
     return results
 
@@ -179,7 +191,9 @@ def update_result(
         result.score_percentage = percentage
         result.color = color
 
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
@@ -202,4 +216,6 @@ def delete_result(
         raise NotFoundException("Result not found")
 
     db.delete(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
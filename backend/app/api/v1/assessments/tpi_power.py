@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -15,10 +15,16 @@ from app.schemas.assessment.tpi_power import (
     TPI_POWER_TESTS,
 )
 from app.services.assessment.tpi_power_service import TPIPowerScoringService
+from app.services.assessment.bulk_ingest import BulkConflictMode, set_ingest_headers, upsert_results
+from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.services.analysis.cache import invalidate_session_analysis
 
 router = APIRouter()
 scoring_service = TPIPowerScoringService()
 
+# Unique key of a result, matched by bulk upserts
+RESULT_KEY = ["session_id", "test_code", "side"]
+
 
 @router.get("/tests", response_model=List[TPIPowerTestDefinition])
 def get_test_definitions(
@@ -97,46 +103,25 @@ def create_result(
     )
 
     db.add(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
 
 
-@router.post("/{session_id}/results/bulk", response_model=List[TPIPowerResultResponse], status_code=status.HTTP_201_CREATED)
-def create_bulk_results(
-    session_id: UUID,
-    bulk_data: TPIPowerBulkCreate,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_active_user),
-):
-    """Create multiple results for a session at once."""
-    session = db.query(AssessmentSession).filter(
-        AssessmentSession.id == session_id,
-        AssessmentSession.assessment_type == "tpi_power",
-    ).first()
-
-    if not session:
-        raise NotFoundException("Session not found or is not a TPI Power session")
-
+def score_bulk_results(session_id: UUID, results: List[TPIPowerResultCreate]) -> List[dict]:
+    """Score a batch of submitted results into rows for upsert_results."""
     # First, find vertical jump in the batch
     vertical_jump = None
-    for result_data in bulk_data.results:
+    for result_data in results:
         if result_data.test_code == "TPI-01":
             vertical_jump = float(result_data.result_value)
             break
 
-    results = []
-    for result_data in bulk_data.results:
-        existing = db.query(TPIPowerResult).filter(
-            TPIPowerResult.session_id == session_id,
-            TPIPowerResult.test_code == result_data.test_code,
-            TPIPowerResult.side == result_data.side,
-        ).first()
-
-        if existing:
-            continue
-
+    rows = []
+    for result_data in results:
         percentage, color = scoring_service.score_result(
             result_data.test_name,
             float(result_data.result_value),
@@ -144,20 +129,46 @@ def create_bulk_results(
             is_off_side=(result_data.side == "left") if result_data.side else False,
         )
 
-        result = TPIPowerResult(
+        rows.append(dict(
             session_id=session_id,
             **result_data.model_dump(),
             score_percentage=percentage,
             color=color,
-        )
+        ))
 
-        db.add(result)
-        results.append(result)
+    return rows
 
-    db.commit()
 
-    for result in results:
-        db.refresh(result)
+@router.post("/{session_id}/results/bulk", response_model=List[TPIPowerResultResponse], status_code=status.HTTP_201_CREATED)
+def create_bulk_results(
+    session_id: UUID,
+    response: Response,
+    bulk_data: TPIPowerBulkCreate,
+    on_conflict: BulkConflictMode = "skip",
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Create multiple results for a session at once.
+
+    Results that already exist are kept (on_conflict=skip) or replaced
+    (on_conflict=overwrite); either way all submitted results are returned.
+    """
+    session = db.query(AssessmentSession).filter(
+        AssessmentSession.id == session_id,
+        AssessmentSession.assessment_type == "tpi_power",
+    ).first()
+
+    if not session:
+        raise NotFoundException("Session not found or is not a TPI Power session")
+
+    rows = score_bulk_results(session_id, bulk_data.results)
+    results, existing = upsert_results(db, TPIPowerResult, rows, RESULT_KEY, on_conflict)
+    # Serialise now, before the commit expires the returned rows
+    results = [TPIPowerResultResponse.model_validate(result) for result in results]
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
+    db.commit()
+    invalidate_session_analysis(db, session_id)
+    set_ingest_headers(response, results, existing)
 
     return results
 
@@ -203,7 +214,9 @@ def update_result(
     for field, value in update_data.items():
         setattr(result, field, value)
 
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
     db.refresh(result)
 
     return result
@@ -226,4 +239,6 @@ def delete_result(
         raise NotFoundException("Result not found")
 
     db.delete(result)
+    PlayerAnalysisService(db).refresh_session_scores(session_id)
     db.commit()
+    invalidate_session_analysis(db, session_id)
@@ -3,13 +3,15 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from jose import jwt, JWTError
 
-from app.api.deps import get_db
+from app.api.deps import get_db, limit_login_concurrency
 from app.config import get_settings
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     verify_password,
     get_password_hash,
+    password_needs_rehash,
+    password_hash_metrics,
 )
 from app.core.exceptions import UnauthorizedException, BadRequestException
 from app.models import User
@@ -20,22 +22,34 @@ settings = get_settings()
 router = APIRouter()
 
 
-@router.post("/login", response_model=Token)
-def login(
-    db: Session = Depends(get_db),
-    form_data: OAuth2PasswordRequestForm = Depends(),
-):
-    """OAuth2 compatible token login."""
-    user = db.query(User).filter(User.email == form_data.username).first()
+def _authenticate(db: Session, email: str, password: str) -> User:
+    """Check credentials, upgrading the stored hash if the work factor changed."""
+    user = db.query(User).filter(User.email == email).first()
     if not user:
         raise UnauthorizedException("Incorrect email or password")
 
-    if not verify_password(form_data.password, user.password_hash):
+    if not verify_password(password, user.password_hash):
         raise UnauthorizedException("Incorrect email or password")
 
     if not user.is_active:
         raise UnauthorizedException("Inactive user")
 
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = get_password_hash(password)
+        db.commit()
+        password_hash_metrics.record_rehash()
+
+    return user
+
+
+@router.post("/login", response_model=Token, dependencies=[Depends(limit_login_concurrency)])
+def login(
+    db: Session = Depends(get_db),
+    form_data: OAuth2PasswordRequestForm = Depends(),
+):
+    """OAuth2 compatible token login."""
+    user = _authenticate(db, form_data.username, form_data.password)
+
     return Token(
         access_token=create_access_token(str(user.id)),
         refresh_token=create_refresh_token(str(user.id)),
@@ -43,21 +57,13 @@ def login(
     )
 
 
-@router.post("/login/json", response_model=Token)
+@router.post("/login/json", response_model=Token, dependencies=[Depends(limit_login_concurrency)])
 def login_json(
     login_data: Login,
     db: Session = Depends(get_db),
 ):
     """JSON body login endpoint."""
-    user = db.query(User).filter(User.email == login_data.email).first()
-    if not user:
-        raise UnauthorizedException("Incorrect email or password")
-
-    if not verify_password(login_data.password, user.password_hash):
-        raise UnauthorizedException("Incorrect email or password")
-
-    if not user.is_active:
-        raise UnauthorizedException("Inactive user")
+    user = _authenticate(db, login_data.email, login_data.password)
 
     return Token(
         access_token=create_access_token(str(user.id)),
@@ -0,0 +1,171 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from uuid import UUID
+
+from app.api.deps import get_db, get_current_active_user, get_current_superuser
+from app.core.exceptions import NotFoundException, BadRequestException
+from app.models import AssessmentSession, Exercise, ExerciseMapping, Player, Team
+from app.schemas.assessment.onbaseu import ONBASEU_TESTS
+from app.schemas.assessment.pitcher_onbaseu import PITCHER_ONBASEU_TESTS
+from app.schemas.corrective import (
+    CorrectiveAssessmentType,
+    ExerciseCreate,
+    ExerciseResponse,
+    ExerciseMappingCreate,
+    ExerciseMappingResponse,
+    SessionRecommendations,
+    TeamRecommendations,
+)
+from app.services.correctives import CorrectiveRecommendationService, mapping_index
+from app.services.correctives.recommendations import CORRECTIVE_RESULT_MODELS
+
+router = APIRouter()
+
+# Test codes exercises can be mapped to, per assessment type
+TEST_CODES = {
+    "onbaseu": {test.code for test in ONBASEU_TESTS},
+    "pitcher_onbaseu": {test.code for test in PITCHER_ONBASEU_TESTS},
+}
+
+
+@router.get("/exercises", response_model=List[ExerciseResponse])
+def list_exercises(
+    body_part: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """List the corrective exercise library."""
+    query = db.query(Exercise)
+    if body_part:
+        query = query.filter(Exercise.body_part == body_part)
+    return query.order_by(Exercise.name, Exercise.id).offset(skip).limit(limit).all()
+
+
+@router.post("/exercises", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
+def create_exercise(
+    exercise_data: ExerciseCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Add an exercise to the library (admin only)."""
+    exercise = Exercise(**exercise_data.model_dump())
+    db.add(exercise)
+    db.commit()
+    db.refresh(exercise)
+    return exercise
+
+
+@router.get("/mappings", response_model=List[ExerciseMappingResponse])
+def list_mappings(
+    assessment_type: Optional[CorrectiveAssessmentType] = None,
+    test_code: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """List which exercises are recommended for which test results."""
+    query = db.query(ExerciseMapping)
+    if assessment_type:
+        query = query.filter(ExerciseMapping.assessment_type == assessment_type)
+    if test_code:
+        query = query.filter(ExerciseMapping.test_code == test_code)
+    return query.order_by(
+        ExerciseMapping.assessment_type,
+        ExerciseMapping.test_code,
+        ExerciseMapping.result_condition,
+        ExerciseMapping.priority,
+        ExerciseMapping.id,
+    ).all()
+
+
+@router.post("/mappings", response_model=ExerciseMappingResponse, status_code=status.HTTP_201_CREATED)
+def create_mapping(
+    mapping_data: ExerciseMappingCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Recommend an exercise for a test result condition (admin only)."""
+    if mapping_data.test_code not in TEST_CODES[mapping_data.assessment_type]:
+        raise BadRequestException(f"Unknown {mapping_data.assessment_type} test code: {mapping_data.test_code}")
+    if not db.query(Exercise.id).filter(Exercise.id == mapping_data.exercise_id).first():
+        raise NotFoundException("Exercise not found")
+
+    existing = db.query(ExerciseMapping.id).filter(
+        ExerciseMapping.assessment_type == mapping_data.assessment_type,
+        ExerciseMapping.test_code == mapping_data.test_code,
+        ExerciseMapping.result_condition == mapping_data.result_condition,
+        ExerciseMapping.exercise_id == mapping_data.exercise_id,
+    ).first()
+    if existing:
+        raise BadRequestException("Exercise is already mapped to this result")
+
+    mapping = ExerciseMapping(**mapping_data.model_dump())
+    db.add(mapping)
+    db.commit()
+    mapping_index.invalidate()
+    db.refresh(mapping)
+    return mapping
+
+
+@router.delete("/mappings/{mapping_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_mapping(
+    mapping_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Remove an exercise mapping (admin only)."""
+    mapping = db.query(ExerciseMapping).filter(ExerciseMapping.id == mapping_id).first()
+    if not mapping:
+        raise NotFoundException("Mapping not found")
+
+    db.delete(mapping)
+    db.commit()
+    mapping_index.invalidate()
+
+
+@router.get("/sessions/{session_id}/recommendations", response_model=SessionRecommendations)
+def get_session_recommendations(
+    session_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Recommend corrective exercises for an OnBaseU or Pitcher OnBaseU session.
+
+    Every failing, neutral and left/right asymmetric result is matched to
+    its mapped exercises; exercises come back most important first, each
+    with the results it addresses.
+    """
+    row = (
+        db.query(AssessmentSession, Player.first_name, Player.last_name)
+        .join(Player, AssessmentSession.player_id == Player.id)
+        .filter(AssessmentSession.id == session_id)
+        .first()
+    )
+    if not row:
+        raise NotFoundException("Session not found")
+    session, first_name, last_name = row
+    if session.assessment_type not in CORRECTIVE_RESULT_MODELS:
+        raise BadRequestException("Corrective exercises are only recommended for OnBaseU and Pitcher OnBaseU sessions")
+
+    return CorrectiveRecommendationService(db).for_session(session, f"{first_name} {last_name}")
+
+
+@router.get("/teams/{team_id}/recommendations", response_model=TeamRecommendations)
+def get_team_recommendations(
+    team_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Recommend corrective exercises for a team's active players.
+
+    Uses each player's latest complete OnBaseU and Pitcher OnBaseU session,
+    and also lists the exercises across the roster by how many players
+    need them.
+    """
+    team = db.query(Team).filter(Team.id == team_id).first()
+    if not team:
+        raise NotFoundException("Team not found")
+
+    return CorrectiveRecommendationService(db).for_team(team)
@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+
+from app.api.deps import get_db, get_current_active_user, get_current_superuser
+from app.api.pagination import paginate, set_next_cursor
+from app.core.exceptions import NotFoundException, BadRequestException, ForbiddenException
+from app.models import Job
+from app.schemas.job import JobCreate, JobResponse, JobStatus
+from app.services.jobs import JOB_HANDLERS, enqueue_job, cancel_job
+from app.services.jobs.queue import FINISHED_STATUSES
+
+router = APIRouter()
+
+
+def _get_job(db: Session, job_id: UUID, current_user) -> Job:
+    """Get a job visible to the current user: their own, or any for superusers."""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise NotFoundException("Job not found")
+    if not current_user.is_superuser and job.created_by != current_user.id:
+        raise ForbiddenException("Not enough permissions")
+    return job
+
+
+@router.get("/types", response_model=List[str])
+def list_job_types(
+    current_user=Depends(get_current_superuser),
+):
+    """List the job types workers can run (admin only)."""
+    return sorted(JOB_HANDLERS)
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_job(
+    job_data: JobCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Queue a background job for the workers (admin only)."""
+    if job_data.job_type not in JOB_HANDLERS:
+        raise BadRequestException(f"Unknown job type: {job_data.job_type}")
+
+    job = enqueue_job(
+        db,
+        job_data.job_type,
+        job_data.payload,
+        priority=job_data.priority,
+        max_attempts=job_data.max_attempts,
+        run_at=job_data.run_at,
+        created_by=current_user.id,
+    )
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+@router.get("", response_model=List[JobResponse])
+def list_jobs(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    job_status: Optional[JobStatus] = Query(None, alias="status"),
+    job_type: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """List jobs, newest first (admin only)."""
+    query = db.query(Job)
+    if job_status:
+        query = query.filter(Job.status == job_status)
+    if job_type:
+        query = query.filter(Job.job_type == job_type)
+
+    jobs = paginate(
+        query, [Job.created_at, Job.id], [datetime, UUID], cursor, skip, limit, descending=True
+    ).all()
+    set_next_cursor(response, jobs, limit, lambda job: (job.created_at, job.id))
+    return jobs
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Get a job's status, progress and result."""
+    return _get_job(db, job_id, current_user)
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+def cancel(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Cancel a queued job, or ask a running one to stop at its next progress report."""
+    job = _get_job(db, job_id, current_user)
+    if job.status in FINISHED_STATUSES:
+        raise BadRequestException(f"Job is already {job.status}")
+
+    cancelled = cancel_job(db, job)
+    db.commit()
+    db.refresh(job)
+    if not cancelled:
+        raise BadRequestException(f"Job is already {job.status}")
+    return job
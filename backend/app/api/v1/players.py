@@ -1,20 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, literal, null, or_, text
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
 from app.api.deps import get_db, get_current_active_user
+from app.api.pagination import paginate, set_next_cursor
 from app.core.exceptions import NotFoundException, BadRequestException
 from app.models import Player, Team, Sport, AssessmentSession
+from app.models.player import PLAYER_SEARCH_NAME
 from app.schemas.player import (
     PlayerCreate,
     PlayerUpdate,
     PlayerResponse,
     PlayerListResponse,
+    PlayerSearchResult,
     PlayerWithAssessments,
 )
+from app.services.analysis.analytics_cube import AnalyticsCubeService, CUBE_PLAYER_FIELDS
+from app.services.analysis.cache import analysis_cache
 
 router = APIRouter()
 
@@ -44,10 +49,71 @@ def generate_player_code(db: Session) -> str:
     return f"{prefix}{new_number:04d}"
 
 
+def _player_list_query(db: Session, *extra_columns):
+    """Joined projection of just the PlayerListResponse columns.
+
+    One query per page instead of one plus a team and sport lookup per player.
+    """
+    return (
+        db.query(
+            Player.id,
+            Player.player_code,
+            Player.first_name,
+            Player.last_name,
+            Player.sport_id,
+            Player.is_pitcher,
+            Player.is_position_player,
+            Player.is_active,
+            Player.graduation_year,
+            Team.name.label("team_name"),
+            Sport.name.label("sport_name"),
+            *extra_columns,
+        )
+        .outerjoin(Team, Player.team_id == Team.id)
+        .outerjoin(Sport, Player.sport_id == Sport.id)
+    )
+
+
+def _player_list_item(row) -> dict:
+    """PlayerListResponse fields from a _player_list_query row."""
+    return dict(
+        id=row.id,
+        player_code=row.player_code,
+        full_name=f"{row.first_name} {row.last_name}",
+        team_name=row.team_name,
+        sport_id=row.sport_id,
+        sport_name=row.sport_name,
+        is_pitcher=row.is_pitcher,
+        is_position_player=row.is_position_player,
+        is_active=row.is_active,
+        graduation_year=row.graduation_year,
+    )
+
+
+def _like_pattern(term: str) -> str:
+    """Escape LIKE wildcards so the search term matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+_trigram_search: Optional[bool] = None
+
+
+def _has_trigram_search(db: Session) -> bool:
+    """Whether pg_trgm is installed (checked once per process)."""
+    global _trigram_search
+    if _trigram_search is None:
+        _trigram_search = db.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).first() is not None
+    return _trigram_search
+
+
 @router.get("", response_model=List[PlayerListResponse])
 def list_players(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     team_id: Optional[int] = None,
     sport_id: Optional[int] = None,
     is_pitcher: Optional[bool] = None,
@@ -56,8 +122,8 @@ def list_players(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    """List all players with optional filters."""
-    query = db.query(Player)
+    """List all players with optional filters, ordered by name."""
+    query = _player_list_query(db)
 
     if team_id is not None:
         query = query.filter(Player.team_id == team_id)
@@ -72,32 +138,91 @@ def list_players(
         query = query.filter(Player.is_active == is_active)
 
     if search:
-        search_term = f"%{search}%"
+        # Same expressions as the trigram indexes, so the filter can use them
+        search_term = f"%{_like_pattern(search)}%"
         query = query.filter(
-            (Player.first_name.ilike(search_term))
-            | (Player.last_name.ilike(search_term))
-            | (Player.player_code.ilike(search_term))
+            PLAYER_SEARCH_NAME.ilike(search_term) | Player.player_code.ilike(search_term)
         )
 
-    players = query.offset(skip).limit(limit).all()
-
-    result = []
-    for player in players:
-        player_data = PlayerListResponse(
-            id=player.id,
-            player_code=player.player_code,
-            full_name=player.full_name,
-            team_name=player.team.name if player.team else None,
-            sport_id=player.sport_id,
-            sport_name=player.sport.name if player.sport else None,
-            is_pitcher=player.is_pitcher,
-            is_position_player=player.is_position_player,
-            is_active=player.is_active,
-            graduation_year=player.graduation_year,
+    rows = paginate(
+        query,
+        [Player.last_name, Player.first_name, Player.id],
+        [str, str, UUID],
+        cursor,
+        skip,
+        limit,
+    ).all()
+    set_next_cursor(response, rows, limit, lambda row: (row.last_name, row.first_name, row.id))
+
+    return [PlayerListResponse(**_player_list_item(row)) for row in rows]
+
+
+@router.get("/search", response_model=List[PlayerSearchResult])
+def search_players(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    team_id: Optional[int] = None,
+    sport_id: Optional[int] = None,
+    is_active: Optional[bool] = True,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Type-ahead player search by name or player code, best matches first.
+
+    Tolerates typos through pg_trgm word similarity; names and codes that
+    start with the term rank above fuzzy matches.
+    """
+    term = q.strip()
+    pattern = _like_pattern(term)
+    prefix_match = or_(
+        Player.first_name.ilike(f"{pattern}%"),
+        Player.last_name.ilike(f"{pattern}%"),
+        Player.player_code.ilike(f"{pattern}%"),
+    )
+    substring_match = or_(
+        PLAYER_SEARCH_NAME.ilike(f"%{pattern}%"),
+        Player.player_code.ilike(f"%{pattern}%"),
+    )
+
+    order_by = [prefix_match.desc()]
+    if _has_trigram_search(db):
+        score = func.greatest(
+            func.word_similarity(term, PLAYER_SEARCH_NAME),
+            func.similarity(term, Player.player_code),
         )
-        result.append(player_data)
+        # <% and % are the index-backed forms of the similarity thresholds
+        match = or_(
+            substring_match,
+            literal(term).op("<%")(PLAYER_SEARCH_NAME.self_group()),
+            literal(term).op("%")(Player.player_code),
+        )
+        order_by.append(score.desc())
+    else:
+        score = null()
+        match = substring_match
+
+    query = _player_list_query(db, score.label("score")).filter(match)
+
+    if team_id is not None:
+        query = query.filter(Player.team_id == team_id)
+
+    if sport_id is not None:
+        query = query.filter(Player.sport_id == sport_id)
+
+    if is_active is not None:
+        query = query.filter(Player.is_active == is_active)
+
+    rows = query.order_by(
+        *order_by, Player.last_name, Player.first_name, Player.id
+    ).limit(limit).all()
 
-    return result
+    return [
+        PlayerSearchResult(
+            **_player_list_item(row),
+            score=round(row.score, 3) if row.score is not None else None,
+        )
+        for row in rows
+    ]
 
 
 @router.post("", response_model=PlayerResponse, status_code=status.HTTP_201_CREATED)
@@ -134,9 +259,8 @@ def create_player(
 
     db.add(player)
     db.commit()
-    db.refresh(player)
 
-    return _build_player_response(player)
+    return _build_player_response(_get_player(db, player.id))
 
 
 @router.get("/{player_id}", response_model=PlayerResponse)
@@ -146,11 +270,7 @@ def get_player(
     current_user=Depends(get_current_active_user),
 ):
     """Get a specific player by ID."""
-    player = db.query(Player).filter(Player.id == player_id).first()
-    if not player:
-        raise NotFoundException("Player not found")
-
-    return _build_player_response(player)
+    return _build_player_response(_get_player(db, player_id))
 
 
 @router.put("/{player_id}", response_model=PlayerResponse)
@@ -161,9 +281,7 @@ def update_player(
     current_user=Depends(get_current_active_user),
 ):
     """Update a player."""
-    player = db.query(Player).filter(Player.id == player_id).first()
-    if not player:
-        raise NotFoundException("Player not found")
+    player = _get_player(db, player_id)
 
     update_data = player_update.model_dump(exclude_unset=True)
 
@@ -179,11 +297,26 @@ def update_player(
         if not sport:
             raise BadRequestException("Sport not found")
 
+    previous_team_id, previous_sport_id = player.team_id, player.sport_id
+    moves_cube_rows = any(
+        field in CUBE_PLAYER_FIELDS and getattr(player, field) != value
+        for field, value in update_data.items()
+    )
     for field, value in update_data.items():
         setattr(player, field, value)
 
+    # Cube rows carry the player's team, sport and groups as of their refresh
+    if moves_cube_rows:
+        db.flush()
+        AnalyticsCubeService(db).refresh_player_slices(player.id)
+
     db.commit()
-    db.refresh(player)
+    player = _get_player(db, player_id)
+    analysis_cache.invalidate(
+        players=[player.id],
+        teams=[previous_team_id, player.team_id],
+        sports=[previous_sport_id, player.sport_id],
+    )
 
     return _build_player_response(player)
 
@@ -201,6 +334,7 @@ def delete_player(
 
     player.is_active = False
     db.commit()
+    analysis_cache.invalidate(players=[player_id], teams=[player.team_id], sports=[player.sport_id])
 
 
 @router.get("/{player_id}/assessments", response_model=PlayerWithAssessments)
@@ -210,9 +344,7 @@ def get_player_assessments(
     current_user=Depends(get_current_active_user),
 ):
     """Get player with assessment summary."""
-    player = db.query(Player).filter(Player.id == player_id).first()
-    if not player:
-        raise NotFoundException("Player not found")
+    player = _get_player(db, player_id)
 
     # Get assessment counts and types
     sessions = db.query(AssessmentSession).filter(
@@ -232,6 +364,20 @@ def get_player_assessments(
     return response
 
 
+def _get_player(db: Session, player_id: UUID) -> Player:
+    """Get a player with team and sport eagerly loaded, or raise 404."""
+    player = (
+        db.query(Player)
+        .options(joinedload(Player.team), joinedload(Player.sport))
+        .filter(Player.id == player_id)
+        .populate_existing()
+        .first()
+    )
+    if not player:
+        raise NotFoundException("Player not found")
+    return player
+
+
 def _build_player_response(player: Player) -> PlayerResponse:
     """Build a PlayerResponse from a Player model."""
     return PlayerResponse(
@@ -1,7 +1,13 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, users, teams, players, sports
+from app.config import get_settings
+from app.api.v1 import auth, users, teams, players, sports, system, jobs, correctives
 from app.api.v1.assessments.router import router as assessments_router
-from app.api.v1.analysis.router import router as analysis_router
+from app.api.v1.analysis.router import router as sync_analysis_router
+from app.api.v1.analysis.async_router import router as async_analysis_router
+
+settings = get_settings()
+
+analysis_router = async_analysis_router if settings.ASYNC_DB_ENABLED else sync_analysis_router
 
 api_router = APIRouter()
 
@@ -12,3 +18,6 @@ api_router.include_router(sports.router, prefix="/sports", tags=["Sports"])
 api_router.include_router(players.router, prefix="/players", tags=["Players"])
 api_router.include_router(assessments_router, prefix="/assessments", tags=["Assessments"])
 api_router.include_router(analysis_router, prefix="/analysis", tags=["Analysis"])
+api_router.include_router(correctives.router, prefix="/correctives", tags=["Correctives"])
+api_router.include_router(system.router, prefix="/system", tags=["System"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
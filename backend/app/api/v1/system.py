@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_superuser
+from app.core.auth_cache import principal_cache, token_cache
+from app.core.security import password_hash_metrics
+from app.db.session import engine
+from app.db.async_session import async_engine
+
+router = APIRouter()
+
+
+@router.get("/db-pool")
+def get_db_pool_stats(
+    current_user=Depends(get_current_superuser),
+):
+    """Get connection pool usage, checkout wait times and exhaustion events (admin only)."""
+    stats = {"sync": engine.pool.stats()}
+    if async_engine is not None:
+        stats["async"] = async_engine.pool.stats()
+    return stats
+
+
+@router.get("/auth-cache")
+def get_auth_cache_stats(
+    current_user=Depends(get_current_superuser),
+):
+    """Get principal and token cache counters (admin only)."""
+    return {"principals": principal_cache.stats(), "tokens": token_cache.stats()}
+
+
+@router.get("/password-hashing")
+def get_password_hashing_stats(
+    current_user=Depends(get_current_superuser),
+):
+    """Get bcrypt hash/verify timings, rehashes and rejected logins (admin only)."""
+    return password_hash_metrics.snapshot()
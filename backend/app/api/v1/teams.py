@@ -1,30 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List
+from typing import List, Optional
 
 from app.api.deps import get_db, get_current_active_user
+from app.api.pagination import paginate, set_next_cursor
 from app.core.exceptions import NotFoundException, BadRequestException
 from app.models import Team, Player
 from app.schemas.team import TeamCreate, TeamUpdate, TeamResponse, TeamStats
+from app.services.analysis.cache import analysis_cache
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[TeamResponse])
 def list_teams(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    """List all teams."""
+    """List all teams, ordered by name."""
     query = db.query(Team)
     if not include_inactive:
         query = query.filter(Team.is_active == True)
 
-    teams = query.offset(skip).limit(limit).all()
+    teams = paginate(query, [Team.name, Team.id], [str, int], cursor, skip, limit).all()
+    set_next_cursor(response, teams, limit, lambda team: (team.name, team.id))
 
     # Add player counts
     result = []
@@ -91,6 +96,7 @@ def update_team(
 
     db.commit()
     db.refresh(team)
+    analysis_cache.invalidate(teams=[team_id])
 
     return team
 
@@ -108,6 +114,7 @@ def delete_team(
 
     team.is_active = False
     db.commit()
+    analysis_cache.invalidate(teams=[team_id])
 
 
 @router.get("/{team_id}/players", response_model=List)
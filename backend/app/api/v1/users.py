@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.api.deps import get_db, get_current_active_user, get_current_superuser
+from app.api.pagination import paginate, set_next_cursor
 from app.core.security import get_password_hash
 from app.core.exceptions import NotFoundException, BadRequestException
+from app.core.auth_cache import invalidate_principal
 from app.models import User
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 
@@ -27,34 +29,40 @@ def update_current_user(
     current_user: User = Depends(get_current_active_user),
 ):
     """Update current user information."""
+    # current_user is a cached, detached principal; load the row to modify it
+    user = db.query(User).filter(User.id == current_user.id).first()
     update_data = user_update.model_dump(exclude_unset=True)
 
     if "password" in update_data:
         update_data["password_hash"] = get_password_hash(update_data.pop("password"))
 
-    if "email" in update_data and update_data["email"] != current_user.email:
+    if "email" in update_data and update_data["email"] != user.email:
         existing = db.query(User).filter(User.email == update_data["email"]).first()
         if existing:
             raise BadRequestException("Email already registered")
 
     for field, value in update_data.items():
-        setattr(current_user, field, value)
+        setattr(user, field, value)
 
     db.commit()
-    db.refresh(current_user)
+    db.refresh(user)
+    invalidate_principal(user.id)
 
-    return current_user
+    return user
 
 
 @router.get("", response_model=List[UserResponse])
 def list_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_superuser),
 ):
-    """List all users (admin only)."""
-    users = db.query(User).offset(skip).limit(limit).all()
+    """List all users ordered by email (admin only)."""
+    users = paginate(db.query(User), [User.email], [str], cursor, skip, limit).all()
+    set_next_cursor(response, users, limit, lambda user: (user.email,))
     return users
 
 
@@ -125,6 +133,7 @@ def update_user(
 
     db.commit()
     db.refresh(user)
+    invalidate_principal(user.id)
 
     return user
 
@@ -145,3 +154,4 @@ def delete_user(
 
     user.is_active = False
     db.commit()
+    invalidate_principal(user.id)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import List
+from typing import List, Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -12,11 +12,71 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql://localhost:5432/sports_performance"
 
+    # Connection pool (applies to the sync and async engines)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 never recycles
+    DB_POOL_USE_LIFO: bool = False
+    # True tests connections on checkout; False relies on recycle and reconnecting on error
+    DB_POOL_PRE_PING: bool = True
+
+    # Startup bootstrap (create_all, migrations, seeding): "fingerprint" runs it
+    # only when the stored schema/seed fingerprint differs, "always" on every
+    # start, "none" never (schema managed by Alembic revisions)
+    STARTUP_SCHEMA_MODE: Literal["fingerprint", "always", "none"] = "fingerprint"
+
+    # Async mode: serves analysis and session routes from an asyncpg AsyncSession.
+    # ASYNC_DATABASE_URL defaults to DATABASE_URL with the asyncpg driver.
+    ASYNC_DB_ENABLED: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
     # Security
     SECRET_KEY: str = "change-this-secret-key-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Per-process cache of active users and validated tokens. Changes made
+    # through the users API invalidate immediately in that process; other
+    # processes pick them up within the TTL.
+    AUTH_CACHE_TTL_SECONDS: int = 30
+    AUTH_CACHE_MAX_ENTRIES: int = 1024
+
+    # Password hashing: bcrypt work factor (existing hashes are upgraded on
+    # login), worker processes (0 hashes in the request thread) and the
+    # number of concurrent logins before new ones get 429
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    LOGIN_MAX_CONCURRENCY: int = 8
+
+    # Analysis response cache (per process); 0 entries disables it
+    ANALYSIS_CACHE_MAX_ENTRIES: int = 1024
+    ANALYSIS_CACHE_TTL_SECONDS: int = 300
+    # How often each process checks the shared cache generation bumped by
+    # rescoring, cube rebuilds and imports (which may run in other processes)
+    ANALYSIS_CACHE_SYNC_SECONDS: float = 1.0
+
+    # Corrective exercise mappings are indexed in memory per process; writes
+    # through the correctives API reload it in that process, other processes
+    # pick them up within the TTL
+    CORRECTIVE_INDEX_TTL_SECONDS: int = 300
+
+    # Background jobs (python -m app.worker): worker threads per process, idle
+    # poll interval, attempts and retry backoff (doubling from the base up to
+    # the max), and how long a running job may go without a heartbeat before
+    # its worker is presumed dead and the job is retried
+    JOB_WORKER_CONCURRENCY: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BASE_SECONDS: int = 30
+    JOB_RETRY_MAX_SECONDS: int = 3600
+    JOB_HEARTBEAT_SECONDS: int = 15
+    JOB_STALE_SECONDS: int = 120
+
+    # Prometheus metrics at /metrics (per process). With a token set, scrapes
+    # must send it as "Authorization: Bearer <token>"
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""
 
     # CORS
     ALLOWED_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"]
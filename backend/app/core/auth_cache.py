@@ -0,0 +1,93 @@
+from typing import Any, Dict, Hashable, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from threading import Lock
+from uuid import UUID
+import time
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire individually."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        if self.max_entries <= 0 or ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Active users by id, as detached User instances (roles loaded)
+principal_cache = TTLCache(settings.AUTH_CACHE_MAX_ENTRIES)
+
+# Validated access tokens -> user id, never kept past the token's expiry
+token_cache = TTLCache(settings.AUTH_CACHE_MAX_ENTRIES)
+
+
+def cache_token(token: str, user_id: UUID, exp: Optional[int]) -> None:
+    """Remember a validated access token until the TTL or its expiry, whichever is first."""
+    ttl = settings.AUTH_CACHE_TTL_SECONDS
+    if exp is not None:
+        ttl = min(ttl, exp - datetime.now(timezone.utc).timestamp())
+    token_cache.set(token, user_id, ttl)
+
+
+def cache_principal(user) -> None:
+    """Cache an active user (already detached from its session)."""
+    if user.is_active:
+        principal_cache.set(user.id, user, settings.AUTH_CACHE_TTL_SECONDS)
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """Drop a cached user after their account, status or privileges change."""
+    principal_cache.pop(user_id)
@@ -0,0 +1,322 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import functools
+import math
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# Response adds "; charset=utf-8"
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+SCORING_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, Any], float]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_family(name: str, metric_type: str, documentation: str, samples: Iterable[Sample]) -> List[str]:
+    """Render one metric family in the Prometheus text format.
+
+    ``samples`` are (name suffix, labels, value), e.g. ("_bucket", {"le": 0.1}, 3).
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+    for suffix, labels, value in samples:
+        label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+        lines.append(f"{name}{suffix}{{{label_text}}} {_format_value(value)}" if label_text
+                     else f"{name}{suffix} {_format_value(value)}")
+    return lines
+
+
+class _Metric:
+    """A metric family whose children are keyed by a tuple of label values."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+        self._values: Dict[Labels, Any] = {}
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(labels, self._copy(value)) for labels, value in self._values.items()]
+        return render_family(self.name, self.type, self.documentation, self._samples(items))
+
+    def _copy(self, value: Any) -> Any:
+        return value
+
+    def _samples(self, items) -> Iterable[Sample]:
+        for labels, value in items:
+            yield "", dict(zip(self.labelnames, labels)), value
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """Histogram with fixed upper-inclusive buckets, plus _sum and _count."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, labels: Labels, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            child = self._values.get(labels)
+            if child is None:
+                # Per-bucket counts (the last is +Inf), then the sum
+                child = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            child[index] += 1
+            child[-1] += value
+
+    def _copy(self, value: Any) -> Any:
+        return list(value)
+
+    def _samples(self, items) -> Iterable[Sample]:
+        for labels, child in items:
+            base = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child[:-1]):
+                cumulative += count
+                yield "_bucket", {**base, "le": _format_value(bound)}, cumulative
+            yield "_sum", base, child[-1]
+            yield "_count", base, cumulative
+
+
+class MetricsRegistry:
+    """Process-wide metrics, rendered for Prometheus by /metrics.
+
+    Collectors are called at scrape time for values that already live
+    elsewhere (e.g. connection pool state) and return rendered lines.
+    Metrics are per process: with several workers each one is scraped
+    separately.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], List[str]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+
+metrics = MetricsRegistry()
+
+http_requests_total = metrics.counter(
+    "http_requests_total", "HTTP requests by route and status code.", ("method", "route", "status")
+)
+http_request_duration_seconds = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")
+)
+http_requests_in_progress = metrics.gauge(
+    "http_requests_in_progress", "HTTP requests currently being served.", ("method",)
+)
+http_request_db_statements = metrics.histogram(
+    "http_request_db_statements", "SQL statements executed per HTTP request by route.",
+    ("method", "route"), STATEMENT_BUCKETS,
+)
+http_request_db_duration_seconds = metrics.histogram(
+    "http_request_db_duration_seconds", "Time spent executing SQL per HTTP request by route.", ("method", "route")
+)
+db_statements_total = metrics.counter(
+    "db_statements_total", "SQL statements executed, including outside requests."
+)
+scoring_duration_seconds = metrics.histogram(
+    "scoring_duration_seconds", "Scoring service calls and their duration.", ("service", "method"), SCORING_BUCKETS
+)
+
+
+class RequestStats:
+    """SQL statements and database time of the current request."""
+
+    __slots__ = ("db_statements", "db_seconds")
+
+    def __init__(self):
+        self.db_statements = 0
+        self.db_seconds = 0.0
+
+
+# Set by MetricsMiddleware; sync endpoints and dependencies run in worker
+# threads that inherit a copy of the context, so they update the same object
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # A connection runs one statement at a time; a failed statement's start
+    # time is simply overwritten by the next one
+    conn.info["metrics_statement_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop("metrics_statement_started", time.perf_counter())
+    db_statements_total.inc()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_statements += 1
+        stats.db_seconds += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time every SQL statement run through a (sync) engine.
+
+    For an AsyncEngine pass its ``sync_engine``.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def pool_collector(engines: Dict[str, Engine]) -> Callable[[], List[str]]:
+    """Collector exporting connection pool state and checkout counters per engine."""
+    gauges = {
+        "db_pool_size": ("size", "Configured connection pool size."),
+        "db_pool_checked_out": ("checked_out", "Connections currently checked out."),
+        "db_pool_overflow": ("overflow", "Overflow connections currently open."),
+    }
+    counters = {
+        "db_pool_checkouts_total": ("checkouts", "Connection checkouts that reached the pool queue."),
+        "db_pool_exhausted_checkouts_total": ("exhausted_checkouts", "Checkouts that had to wait for a connection."),
+        "db_pool_checkout_timeouts_total": ("checkout_timeouts", "Checkouts that timed out."),
+        "db_pool_checkout_wait_seconds_total": ("wait_seconds_total", "Time spent waiting for connections."),
+    }
+
+    def collect() -> List[str]:
+        stats = {name: engine.pool.stats() for name, engine in engines.items()}
+        lines: List[str] = []
+        for families, metric_type in ((gauges, "gauge"), (counters, "counter")):
+            for metric_name, (key, documentation) in families.items():
+                lines.extend(render_family(metric_name, metric_type, documentation, [
+                    ("", {"engine": name}, pool_stats[key]) for name, pool_stats in stats.items()
+                ]))
+        return lines
+
+    return collect
+
+
+class MetricsMiddleware:
+    """Record latency, status code, in-flight count and SQL use of each request.
+
+    Plain ASGI middleware, so streaming responses pass through untouched.
+    Requests are labelled by route template (e.g. /api/v1/players/{player_id})
+    to keep label cardinality bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        http_requests_in_progress.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec((method,))
+            _request_stats.reset(token)
+
+            route = scope.get("route")
+            labels = (method, getattr(route, "path_format", None) or "unmatched")
+            http_requests_total.inc(labels + (str(status_code),))
+            http_request_duration_seconds.observe(labels, elapsed)
+            http_request_db_statements.observe(labels, stats.db_statements)
+            http_request_db_duration_seconds.observe(labels, stats.db_seconds)
+
+
+def timed_scoring(func: Callable) -> Callable:
+    """Count and time calls to a scoring service method.
+
+    Labelled by class and method name. Leaves the method untouched when
+    metrics are disabled.
+    """
+    if not settings.METRICS_ENABLED:
+        return func
+    service, _, method = func.__qualname__.rpartition(".")
+    labels = (service, method)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            scoring_duration_seconds.observe(labels, time.perf_counter() - started)
+
+    return wrapper
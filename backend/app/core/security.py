@@ -1,7 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from threading import Lock
 from typing import Optional, Any
 from jose import jwt
 import bcrypt
+import multiprocessing
+import time
 from app.config import get_settings
 
 settings = get_settings()
@@ -39,18 +43,136 @@ def create_refresh_token(subject: str, expires_delta: Optional[timedelta] = None
     return encoded_jwt
 
 
+class PasswordHashMetrics:
+    """Counts and timings for bcrypt hash/verify calls, including pool queueing."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.in_flight = 0
+        self.rehashes = 0
+        self.rejected_logins = 0
+        self.calls = {"hash": 0, "verify": 0}
+        self.seconds_total = {"hash": 0.0, "verify": 0.0}
+        self.seconds_max = {"hash": 0.0, "verify": 0.0}
+
+    def start(self) -> float:
+        with self._lock:
+            self.in_flight += 1
+        return time.perf_counter()
+
+    def finish(self, operation: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.in_flight -= 1
+            self.calls[operation] += 1
+            self.seconds_total[operation] += elapsed
+            self.seconds_max[operation] = max(self.seconds_max[operation], elapsed)
+
+    def record_rehash(self) -> None:
+        with self._lock:
+            self.rehashes += 1
+
+    def record_rejected_login(self) -> None:
+        with self._lock:
+            self.rejected_logins += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "rounds": settings.PASSWORD_HASH_ROUNDS,
+                "workers": settings.PASSWORD_HASH_WORKERS,
+                "in_flight": self.in_flight,
+                "rehashes": self.rehashes,
+                "rejected_logins": self.rejected_logins,
+                **{
+                    operation: {
+                        "calls": self.calls[operation],
+                        "seconds_total": self.seconds_total[operation],
+                        "seconds_max": self.seconds_max[operation],
+                        "seconds_avg": (
+                            self.seconds_total[operation] / self.calls[operation]
+                            if self.calls[operation] else 0.0
+                        ),
+                    }
+                    for operation in ("hash", "verify")
+                },
+            }
+
+
+password_hash_metrics = PasswordHashMetrics()
+
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = Lock()
+
+
+def _get_hash_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the bcrypt worker pool, or None to hash in the calling thread."""
+    global _hash_pool
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            # spawn: forking a multi-threaded server process is unsafe
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _hash_pool
+
+
+def shutdown_hash_pool() -> None:
+    """Stop the bcrypt worker processes."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(cancel_futures=True)
+            _hash_pool = None
+
+
+def _run_hashing(operation: str, fn, *args):
+    pool = _get_hash_pool()
+    started = password_hash_metrics.start()
+    try:
+        return fn(*args) if pool is None else pool.submit(fn, *args).result()
+    finally:
+        password_hash_metrics.finish(operation, started)
+
+
+def _bcrypt_check(plain_password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(plain_password, hashed_password)
+
+
+def _bcrypt_hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return bcrypt.checkpw(
+    return _run_hashing(
+        "verify",
+        _bcrypt_check,
         plain_password.encode('utf-8'),
-        hashed_password.encode('utf-8')
+        hashed_password.encode('utf-8'),
     )
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    """Hash a password with the configured bcrypt work factor."""
+    return _run_hashing(
+        "hash",
+        _bcrypt_hash,
+        password.encode('utf-8'),
+        settings.PASSWORD_HASH_ROUNDS,
+    ).decode('utf-8')
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a bcrypt hash ($2b$<cost>$...) uses a different work factor."""
+    parts = hashed_password.split("$")
+    try:
+        return int(parts[2]) != settings.PASSWORD_HASH_ROUNDS
+    except (IndexError, ValueError):
+        return True
 
 
 def decode_token(token: str) -> dict[str, Any]:
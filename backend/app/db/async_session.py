@@ -0,0 +1,43 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import AsyncGenerator
+from app.config import get_settings
+from app.db.pool_metrics import InstrumentedAsyncQueuePool
+from app.db.session import get_pool_options
+
+settings = get_settings()
+
+
+def get_async_database_url() -> str:
+    """Get the asyncpg URL, derived from DATABASE_URL unless set explicitly."""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = settings.DATABASE_URL
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Only created in async mode, so asyncpg is not required otherwise
+async_engine = (
+    create_async_engine(
+        get_async_database_url(),
+        poolclass=InstrumentedAsyncQueuePool,
+        **get_pool_options(),
+    )
+    if settings.ASYNC_DB_ENABLED
+    else None
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database sessions."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+import hashlib
+import time
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.db.base import Base
+
+# Bump when run_migrations() or the seed data change without a model change
+BOOTSTRAP_VERSION = "4"
+
+# Serialises bootstrap across workers starting at the same time
+_BOOTSTRAP_LOCK_ID = 0x5350_0001
+
+
+def get_schema_fingerprint() -> str:
+    """Hash the DDL of every mapped table plus the bootstrap version."""
+    dialect = postgresql.dialect()
+    digest = hashlib.sha256(BOOTSTRAP_VERSION.encode())
+    for table in sorted(Base.metadata.tables.values(), key=lambda t: t.fullname):
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def get_stored_fingerprint(conn: Connection) -> Optional[str]:
+    """Get the fingerprint recorded by the last bootstrap, if any."""
+    table = conn.execute(text("SELECT to_regclass('public.app_bootstrap')")).scalar()
+    if table is None:
+        return None
+    return conn.execute(text("SELECT fingerprint FROM public.app_bootstrap WHERE id = 1")).scalar()
+
+
+def store_fingerprint(conn: Connection, fingerprint: str) -> None:
+    """Record the fingerprint of a completed bootstrap."""
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS public.app_bootstrap (
+            id INTEGER PRIMARY KEY,
+            fingerprint VARCHAR(64) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(
+        text("""
+            INSERT INTO public.app_bootstrap (id, fingerprint, applied_at)
+            VALUES (1, :fingerprint, now())
+            ON CONFLICT (id) DO UPDATE
+            SET fingerprint = EXCLUDED.fingerprint, applied_at = EXCLUDED.applied_at
+        """),
+        {"fingerprint": fingerprint},
+    )
+
+
+@contextmanager
+def bootstrap_lock(conn: Connection) -> Iterator[None]:
+    """Hold a session-level advisory lock while bootstrapping."""
+    conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": _BOOTSTRAP_LOCK_ID})
+    try:
+        yield
+    finally:
+        conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": _BOOTSTRAP_LOCK_ID})
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """Print how long a startup phase took."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        print(f"Startup: {name} took {(time.perf_counter() - start) * 1000:.1f} ms")
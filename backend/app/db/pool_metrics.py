@@ -0,0 +1,105 @@
+from typing import Any, Dict, List
+from threading import Lock
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Upper bounds (seconds) of the checkout wait-time histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """Checkout wait times and exhaustion events for one connection pool."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_bucket_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self.exhausted_checkouts = 0
+        self.checkout_timeouts = 0
+
+    def observe(self, wait_seconds: float, exhausted: bool, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.checkout_timeouts += 1
+            else:
+                self.checkouts += 1
+                self.wait_seconds_total += wait_seconds
+                for i, bound in enumerate(WAIT_BUCKETS):
+                    if wait_seconds <= bound:
+                        self.wait_bucket_counts[i] += 1
+                        break
+                else:
+                    self.wait_bucket_counts[-1] += 1
+            if exhausted:
+                self.exhausted_checkouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            cumulative = 0
+            buckets: List[Dict[str, Any]] = []
+            for bound, count in zip(list(WAIT_BUCKETS) + ["+Inf"], self.wait_bucket_counts):
+                cumulative += count
+                buckets.append({"le": bound, "count": cumulative})
+            return {
+                "checkouts": self.checkouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_histogram": buckets,
+                "exhausted_checkouts": self.exhausted_checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout that reaches the pool queue.
+
+    A checkout counts as exhausted when every pooled and overflow
+    connection is already in use, i.e. the caller has to wait.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        # With unlimited overflow (-1) a new connection is always opened instead
+        exhausted = (
+            self._max_overflow >= 0
+            and self.checkedin() == 0
+            and self.overflow() >= self._max_overflow
+        )
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe(time.perf_counter() - start, exhausted, timed_out=True)
+            raise
+        self.metrics.observe(time.perf_counter() - start, exhausted, timed_out=False)
+        return connection
+
+    def stats(self) -> Dict[str, Any]:
+        """Current pool state plus accumulated checkout metrics."""
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "timeout": self.timeout(),
+            **self.metrics.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool that records checkout metrics."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout metrics."""
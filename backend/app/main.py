@@ -1,30 +1,54 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import secrets
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from app.config import get_settings
 from app.api.v1.router import api_router
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.services.assessment.bulk_ingest import INSERTED_HEADER, EXISTING_HEADER
+from app.services.assessment.kams_query import create_measurement_indexes
+from app.scripts.backfill_session_scores import backfill_session_scores
 from app.db.session import SessionLocal, engine
+from app.db.bootstrap import (
+    get_schema_fingerprint,
+    get_stored_fingerprint,
+    store_fingerprint,
+    bootstrap_lock,
+    timed_phase,
+)
+from app.db.async_session import async_engine
 from app.db.base import Base
 from app.models import User
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, shutdown_hash_pool
+from app.core.exceptions import UnauthorizedException
+from app.core.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    MetricsMiddleware,
+    instrument_engine,
+    metrics,
+    pool_collector,
+)
 
 # Import all models to register them with Base.metadata
 from app.models import (
     user, team, sport, player, assessment,
-    onbaseu, pitcher_onbaseu, tpi_power, sprint, kams, corrective
+    onbaseu, pitcher_onbaseu, tpi_power, sprint, kams, corrective, analysis, rescore, job
 )
 from app.models import Sport, Player
 
 settings = get_settings()
 
 
-def init_db():
-    """Create database schemas and tables."""
+def init_db() -> bool:
+    """Create database schemas and tables.
+
+    Returns whether every migration step succeeded.
+    """
     db = SessionLocal()
     try:
         # Create schemas if they don't exist
-        for schema in ['auth', 'organization', 'assessments', 'analysis', 'correctives']:
+        for schema in ['auth', 'organization', 'assessments', 'analysis', 'correctives', 'jobs']:
             db.execute(text(f'CREATE SCHEMA IF NOT EXISTS {schema}'))
         db.commit()
     finally:
@@ -35,11 +59,17 @@ def init_db():
     print("Database tables created successfully")
 
     # Run migrations for schema changes
-    run_migrations()
+    return run_migrations()
+
 
+def run_migrations() -> bool:
+    """Run database migrations for schema changes.
 
-def run_migrations():
-    """Run database migrations for schema changes."""
+    Failures are reported but not raised, so the API still starts; the
+    return value says whether every step succeeded, so the bootstrap can be
+    retried on the next start.
+    """
+    migrated = True
     db = SessionLocal()
     try:
         # Migration: Add sport_id column to players table if it doesn't exist
@@ -57,13 +87,165 @@ def run_migrations():
             """))
             db.commit()
             print("Migration: Added sport_id column to players table")
+
+        # Migration: Add persisted score columns to sessions table
+        for column_name, column_type in [
+            ("overall_score", "NUMERIC(5, 2)"),
+            ("color", "VARCHAR(10)"),
+            ("category_scores", "JSONB"),
+        ]:
+            db.execute(text(f"""
+                ALTER TABLE assessments.sessions
+                ADD COLUMN IF NOT EXISTS {column_name} {column_type}
+            """))
+        db.commit()
+
+        # Migration: Indexes backing keyset pagination on existing tables
+        for index_name, table_name, columns in [
+            ("ix_players_name_order", "organization.players", "last_name, first_name, id"),
+            ("ix_teams_name_order", "organization.teams", "name, id"),
+            ("ix_sessions_date_order", "assessments.sessions", "assessment_date, id"),
+        ]:
+            db.execute(text(f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {table_name} ({columns})
+            """))
+        db.commit()
+
+        # Migration: Treat a NULL side as a value in the result unique keys
+        # (PostgreSQL 15+), so bulk upserts see results without a side. The
+        # old key let a test have several results without a side; only the
+        # newest of those is kept.
+        for table_name, constraint_name in [
+            ("onbaseu_results", "uq_onbaseu_session_test_side"),
+            ("pitcher_onbaseu_results", "uq_pitcher_onbaseu_session_test_side"),
+            ("tpi_power_results", "uq_tpi_power_session_test_side"),
+        ]:
+            result = db.execute(text("""
+                SELECT i.indnullsnotdistinct
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'assessments' AND c.relname = :name
+            """), {"name": constraint_name}).fetchone()
+            if result is not None and not result[0]:
+                removed = db.execute(text(f"""
+                    DELETE FROM assessments.{table_name} r
+                    USING (
+                        SELECT id, row_number() OVER (
+                            PARTITION BY session_id, test_code
+                            ORDER BY created_at DESC NULLS LAST, id DESC
+                        ) AS rn
+                        FROM assessments.{table_name}
+                        WHERE side IS NULL
+                    ) d
+                    WHERE r.id = d.id AND d.rn > 1
+                """)).rowcount
+                if removed:
+                    print(f"Migration: Removed {removed} duplicate results without a side "
+                          f"from {table_name}, keeping the newest per session and test")
+                db.execute(text(f"""
+                    ALTER TABLE assessments.{table_name}
+                    DROP CONSTRAINT {constraint_name},
+                    ADD CONSTRAINT {constraint_name}
+                        UNIQUE NULLS NOT DISTINCT (session_id, test_code, side)
+                """))
+        db.commit()
     except Exception as e:
         print(f"Migration warning: {e}")
         db.rollback()
+        migrated = False
+    finally:
+        db.close()
+
+    search_indexed = create_search_indexes()
+    kams_indexed = create_kams_measurement_indexes()
+    return migrated and search_indexed and kams_indexed
+
+
+def create_search_indexes() -> bool:
+    """Create the pg_trgm indexes behind player search.
+
+    Kept apart from the table metadata so a server without the pg_trgm
+    extension still starts; search then falls back to plain substring
+    matching. Returns False if creating them failed (a server without the
+    extension counts as done, there is nothing to retry).
+    """
+    db = SessionLocal()
+    try:
+        available = db.execute(
+            text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).scalar()
+        if not available:
+            print("Migration: pg_trgm is not available, player search uses substring matching")
+            return True
+        db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        db.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_players_search_name_trgm
+            ON organization.players USING gin ((first_name || ' ' || last_name) gin_trgm_ops)
+        """))
+        db.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_players_code_trgm
+            ON organization.players USING gin (player_code gin_trgm_ops)
+        """))
+        db.commit()
+        return True
+    except Exception as e:
+        print(f"Migration warning: player search indexes not created: {e}")
+        db.rollback()
+        return False
     finally:
         db.close()
 
 
+def create_kams_measurement_indexes() -> bool:
+    """Create the expression indexes behind KAMS measurement queries.
+
+    Returns False if creating them failed.
+    """
+    db = SessionLocal()
+    try:
+        create_measurement_indexes(db)
+        db.commit()
+        return True
+    except Exception as e:
+        print(f"Migration warning: KAMS measurement indexes not created: {e}")
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def backfill_analytics() -> bool:
+    """Score existing sessions and fill the analytics cube after an upgrade.
+
+    Sessions and the cube are kept up to date as results are written, so
+    this only does work on a database from before persisted session scores
+    and the cube: while the cube is empty but complete sessions exist.
+    Returns False if the backfill failed.
+    """
+    db = SessionLocal()
+    try:
+        cube_empty = not db.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM analysis.session_score_aggregates)"
+        )).scalar()
+        has_sessions = db.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM assessments.sessions WHERE is_complete)"
+        )).scalar()
+    finally:
+        db.close()
+    if not (cube_empty and has_sessions):
+        return True
+
+    try:
+        updated = backfill_session_scores()
+        print(f"Migration: Scored {updated} existing sessions and rebuilt the analytics cube")
+        return True
+    except Exception as e:
+        print(f"Migration warning: session score backfill failed: {e}")
+        return False
+
+
 def create_initial_admin():
     """Create initial admin user if no users exist."""
     db = SessionLocal()
@@ -270,21 +452,24 @@ def create_sample_players():
         db.close()
 
 
-def seed_rit_baseball_roster():
-    """Seed RIT Baseball roster players (2025 roster, excluding Gr. and Sr. except Wozny brothers)."""
+def seed_rit_baseball_roster() -> bool:
+    """Seed RIT Baseball roster players (2025 roster, excluding Gr. and Sr. except Wozny brothers).
+
+    Returns False if seeding failed.
+    """
     db = SessionLocal()
     try:
         # Get Baseball sport ID
         baseball = db.query(Sport).filter(Sport.code == "baseball").first()
         if not baseball:
             print("Baseball sport not found, skipping RIT Baseball roster seeding")
-            return
+            return True
 
         # Check if we already have these players (check for a known player code)
         existing = db.query(Player).filter(Player.player_code == "P20250001").first()
         if existing:
             print("RIT Baseball roster already seeded, skipping")
-            return
+            return True
 
         # RIT Baseball 2025 Roster - Eligible players (Fr, So, Jr + Wozny exceptions)
         # Excluded: Gr./Sr. (except Wozny), Luc Rising, Kevin McNulty, Leo Miksitz,
@@ -354,24 +539,76 @@ def seed_rit_baseball_roster():
 
         db.commit()
         print(f"Seeded {created_count} RIT Baseball roster players")
+        return True
     except Exception as e:
         print(f"Error seeding RIT Baseball roster: {e}")
         db.rollback()
+        return False
     finally:
         db.close()
 
 
+def bootstrap_database() -> bool:
+    """Create schemas and tables, apply migrations and seed initial data.
+
+    Returns whether every step succeeded.
+    """
+    with timed_phase("schema and migrations"):
+        migrated = init_db()
+    with timed_phase("seed data"):
+        create_initial_admin()
+        create_initial_sports()
+        create_sample_players()
+        seeded = seed_rit_baseball_roster()
+    with timed_phase("analytics backfill"):
+        backfilled = backfill_analytics()
+    return migrated and seeded and backfilled
+
+
+def run_startup():
+    """Bootstrap the database according to STARTUP_SCHEMA_MODE.
+
+    "always" bootstraps on every start, "fingerprint" only when the stored
+    schema/seed fingerprint differs from the models, and "none" leaves the
+    schema to Alembic revisions. The fingerprint is only stored once every
+    bootstrap step succeeded, so a failed step is retried on the next start.
+    """
+    mode = settings.STARTUP_SCHEMA_MODE
+    if mode == "none":
+        print("Startup: STARTUP_SCHEMA_MODE=none, skipping DDL and seeding")
+        return
+    if mode == "always":
+        bootstrap_database()
+        return
+
+    with timed_phase("fingerprint check"):
+        fingerprint = get_schema_fingerprint()
+        with engine.connect() as conn:
+            stored = get_stored_fingerprint(conn)
+    if stored == fingerprint:
+        print("Startup: schema fingerprint matches, skipping DDL and seeding")
+        return
+
+    with engine.connect() as conn, bootstrap_lock(conn):
+        # Another worker may have bootstrapped while we waited for the lock
+        if get_stored_fingerprint(conn) != fingerprint:
+            if bootstrap_database():
+                store_fingerprint(conn, fingerprint)
+                conn.commit()
+            else:
+                print("Startup: bootstrap incomplete, it will run again on the next start")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    init_db()
-    create_initial_admin()
-    create_initial_sports()
-    create_sample_players()
-    seed_rit_baseball_roster()
+    with timed_phase("total"):
+        run_startup()
     yield
     # Shutdown
-    pass
+    if async_engine is not None:
+        await async_engine.dispose()
+    shutdown_hash_pool()
 
 
 app = FastAPI(
@@ -388,8 +625,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, INSERTED_HEADER, EXISTING_HEADER, "Location"],
 )
 
+if settings.METRICS_ENABLED:
+    # Added last so it is the outermost middleware and times whole requests
+    app.add_middleware(MetricsMiddleware)
+    pool_engines = {"sync": engine}
+    instrument_engine(engine)
+    if async_engine is not None:
+        pool_engines["async"] = async_engine
+        instrument_engine(async_engine.sync_engine)
+    metrics.register_collector(pool_collector(pool_engines))
+
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
@@ -404,3 +652,14 @@ async def root():
         "message": "Sports Performance API",
         "docs": f"{settings.API_V1_PREFIX}/docs",
     }
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics(request: Request):
+        """Request, SQL, scoring and connection pool metrics in Prometheus text format."""
+        if settings.METRICS_TOKEN and not secrets.compare_digest(
+            request.headers.get("authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+        ):
+            raise UnauthorizedException("Invalid metrics token")
+        return Response(metrics.render(), media_type=METRICS_CONTENT_TYPE)
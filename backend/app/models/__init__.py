@@ -9,6 +9,9 @@ from app.models.tpi_power import TPIPowerResult
 from app.models.sprint import SprintResult
 from app.models.kams import KAMSResult
 from app.models.corrective import Exercise, ExerciseMapping
+from app.models.analysis import SessionScoreAggregate, AnalysisCacheGeneration
+from app.models.rescore import RescoreCheckpoint
+from app.models.job import Job
 
 __all__ = [
     "User",
@@ -25,4 +28,8 @@ __all__ = [
     "KAMSResult",
     "Exercise",
     "ExerciseMapping",
+    "SessionScoreAggregate",
+    "AnalysisCacheGeneration",
+    "RescoreCheckpoint",
+    "Job",
 ]
@@ -0,0 +1,61 @@
+from sqlalchemy import Column, String, Integer, Date, DateTime, Numeric, BigInteger, Index
+from datetime import datetime
+from app.db.base import Base
+
+
+class SessionScoreAggregate(Base):
+    """Pre-aggregated session scores per day, maintained with GROUPING SETS.
+
+    ``grouping_id`` is ``GROUPING(team_id, sport_id, position_group, graduation_year)``:
+    a set bit means that dimension is rolled up (NULL here means "all"),
+    which keeps roll-up rows distinct from players with no team or sport.
+    """
+
+    __tablename__ = "session_score_aggregates"
+    __table_args__ = (
+        Index(
+            "ix_session_score_aggregates_team",
+            "grouping_id", "assessment_type", "team_id", "bucket_date",
+        ),
+        Index(
+            "ix_session_score_aggregates_sport",
+            "grouping_id", "assessment_type", "sport_id", "bucket_date",
+        ),
+        Index("ix_session_score_aggregates_slice", "bucket_date", "assessment_type"),
+        {"schema": "analysis"},
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    grouping_id = Column(Integer, nullable=False)
+    bucket_date = Column(Date, nullable=False)
+    assessment_type = Column(String(50), nullable=False)
+
+    # Dimensions (NULL when rolled up, see grouping_id)
+    team_id = Column(Integer, nullable=True)
+    sport_id = Column(Integer, nullable=True)
+    position_group = Column(String(20), nullable=True)  # 'pitcher', 'position', 'two_way'
+    graduation_year = Column(Integer, nullable=True)
+
+    # Measures over sessions.overall_score
+    session_count = Column(Integer, nullable=False)
+    score_sum = Column(Numeric(14, 4), nullable=False)
+    score_sum_sq = Column(Numeric(18, 4), nullable=False)
+    score_min = Column(Numeric(5, 2), nullable=True)
+    score_max = Column(Numeric(5, 2), nullable=True)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class AnalysisCacheGeneration(Base):
+    """Single-row counter bumped by writes that invalidate every process's analysis cache.
+
+    Each process polls it (see ANALYSIS_CACHE_SYNC_SECONDS) and clears its
+    cache when it changes, e.g. after a rescore run by the job worker.
+    """
+
+    __tablename__ = "cache_generation"
+    __table_args__ = {"schema": "analysis"}
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Boolean, Date, DateTime, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Boolean, Date, DateTime, Text, ForeignKey, UniqueConstraint, Numeric, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
 import uuid
 from app.db.base import Base
@@ -12,6 +12,8 @@ class AssessmentSession(Base):
     __tablename__ = "sessions"
     __table_args__ = (
         UniqueConstraint("player_id", "assessment_type", "assessment_date", name="uq_session_player_type_date"),
+        # Keyset pagination order of the session list (newest first)
+        Index("ix_sessions_date_order", "assessment_date", "id"),
         {"schema": "assessments"},
     )
 
@@ -27,6 +29,12 @@ class AssessmentSession(Base):
     assessed_by = Column(UUID(as_uuid=True), ForeignKey("auth.users.id"), nullable=True)
     notes = Column(Text, nullable=True)
     is_complete = Column(Boolean, default=False)
+
+    # Computed scoring (kept in sync with the session's results)
+    overall_score = Column(Numeric(5, 2), nullable=True)
+    color = Column(String(10), nullable=True)
+    category_scores = Column(JSONB, nullable=True)
+
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -0,0 +1,50 @@
+from sqlalchemy import Column, String, Integer, Text, Boolean, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+import uuid
+from app.db.base import Base
+
+
+class Job(Base):
+    """A unit of background work, claimed by workers with FOR UPDATE SKIP LOCKED."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # What workers claim from: queued jobs, highest priority and oldest run_at first
+        Index(
+            "ix_jobs_claim_order", text("priority DESC"), "run_at", "id",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        # Running jobs, for finding workers that stopped heartbeating
+        Index("ix_jobs_running_heartbeat", "heartbeat_at", postgresql_where=text("status = 'running'")),
+        # Keyset pagination order of the job list (newest first)
+        Index("ix_jobs_created_order", "created_at", "id"),
+        {"schema": "jobs"},
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_type = Column(String(50), nullable=False, index=True)
+    payload = Column(JSONB, nullable=False, default=dict)
+
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, completed, failed, cancelled
+    priority = Column(Integer, nullable=False, default=0)  # higher runs first
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # not claimed before this time
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+
+    # Claiming worker ("host:pid") and its last sign of life
+    locked_by = Column(String(255), nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    progress_current = Column(Integer, nullable=True)
+    progress_total = Column(Integer, nullable=True)
+    progress_message = Column(String(255), nullable=True)
+    result = Column(JSONB, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_by = Column(UUID(as_uuid=True), ForeignKey("auth.users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
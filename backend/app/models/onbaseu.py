@@ -11,8 +11,10 @@ class OnBaseUResult(Base):
 
     __tablename__ = "onbaseu_results"
     __table_args__ = (
+        # A result with no side is unique too, so ON CONFLICT upserts match it
         UniqueConstraint(
-            "session_id", "test_code", "side", name="uq_onbaseu_session_test_side"
+            "session_id", "test_code", "side", name="uq_onbaseu_session_test_side",
+            postgresql_nulls_not_distinct=True,
         ),
         CheckConstraint("score BETWEEN 1 AND 3", name="ck_onbaseu_score_range"),
         CheckConstraint(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, Date, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, Date, DateTime, ForeignKey, Index, literal_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
@@ -8,7 +8,11 @@ from app.db.base import Base
 
 class Player(Base):
     __tablename__ = "players"
-    __table_args__ = {"schema": "organization"}
+    __table_args__ = (
+        # Keyset pagination order of the player list
+        Index("ix_players_name_order", "last_name", "first_name", "id"),
+        {"schema": "organization"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     player_code = Column(String(20), unique=True, nullable=False, index=True)
@@ -49,3 +53,8 @@ class Player(Base):
     def display_name(self) -> str:
         team_name = self.team.name if self.team else "No Team"
         return f"{self.full_name} (Team: {team_name})"
+
+
+# "First Last", as matched by player search. The trigram index created in
+# create_search_indexes() is built on exactly this expression.
+PLAYER_SEARCH_NAME = Player.first_name + literal_column("' '", String) + Player.last_name
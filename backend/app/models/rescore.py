@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+from app.db.base import Base
+
+
+class RescoreCheckpoint(Base):
+    """Progress of a historical rescoring run, one row per result table."""
+
+    __tablename__ = "rescore_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("job_name", "result_type", name="uq_rescore_checkpoint_job_type"),
+        {"schema": "assessments"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_name = Column(String(100), nullable=False, index=True)
+    result_type = Column(String(50), nullable=False)
+
+    # Keyset position: rows with id > last_id remain to be rescored
+    last_id = Column(UUID(as_uuid=True), nullable=True)
+
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, completed, failed
+    total_rows = Column(Integer, nullable=True)
+    rows_processed = Column(Integer, nullable=False, default=0)
+    rows_changed = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -6,7 +6,11 @@ from app.db.base import Base
 
 class Team(Base):
     __tablename__ = "teams"
-    __table_args__ = {"schema": "organization"}
+    __table_args__ = (
+        # Keyset pagination order of the team list
+        Index("ix_teams_name_order", "name", "id"),
+        {"schema": "organization"},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)
@@ -11,8 +11,10 @@ class TPIPowerResult(Base):
 
     __tablename__ = "tpi_power_results"
     __table_args__ = (
+        # A result with no side is unique too, so ON CONFLICT upserts match it
         UniqueConstraint(
-            "session_id", "test_code", "side", name="uq_tpi_power_session_test_side"
+            "session_id", "test_code", "side", name="uq_tpi_power_session_test_side",
+            postgresql_nulls_not_distinct=True,
         ),
         CheckConstraint(
             "color IN ('blue', 'green', 'yellow', 'red')", name="ck_tpi_power_color_valid"
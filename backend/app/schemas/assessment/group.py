@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from typing import Optional, Literal, List, Dict, Any
+from datetime import date
+from uuid import UUID
+
+from app.schemas.assessment.session import AssessmentType
+
+
+class GroupPlayerResults(BaseModel):
+    player_id: UUID
+    notes: Optional[str] = None
+    # Validated against the assessment type's result create schema
+    results: List[Dict[str, Any]] = []
+
+
+class GroupAssessmentCreate(BaseModel):
+    team_id: int
+    assessment_type: AssessmentType
+    assessment_date: date
+    players: List[GroupPlayerResults]
+    complete: bool = False
+    on_conflict: Literal["skip", "overwrite"] = "skip"
+
+
+class GroupPlayerOutcome(BaseModel):
+    player_id: UUID
+    player_name: Optional[str] = None
+    status: Literal["created", "resumed", "error"]
+    session_id: Optional[UUID] = None
+    results_inserted: int = 0
+    results_existing: int = 0
+    is_complete: bool = False
+    overall_score: Optional[float] = None
+    color: Optional[str] = None
+    error: Optional[str] = None
+
+
+class GroupAssessmentResponse(BaseModel):
+    team_id: int
+    assessment_type: AssessmentType
+    assessment_date: date
+    players: List[GroupPlayerOutcome]
@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import Optional, List
+
+from app.schemas.assessment.session import AssessmentType
+
+
+class ImportRowError(BaseModel):
+    line: int
+    player_code: Optional[str] = None
+    error: str
+
+
+class ResultImportSummary(BaseModel):
+    assessment_type: AssessmentType
+    dry_run: bool
+    rows_read: int = 0
+    rows_failed: int = 0
+    sessions_created: int = 0
+    sessions_existing: int = 0
+    results_inserted: int = 0
+    results_existing: int = 0
+    # Only the first errors are listed; rows_failed has the full count
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False
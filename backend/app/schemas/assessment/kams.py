@@ -1,6 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional, Literal, Dict, Any, List
-from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, Literal, Dict, Any, List, Tuple
+from datetime import date, datetime
 from uuid import UUID
 
 
@@ -125,3 +125,67 @@ KAMS_TESTS: List[KAMSTestDefinition] = [
         ],
     ),
 ]
+
+
+# Measurement fields by test type, and each test's left/right field pairs
+# keyed by the measurement they share (e.g. "ankle_dorsiflexion")
+KAMS_MEASUREMENT_FIELDS: Dict[str, List[str]] = {
+    test.test_type: test.measurement_fields for test in KAMS_TESTS
+}
+KAMS_MEASUREMENT_PAIRS: Dict[str, Dict[str, Tuple[str, str]]] = {
+    test_type: {
+        field[: -len("_left")]: (field, field[: -len("_left")] + "_right")
+        for field in fields
+        if field.endswith("_left") and field[: -len("_left")] + "_right" in fields
+    }
+    for test_type, fields in KAMS_MEASUREMENT_FIELDS.items()
+}
+
+
+class KAMSMeasurementFilter(BaseModel):
+    """One predicate over a KAMS measurement.
+
+    ``metric="value"`` compares a measurement field (``hip_internal_rotation_left``);
+    ``metric="asymmetry"`` compares the left/right difference of a paired
+    measurement (``ankle_dorsiflexion``) as a percentage of the larger side.
+    """
+
+    test_type: Literal["rom", "squat", "lunge", "balance", "jump"]
+    field: str
+    metric: Literal["value", "asymmetry"] = "value"
+    op: Literal["lt", "lte", "gt", "gte", "eq"]
+    value: float
+
+    @model_validator(mode="after")
+    def check_field(self):
+        if self.metric == "value":
+            if self.field not in KAMS_MEASUREMENT_FIELDS[self.test_type]:
+                raise ValueError(f"Unknown {self.test_type} measurement field: {self.field}")
+        elif self.field not in KAMS_MEASUREMENT_PAIRS[self.test_type]:
+            raise ValueError(f"{self.test_type} has no left/right measurement named {self.field}")
+        return self
+
+
+class KAMSMeasurementQuery(BaseModel):
+    filters: List[KAMSMeasurementFilter] = Field(..., min_length=1, max_length=20)
+    # "all": every filter must hold; "any": at least one
+    match: Literal["all", "any"] = "all"
+    team_id: Optional[int] = None
+    sport_id: Optional[int] = None
+    player_id: Optional[UUID] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    is_complete: Optional[bool] = None
+
+
+class KAMSMeasurementMatch(BaseModel):
+    session_id: UUID
+    assessment_date: date
+    player_id: UUID
+    player_code: Optional[str] = None
+    first_name: str
+    last_name: str
+    team_id: Optional[int] = None
+    # Value of each filter, keyed "<test_type>.<field>" (values) or
+    # "<test_type>.<field>.asymmetry"
+    values: Dict[str, Optional[float]]
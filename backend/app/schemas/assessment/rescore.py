@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from typing import Optional, Literal, List
+from datetime import datetime
+from uuid import UUID
+
+
+RescoreResultType = Literal["onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"]
+
+
+class RescoreRequest(BaseModel):
+    job_name: str
+    result_types: List[RescoreResultType] = ["onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"]
+    restart: bool = False
+    batch_size: int = 1000
+
+
+class RescoreCheckpointResponse(BaseModel):
+    job_name: str
+    result_type: str
+    status: str
+    last_id: Optional[UUID] = None
+    total_rows: Optional[int] = None
+    rows_processed: int
+    rows_changed: int
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,8 +1,14 @@
 from pydantic import BaseModel
-from typing import Optional, Literal, List, Any
+from typing import Optional, Literal, List, Union
 from datetime import datetime, date
 from uuid import UUID
 
+from app.schemas.assessment.onbaseu import OnBaseUResultResponse
+from app.schemas.assessment.pitcher_onbaseu import PitcherOnBaseUResultResponse
+from app.schemas.assessment.tpi_power import TPIPowerResultResponse
+from app.schemas.assessment.sprint import SprintResultResponse
+from app.schemas.assessment.kams import KAMSResultResponse
+
 
 AssessmentType = Literal["onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"]
 
@@ -30,6 +36,8 @@ class SessionResponse(SessionBase):
     assessed_by: Optional[UUID] = None
     assessed_by_name: Optional[str] = None
     is_complete: bool
+    overall_score: Optional[float] = None
+    color: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -37,6 +45,15 @@ class SessionResponse(SessionBase):
         from_attributes = True
 
 
+SessionResult = Union[
+    OnBaseUResultResponse,
+    PitcherOnBaseUResultResponse,
+    TPIPowerResultResponse,
+    SprintResultResponse,
+    KAMSResultResponse,
+]
+
+
 class SessionWithResults(SessionResponse):
-    results: List[Any] = []
+    results: List[SessionResult] = []
     summary: Optional[dict] = None
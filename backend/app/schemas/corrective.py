@@ -0,0 +1,99 @@
+from pydantic import BaseModel
+from typing import Optional, Literal, List
+from datetime import date, datetime
+from uuid import UUID
+
+# Assessment types whose results map to corrective exercises
+CorrectiveAssessmentType = Literal["onbaseu", "pitcher_onbaseu"]
+ResultCondition = Literal["fail", "neutral", "asymmetry"]
+
+
+class ExerciseBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+    body_part: Optional[str] = None
+    movement_category: Optional[str] = None
+    difficulty_level: Optional[str] = None
+    video_url: Optional[str] = None
+    instructions: Optional[str] = None
+
+
+class ExerciseCreate(ExerciseBase):
+    pass
+
+
+class ExerciseResponse(ExerciseBase):
+    id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ExerciseMappingCreate(BaseModel):
+    assessment_type: CorrectiveAssessmentType
+    test_code: str
+    result_condition: ResultCondition
+    exercise_id: int
+    # 1 is the most important
+    priority: int = 1
+
+
+class ExerciseMappingResponse(ExerciseMappingCreate):
+    id: int
+
+    class Config:
+        from_attributes = True
+
+
+class CorrectiveFinding(BaseModel):
+    test_code: str
+    test_name: str
+    side: Optional[str] = None
+    condition: ResultCondition
+    # The recorded result; "left/right" results for an asymmetry
+    result: str
+
+
+class ExerciseRecommendation(BaseModel):
+    exercise_id: int
+    name: str
+    body_part: Optional[str] = None
+    movement_category: Optional[str] = None
+    difficulty_level: Optional[str] = None
+    video_url: Optional[str] = None
+    # Best (lowest) priority of the mappings that recommend it
+    priority: int
+    reasons: List[CorrectiveFinding]
+
+
+class SessionRecommendations(BaseModel):
+    session_id: UUID
+    player_id: UUID
+    player_name: Optional[str] = None
+    assessment_type: CorrectiveAssessmentType
+    assessment_date: date
+    exercises: List[ExerciseRecommendation]
+    # Findings no exercise is mapped to
+    unmapped: List[CorrectiveFinding]
+
+
+class TeamExerciseRecommendation(BaseModel):
+    exercise_id: int
+    name: str
+    body_part: Optional[str] = None
+    movement_category: Optional[str] = None
+    difficulty_level: Optional[str] = None
+    video_url: Optional[str] = None
+    priority: int
+    player_count: int
+    player_ids: List[UUID]
+
+
+class TeamRecommendations(BaseModel):
+    team_id: int
+    team_name: str
+    # Exercises across the roster, those most players need first
+    exercises: List[TeamExerciseRecommendation]
+    # Each player's latest complete session per assessment type
+    players: List[SessionRecommendations]
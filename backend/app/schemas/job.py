@@ -0,0 +1,42 @@
+from pydantic import BaseModel, Field
+from typing import Optional, Literal, Dict, Any
+from datetime import datetime
+from uuid import UUID
+
+JobStatus = Literal["queued", "running", "completed", "failed", "cancelled"]
+
+
+class JobCreate(BaseModel):
+    job_type: str
+    payload: Dict[str, Any] = {}
+    priority: int = 0
+    max_attempts: Optional[int] = Field(None, ge=1, le=20)
+    # Not run before this time (UTC); defaults to now
+    run_at: Optional[datetime] = None
+
+
+class JobResponse(BaseModel):
+    id: UUID
+    job_type: str
+    payload: Dict[str, Any]
+    status: JobStatus
+    priority: int
+    run_at: datetime
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    locked_by: Optional[str] = None
+    heartbeat_at: Optional[datetime] = None
+    progress_current: Optional[int] = None
+    progress_total: Optional[int] = None
+    progress_message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    last_error: Optional[str] = None
+    created_by: Optional[UUID] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
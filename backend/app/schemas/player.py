@@ -70,6 +70,12 @@ class PlayerListResponse(BaseModel):
         from_attributes = True
 
 
+class PlayerSearchResult(PlayerListResponse):
+    # Trigram similarity to the best matching name word or player code;
+    # None when the server lacks pg_trgm and search falls back to substrings
+    score: Optional[float] = None
+
+
 class PlayerWithAssessments(PlayerResponse):
     assessment_count: int
     latest_assessment_date: Optional[date] = None
@@ -0,0 +1,64 @@
+"""Populate persisted session scores for existing assessment sessions.
+
+Usage:
+    python -m app.scripts.backfill_session_scores [--all] [--batch-size N]
+"""
+import argparse
+
+from app.db.session import SessionLocal
+from app.models import AssessmentSession
+from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.services.analysis.analytics_cube import AnalyticsCubeService
+from app.services.analysis.cache import bump_shared_generation
+
+
+def backfill_session_scores(rescore_all: bool = False, batch_size: int = 500) -> int:
+    """Score sessions in id-ordered batches, then rebuild the analytics cube."""
+    db = SessionLocal()
+    updated = 0
+    last_id = None
+    try:
+        service = PlayerAnalysisService(db)
+        while True:
+            query = db.query(AssessmentSession.id)
+            if not rescore_all:
+                query = query.filter(AssessmentSession.overall_score.is_(None))
+            if last_id is not None:
+                query = query.filter(AssessmentSession.id > last_id)
+
+            session_ids = [
+                row.id for row in query.order_by(AssessmentSession.id).limit(batch_size).all()
+            ]
+            if not session_ids:
+                break
+
+            for session_id in session_ids:
+                service.refresh_session_scores(session_id, refresh_cube=False)
+
+            db.commit()
+            db.expunge_all()
+            updated += len(session_ids)
+            last_id = session_ids[-1]
+            print(f"Scored {updated} sessions")
+
+        AnalyticsCubeService(db).rebuild()
+        bump_shared_generation(db)
+        db.commit()
+    finally:
+        db.close()
+
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill persisted session scores.")
+    parser.add_argument("--all", action="store_true", help="Rescore sessions that already have scores")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    updated = backfill_session_scores(rescore_all=args.all, batch_size=args.batch_size)
+    print(f"Backfill complete: {updated} sessions scored")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""Recompute the analysis.session_score_aggregates cube from all completed sessions.
+
+Usage:
+    python -m app.scripts.rebuild_analytics_cube
+"""
+from app.db.session import SessionLocal
+from app.services.analysis.analytics_cube import AnalyticsCubeService
+from app.services.analysis.cache import bump_shared_generation
+
+
+def main():
+    db = SessionLocal()
+    try:
+        AnalyticsCubeService(db).rebuild()
+        bump_shared_generation(db)
+        db.commit()
+        print("Analytics cube rebuilt")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
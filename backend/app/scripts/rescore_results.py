@@ -0,0 +1,48 @@
+"""Rescore stored results against the current scoring thresholds.
+
+Usage:
+    python -m app.scripts.rescore_results JOB_NAME [--types tpi_power sprint] [--restart] [--batch-size N]
+
+Re-running with the same JOB_NAME resumes from the last committed batch.
+Refuses to run while a "rescore" background job for JOB_NAME is queued or
+running.
+"""
+import argparse
+import sys
+
+from app.db.session import SessionLocal
+from app.services.assessment.rescoring_service import RescoringService, RESCORE_RESULT_TYPES
+from app.services.jobs import find_active_job
+
+
+def print_progress(checkpoint):
+    total = checkpoint.total_rows or 0
+    percent = (checkpoint.rows_processed / total * 100) if total else 100.0
+    print(
+        f"[{checkpoint.result_type}] {checkpoint.status}: "
+        f"{checkpoint.rows_processed}/{total} rows ({percent:.1f}%), "
+        f"{checkpoint.rows_changed} changed"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rescore stored assessment results.")
+    parser.add_argument("job_name", help="Checkpoint name; reuse it to resume an interrupted run")
+    parser.add_argument("--types", nargs="+", choices=RESCORE_RESULT_TYPES, default=RESCORE_RESULT_TYPES)
+    parser.add_argument("--restart", action="store_true", help="Ignore saved checkpoints and start over")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        active = find_active_job(db, "rescore", {"job_name": args.job_name})
+        if active is not None:
+            sys.exit(f"Rescoring job {args.job_name} is already {active.status} as background job {active.id}")
+        service = RescoringService(db, batch_size=args.batch_size)
+        service.run(args.job_name, args.types, restart=args.restart, progress=print_progress)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
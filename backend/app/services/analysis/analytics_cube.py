@@ -0,0 +1,256 @@
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+from datetime import date
+from uuid import UUID
+import math
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.models import AssessmentSession, SessionScoreAggregate
+
+# GROUPING(team_id, sport_id, position_group, graduation_year) for each stored grouping set
+GROUPING_ALL = 0b1111
+GROUPING_TEAM = 0b0111
+GROUPING_TEAM_POSITION = 0b0101
+GROUPING_SPORT = 0b1011
+GROUPING_SPORT_POSITION = 0b1001
+GROUPING_SPORT_GRADUATION_YEAR = 0b1010
+
+# Advisory lock serialising cube writes: slice refreshes hold it shared plus
+# an exclusive (this id, hash of the slice) lock; rebuild() holds it exclusive
+_CUBE_LOCK_ID = 0x5350_0002
+
+# Player fields copied into cube rows (position_group derives from the flags)
+CUBE_PLAYER_FIELDS = ("team_id", "sport_id", "graduation_year", "is_pitcher", "is_position_player")
+
+_REFRESH_SQL = """
+    INSERT INTO analysis.session_score_aggregates (
+        grouping_id, bucket_date, assessment_type,
+        team_id, sport_id, position_group, graduation_year,
+        session_count, score_sum, score_sum_sq, score_min, score_max, updated_at
+    )
+    SELECT
+        GROUPING(src.team_id, src.sport_id, src.position_group, src.graduation_year),
+        src.assessment_date,
+        src.assessment_type,
+        src.team_id,
+        src.sport_id,
+        src.position_group,
+        src.graduation_year,
+        COUNT(*),
+        SUM(src.overall_score),
+        SUM(src.overall_score * src.overall_score),
+        MIN(src.overall_score),
+        MAX(src.overall_score),
+        now()
+    FROM (
+        SELECT
+            s.assessment_date,
+            s.assessment_type,
+            s.overall_score,
+            p.team_id,
+            p.sport_id,
+            p.graduation_year,
+            CASE
+                WHEN p.is_pitcher AND p.is_position_player THEN 'two_way'
+                WHEN p.is_pitcher THEN 'pitcher'
+                ELSE 'position'
+            END AS position_group
+        FROM assessments.sessions s
+        JOIN organization.players p ON p.id = s.player_id
+        WHERE s.is_complete = true
+          AND s.overall_score IS NOT NULL
+          {slice_filter}
+    ) AS src
+    GROUP BY src.assessment_date, src.assessment_type, GROUPING SETS (
+        (),
+        (src.team_id),
+        (src.team_id, src.position_group),
+        (src.sport_id),
+        (src.sport_id, src.position_group),
+        (src.sport_id, src.graduation_year)
+    )
+"""
+
+
+class AnalyticsCubeService:
+    """Maintains and reads the pre-aggregated session score cube.
+
+    The cube is kept current one (date, assessment type) slice at a time:
+    a slice is deleted and recomputed from its completed sessions whenever
+    one of them changes, so updates touch only a single day of one
+    assessment type.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_slice(self, bucket_date: date, assessment_type: str) -> None:
+        """Recompute all aggregate rows for one day of one assessment type.
+
+        The slice is locked until the transaction ends, so concurrent
+        refreshes of the same slice (or a rebuild) wait for this one to
+        commit instead of inserting a second copy of its rows.
+        """
+        params = {"bucket_date": bucket_date, "assessment_type": assessment_type}
+        self.db.execute(text("SELECT pg_advisory_xact_lock_shared(:cube)"), {"cube": _CUBE_LOCK_ID})
+        self.db.execute(
+            text("""
+                SELECT pg_advisory_xact_lock(
+                    :cube, hashtext(CAST(:bucket_date AS text) || ':' || :assessment_type)
+                )
+            """),
+            {"cube": _CUBE_LOCK_ID, **params},
+        )
+        self.db.execute(
+            text("""
+                DELETE FROM analysis.session_score_aggregates
+                WHERE bucket_date = :bucket_date AND assessment_type = :assessment_type
+            """),
+            params,
+        )
+        self.db.execute(
+            text(_REFRESH_SQL.format(slice_filter=(
+                "AND s.assessment_date = :bucket_date AND s.assessment_type = :assessment_type"
+            ))),
+            params,
+        )
+
+    def refresh_slices(self, slices: Iterable[Tuple[date, str]]) -> None:
+        """Recompute several slices, locking them in a fixed order to avoid deadlocks."""
+        for bucket_date, assessment_type in sorted(set(slices)):
+            self.refresh_slice(bucket_date, assessment_type)
+
+    def refresh_player_slices(self, player_id: UUID) -> None:
+        """Recompute every slice holding one of a player's completed sessions.
+
+        Call after changing any of CUBE_PLAYER_FIELDS (and flushing), so the
+        player's history moves to their new team, sport or group.
+        """
+        self.refresh_slices(
+            self.db.query(AssessmentSession.assessment_date, AssessmentSession.assessment_type)
+            .filter(
+                AssessmentSession.player_id == player_id,
+                AssessmentSession.is_complete == True,
+                AssessmentSession.overall_score.isnot(None),
+            )
+            .distinct()
+            .all()
+        )
+
+    def rebuild(self) -> None:
+        """Recompute the whole cube from all completed sessions.
+
+        Waits for in-flight slice refreshes and blocks new ones until the
+        transaction ends.
+        """
+        self.db.execute(text("SELECT pg_advisory_xact_lock(:cube)"), {"cube": _CUBE_LOCK_ID})
+        self.db.execute(text("DELETE FROM analysis.session_score_aggregates"))
+        self.db.execute(text(_REFRESH_SQL.format(slice_filter="")))
+
+    def get_team_daily_scores(
+        self,
+        team_id: int,
+        assessment_type: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get per-day session counts and average scores for a team."""
+        query = self.db.query(SessionScoreAggregate).filter(
+            SessionScoreAggregate.grouping_id == GROUPING_TEAM,
+            SessionScoreAggregate.assessment_type == assessment_type,
+            SessionScoreAggregate.team_id == team_id,
+        )
+        if start_date:
+            query = query.filter(SessionScoreAggregate.bucket_date >= start_date)
+        if end_date:
+            query = query.filter(SessionScoreAggregate.bucket_date <= end_date)
+
+        return [
+            {
+                "date": row.bucket_date.isoformat(),
+                "average_score": float(row.score_sum) / row.session_count,
+                "assessment_count": row.session_count,
+            }
+            for row in query.order_by(SessionScoreAggregate.bucket_date).all()
+        ]
+
+    def get_sport_dashboard(
+        self,
+        sport_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Get score statistics for a sport, broken down by position group and class year."""
+        query = self.db.query(SessionScoreAggregate).filter(
+            SessionScoreAggregate.grouping_id.in_([
+                GROUPING_SPORT,
+                GROUPING_SPORT_POSITION,
+                GROUPING_SPORT_GRADUATION_YEAR,
+            ]),
+            SessionScoreAggregate.sport_id == sport_id,
+        )
+        if start_date:
+            query = query.filter(SessionScoreAggregate.bucket_date >= start_date)
+        if end_date:
+            query = query.filter(SessionScoreAggregate.bucket_date <= end_date)
+
+        # Combine daily buckets: counts and sums add, min/max fold
+        totals: Dict[str, Dict[str, Any]] = {}
+        for row in query.all():
+            assessment = totals.setdefault(row.assessment_type, {
+                "overall": {},
+                "by_position_group": {},
+                "by_graduation_year": {},
+            })
+            if row.grouping_id == GROUPING_SPORT:
+                bucket = assessment["overall"]
+            elif row.grouping_id == GROUPING_SPORT_POSITION:
+                bucket = assessment["by_position_group"].setdefault(row.position_group, {})
+            else:
+                bucket = assessment["by_graduation_year"].setdefault(row.graduation_year, {})
+            _merge_row(bucket, row)
+
+        return {
+            assessment_type: {
+                **_finalize(groups["overall"]),
+                "by_position_group": {
+                    key: _finalize(stats) for key, stats in groups["by_position_group"].items()
+                },
+                "by_graduation_year": {
+                    key: _finalize(stats) for key, stats in groups["by_graduation_year"].items()
+                },
+            }
+            for assessment_type, groups in totals.items()
+        }
+
+
+def _merge_row(stats: Dict[str, Any], row: SessionScoreAggregate) -> None:
+    """Fold one aggregate row into running totals."""
+    score_min = float(row.score_min) if row.score_min is not None else None
+    score_max = float(row.score_max) if row.score_max is not None else None
+    if not stats:
+        stats.update(count=0, total=0.0, total_sq=0.0, min=score_min, max=score_max)
+    stats["count"] += row.session_count
+    stats["total"] += float(row.score_sum)
+    stats["total_sq"] += float(row.score_sum_sq)
+    if score_min is not None:
+        stats["min"] = score_min if stats["min"] is None else min(stats["min"], score_min)
+    if score_max is not None:
+        stats["max"] = score_max if stats["max"] is None else max(stats["max"], score_max)
+
+
+def _finalize(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn running totals into count, average, standard deviation, min and max."""
+    count = stats.get("count", 0)
+    if not count:
+        return {"session_count": 0, "average": None, "std_dev": None, "min": None, "max": None}
+
+    average = stats["total"] / count
+    variance = max(stats["total_sq"] / count - average * average, 0.0)
+    return {
+        "session_count": count,
+        "average": average,
+        "std_dev": math.sqrt(variance),
+        "min": stats["min"],
+        "max": stats["max"],
+    }
@@ -0,0 +1,237 @@
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Numeric, Select, String, and_, case, cast, column, func, literal, null, select, union_all, values
+from sqlalchemy.orm import aliased
+
+from app.models import (
+    AssessmentSession,
+    KAMSResult,
+    OnBaseUResult,
+    PitcherOnBaseUResult,
+    Player,
+    SprintResult,
+    TPIPowerResult,
+)
+from app.schemas.assessment.kams import KAMS_MEASUREMENT_PAIRS
+from app.services.assessment.kams_query import asymmetry_pct, measurement_asymmetry, measurement_value
+
+# When a left/right pair is flagged. OnBaseU sides are flagged whenever they
+# score differently. The directional sprint (seconds) and the pitcher arm
+# comparison (percentage points) keep the thresholds of their scoring
+# services. TPI Power and KAMS pairs are compared by asymmetry_pct; their
+# scoring services have no asymmetry threshold, so those two percentages
+# are this report's own policy.
+ASYMMETRY_THRESHOLDS = {
+    "tpi_power_pct": 10.0,
+    "kams_pct": 15.0,
+    "sprint_seconds": 0.1,
+    "pitcher_arm_points": 15.0,
+}
+
+# 5-yard Directional - Left / - Right
+SPRINT_DIRECTIONAL_PAIR = ("SPR-02", "SPR-04")
+
+# Bilateral result tables paired by test code and side, with the value compared
+_SIDED_RESULTS = [
+    ("onbaseu", OnBaseUResult, "score"),
+    ("pitcher_onbaseu", PitcherOnBaseUResult, "score"),
+    ("tpi_power", TPIPowerResult, "result_value"),
+]
+
+
+def _latest_sessions(team_id: Optional[int], sport_id: Optional[int]):
+    """Each active player's latest complete session per assessment type."""
+    rn = func.row_number().over(
+        partition_by=(AssessmentSession.player_id, AssessmentSession.assessment_type),
+        order_by=(AssessmentSession.assessment_date.desc(), AssessmentSession.id.desc()),
+    ).label("rn")
+    ranked = (
+        select(
+            AssessmentSession.id,
+            AssessmentSession.player_id,
+            AssessmentSession.assessment_type,
+            AssessmentSession.assessment_date,
+            Player.throws,
+            rn,
+        )
+        .join(Player, AssessmentSession.player_id == Player.id)
+        .where(AssessmentSession.is_complete == True, Player.is_active == True)
+    )
+    if team_id is not None:
+        ranked = ranked.where(Player.team_id == team_id)
+    if sport_id is not None:
+        ranked = ranked.where(Player.sport_id == sport_id)
+    ranked = ranked.subquery("ranked")
+    return select(ranked).where(ranked.c.rn == 1).cte("latest")
+
+
+def _pair(latest, assessment_type: str, test_code, measure, left, right, flagged) -> Select:
+    left = cast(left, Numeric)
+    right = cast(right, Numeric)
+    difference = func.abs(left - right)
+    return select(
+        latest.c.player_id,
+        latest.c.id.label("session_id"),
+        latest.c.assessment_date,
+        literal(assessment_type, String).label("assessment_type"),
+        cast(test_code, String).label("test_code"),
+        cast(measure, String).label("measure"),
+        left.label("left_value"),
+        right.label("right_value"),
+        difference.label("difference"),
+        asymmetry_pct(left, right).label("asymmetry_pct"),
+        flagged.label("flagged"),
+    )
+
+
+def build_asymmetry_query(team_id: Optional[int] = None, sport_id: Optional[int] = None) -> Select:
+    """Pair every left/right result of the roster's latest sessions in one statement.
+
+    One row per pair: OnBaseU, Pitcher OnBaseU and TPI Power tests with both
+    sides, the left/right directional sprint, every KAMS left/right
+    measurement pair and, for pitchers with a known throwing arm, the
+    throwing vs glove arm Pitcher OnBaseU score.
+    """
+    latest = _latest_sessions(team_id, sport_id)
+    sources = []
+
+    for assessment_type, model, value_column in _SIDED_RESULTS:
+        left, right = aliased(model), aliased(model)
+        left_value, right_value = getattr(left, value_column), getattr(right, value_column)
+        if value_column == "score":
+            flagged = left_value != right_value
+        else:
+            flagged = asymmetry_pct(left_value, right_value) > ASYMMETRY_THRESHOLDS["tpi_power_pct"]
+        sources.append(
+            _pair(latest, assessment_type, left.test_code, left.test_name, left_value, right_value, flagged)
+            .join(left, and_(left.session_id == latest.c.id, left.side == "left"))
+            .join(right, and_(
+                right.session_id == latest.c.id,
+                right.test_code == left.test_code,
+                right.side == "right",
+            ))
+            .where(latest.c.assessment_type == assessment_type)
+        )
+
+    left, right = aliased(SprintResult), aliased(SprintResult)
+    sources.append(
+        _pair(
+            latest, "sprint", left.test_code, "5-yard Directional", left.best_time, right.best_time,
+            func.abs(left.best_time - right.best_time) > ASYMMETRY_THRESHOLDS["sprint_seconds"],
+        )
+        .join(left, and_(left.session_id == latest.c.id, left.test_code == SPRINT_DIRECTIONAL_PAIR[0]))
+        .join(right, and_(right.session_id == latest.c.id, right.test_code == SPRINT_DIRECTIONAL_PAIR[1]))
+        .where(latest.c.assessment_type == "sprint")
+    )
+
+    pairs = values(
+        column("test_type", String),
+        column("measure", String),
+        column("left_field", String),
+        column("right_field", String),
+        name="pairs",
+    ).data([
+        (test_type, measure, left_field, right_field)
+        for test_type, test_pairs in KAMS_MEASUREMENT_PAIRS.items()
+        for measure, (left_field, right_field) in test_pairs.items()
+    ])
+    asymmetry = measurement_asymmetry(KAMSResult.measurements, pairs.c.left_field, pairs.c.right_field)
+    sources.append(
+        _pair(
+            latest, "kams", KAMSResult.test_type, pairs.c.measure,
+            measurement_value(KAMSResult.measurements, pairs.c.left_field),
+            measurement_value(KAMSResult.measurements, pairs.c.right_field),
+            asymmetry > ASYMMETRY_THRESHOLDS["kams_pct"],
+        )
+        .join(KAMSResult, KAMSResult.session_id == latest.c.id)
+        .join(pairs, pairs.c.test_type == KAMSResult.test_type)
+        .where(latest.c.assessment_type == "kams", asymmetry.is_not(None))
+    )
+
+    # Left and right arm as a percentage of the maximum score (3 per test)
+    left_arm = func.avg(PitcherOnBaseUResult.score).filter(PitcherOnBaseUResult.side == "left") * 100 / 3
+    right_arm = func.avg(PitcherOnBaseUResult.score).filter(PitcherOnBaseUResult.side == "right") * 100 / 3
+    arm_pair = (
+        select(
+            latest.c.id,
+            case((latest.c.throws == "L", "Throwing arm (left) vs glove arm"), else_="Throwing arm (right) vs glove arm").label("measure"),
+            left_arm.label("left_arm"),
+            right_arm.label("right_arm"),
+        )
+        .join(PitcherOnBaseUResult, PitcherOnBaseUResult.session_id == latest.c.id)
+        .where(latest.c.assessment_type == "pitcher_onbaseu", latest.c.throws.in_(["L", "R"]))
+        .group_by(latest.c.id, latest.c.throws)
+        .subquery("arm_pair")
+    )
+    sources.append(
+        _pair(
+            latest, "pitcher_onbaseu", null(), arm_pair.c.measure, arm_pair.c.left_arm, arm_pair.c.right_arm,
+            func.abs(arm_pair.c.left_arm - arm_pair.c.right_arm) > ASYMMETRY_THRESHOLDS["pitcher_arm_points"],
+        )
+        .join(arm_pair, arm_pair.c.id == latest.c.id)
+        .where(arm_pair.c.left_arm.is_not(None), arm_pair.c.right_arm.is_not(None))
+    )
+
+    report = union_all(*sources).subquery("asymmetry")
+    return (
+        select(report, Player.first_name, Player.last_name, Player.player_code, Player.team_id)
+        .join(Player, Player.id == report.c.player_id)
+    )
+
+
+def _number(value) -> Optional[float]:
+    return round(float(value), 2) if value is not None else None
+
+
+def build_asymmetry_report(rows: List[Any], include_unflagged: bool = False) -> List[Dict[str, Any]]:
+    """Group paired rows by athlete and rank the athletes.
+
+    Athletes are ranked by how many pairs are flagged, then by their largest
+    flagged asymmetry. Without ``include_unflagged`` only flagged pairs, and
+    athletes with at least one, are returned.
+    """
+    athletes: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        if not row.flagged and not include_unflagged:
+            continue
+        athlete = athletes.get(row.player_id)
+        if athlete is None:
+            athlete = athletes[row.player_id] = {
+                "player_id": str(row.player_id),
+                "player_name": f"{row.first_name} {row.last_name}",
+                "player_code": row.player_code,
+                "team_id": row.team_id,
+                "flagged_count": 0,
+                "max_asymmetry_pct": None,
+                "assessment_types": set(),
+                "pairs": [],
+            }
+        asymmetry_pct = _number(row.asymmetry_pct)
+        if row.flagged:
+            athlete["flagged_count"] += 1
+            athlete["assessment_types"].add(row.assessment_type)
+            if asymmetry_pct is not None and (
+                athlete["max_asymmetry_pct"] is None or asymmetry_pct > athlete["max_asymmetry_pct"]
+            ):
+                athlete["max_asymmetry_pct"] = asymmetry_pct
+        athlete["pairs"].append({
+            "assessment_type": row.assessment_type,
+            "session_id": str(row.session_id),
+            "assessment_date": row.assessment_date.isoformat(),
+            "test_code": row.test_code,
+            "measure": row.measure,
+            "left": _number(row.left_value),
+            "right": _number(row.right_value),
+            "difference": _number(row.difference),
+            "asymmetry_pct": asymmetry_pct,
+            "flagged": bool(row.flagged),
+        })
+
+    ranked = sorted(
+        athletes.values(),
+        key=lambda a: (-a["flagged_count"], -(a["max_asymmetry_pct"] or 0), a["player_name"]),
+    )
+    for athlete in ranked:
+        athlete["assessment_types"] = sorted(athlete["assessment_types"])
+        athlete["pairs"].sort(key=lambda p: (not p["flagged"], -(p["asymmetry_pct"] or 0)))
+    return ranked
@@ -0,0 +1,172 @@
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import date
+from uuid import UUID
+import asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import joinedload
+
+from app.db.async_session import AsyncSessionLocal
+from app.models import Player, AssessmentSession
+from app.services.analysis.player_analysis import (
+    PlayerAnalysisService,
+    ASSESSMENT_TYPES,
+    RESULT_MODELS,
+)
+from app.services.analysis.team_analysis import TeamAnalysisService
+
+
+class AsyncAnalysisService:
+    """Async front end to player and team analysis.
+
+    Independent lookups run concurrently, each on its own short-lived
+    session since an asyncpg connection runs one statement at a time. The remaining analyses
+    reuse the sync services on the request's connection via ``run_sync``.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+    ):
+        self.db = db
+        self.session_factory = session_factory
+        # Pure scoring helpers only; never touches the database
+        self.scoring = PlayerAnalysisService(db.sync_session)
+
+    async def get_player_summary(self, player_id: UUID) -> Dict[str, Any]:
+        """Get comprehensive player assessment summary."""
+        # Return the request's connection to the pool before fanning out, so
+        # concurrent requests can't each hold one while waiting for more
+        await self.db.rollback()
+
+        player, *latest = await asyncio.gather(
+            self._get_player(player_id),
+            *(self._get_latest_session(player_id, assess_type) for assess_type in ASSESSMENT_TYPES),
+        )
+        if not player:
+            return {}
+
+        summary = {
+            "player_id": str(player_id),
+            "player_name": player.full_name,
+            "team_name": player.team.name if player.team else None,
+            "assessments": {},
+        }
+
+        for assess_type, (session, results) in zip(ASSESSMENT_TYPES, latest):
+            if session:
+                scores = self.scoring.get_session_scores(session, results)
+
+                summary["assessments"][assess_type] = {
+                    "latest_date": session.assessment_date.isoformat(),
+                    "overall_score": scores.get("overall", 0),
+                    "category_scores": scores.get("categories", {}),
+                    "color": scores.get("color", "red"),
+                }
+
+        return summary
+
+    async def get_player_progress(
+        self,
+        player_id: UUID,
+        assessment_type: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Get player progress data over time."""
+        return await self.db.run_sync(
+            lambda db: PlayerAnalysisService(db).get_player_progress(
+                player_id, assessment_type, start_date, end_date
+            )
+        )
+
+    async def compare_players(
+        self,
+        player_ids: List[UUID],
+        assessment_type: str,
+        as_of_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Compare multiple players on an assessment."""
+        return await self.db.run_sync(
+            lambda db: PlayerAnalysisService(db).compare_players(
+                player_ids, assessment_type, as_of_date
+            )
+        )
+
+    async def get_team_overview(self, team_id: int) -> Dict[str, Any]:
+        """Get comprehensive team overview."""
+        return await self.db.run_sync(
+            lambda db: TeamAnalysisService(db).get_team_overview(team_id)
+        )
+
+    async def get_team_trends(
+        self,
+        team_id: int,
+        assessment_type: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Get team performance trends over time."""
+        return await self.db.run_sync(
+            lambda db: TeamAnalysisService(db).get_team_trends(
+                team_id, assessment_type, start_date, end_date
+            )
+        )
+
+    async def get_player_rankings(self, team_id: int, assessment_type: str) -> Dict[str, Any]:
+        """Get player rankings within a team for an assessment type."""
+        return await self.db.run_sync(
+            lambda db: TeamAnalysisService(db).get_player_rankings(team_id, assessment_type)
+        )
+
+    async def get_sport_dashboard(
+        self,
+        sport_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Get sport-wide score statistics."""
+        return await self.db.run_sync(
+            lambda db: TeamAnalysisService(db).get_sport_dashboard(sport_id, start_date, end_date)
+        )
+
+    async def get_asymmetry_report(
+        self,
+        team_id: Optional[int] = None,
+        sport_id: Optional[int] = None,
+        include_unflagged: bool = False,
+    ) -> Dict[str, Any]:
+        """Rank a team's or sport's athletes by left/right asymmetry."""
+        return await self.db.run_sync(
+            lambda db: TeamAnalysisService(db).get_asymmetry_report(team_id, sport_id, include_unflagged)
+        )
+
+    async def _get_player(self, player_id: UUID) -> Optional[Player]:
+        """Get a player with their team."""
+        async with self.session_factory() as db:
+            return await db.scalar(
+                select(Player).options(joinedload(Player.team)).where(Player.id == player_id)
+            )
+
+    async def _get_latest_session(
+        self, player_id: UUID, assessment_type: str
+    ) -> Tuple[Optional[AssessmentSession], Optional[List[Dict]]]:
+        """Get a player's latest complete session, with results if it has no stored scores."""
+        async with self.session_factory() as db:
+            session = await db.scalar(
+                select(AssessmentSession)
+                .where(
+                    AssessmentSession.player_id == player_id,
+                    AssessmentSession.assessment_type == assessment_type,
+                    AssessmentSession.is_complete == True,
+                )
+                .order_by(AssessmentSession.assessment_date.desc())
+                .limit(1)
+            )
+            if session is None or session.overall_score is not None:
+                return session, None
+
+            model = RESULT_MODELS[assessment_type]
+            rows = await db.scalars(select(model).where(model.session_id == session.id))
+            return session, [self.scoring._result_to_dict(r) for r in rows]
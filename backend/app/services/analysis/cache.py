@@ -0,0 +1,274 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+from collections import OrderedDict
+from threading import Lock
+from uuid import UUID
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.session import engine
+from app.models import Player, AssessmentSession
+
+settings = get_settings()
+
+Tag = Tuple[str, Any]
+
+
+def _tags(players: Iterable[UUID], teams: Iterable[Optional[int]], sports: Iterable[Optional[int]]) -> Set[Tag]:
+    return (
+        {("player", str(p)) for p in players}
+        | {("team", t) for t in teams if t is not None}
+        | {("sport", s) for s in sports if s is not None}
+    )
+
+
+class AnalysisCache:
+    """Bounded LRU + TTL cache for analysis responses.
+
+    Each entry is tagged with the players, teams and sports it was computed
+    from, so an assessment write only evicts the entries it can affect.
+    The cache is per process: with several workers, other workers may serve
+    an entry for up to the TTL after a write. Writes that affect everything
+    (rescoring, cube rebuilds, imports) also bump a shared generation in
+    the database, which each process checks every ``sync_seconds`` and
+    clears its cache on change.
+
+    A value computed while one of its tags was invalidated (or the cache
+    cleared) is returned but not stored, since it may predate the write.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        shared_generation: Optional[Callable[[], int]] = None,
+        sync_seconds: float = 1.0,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.sync_seconds = sync_seconds
+        self._shared_generation = shared_generation
+        self._shared_seen: Optional[int] = None
+        self._next_sync = 0.0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Set[Tag]]]" = OrderedDict()
+        self._keys_by_tag: Dict[Tag, Set[Hashable]] = {}
+        self._lock = Lock()
+        # Invalidation counter, and its value at each tag's latest invalidation
+        self._generation = 0
+        self._invalidated_at: Dict[Tag, int] = {}
+        self._cleared_at = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.stale_skips = 0
+
+    def get_or_set(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        players: Iterable[UUID] = (),
+        teams: Iterable[int] = (),
+        sports: Iterable[int] = (),
+    ) -> Any:
+        """Return the cached value for key, computing and storing it on a miss.
+
+        Empty results (e.g. unknown player or team) are not cached.
+        """
+        found, value, generation = self._lookup(key)
+        if found:
+            return value
+        tags = _tags(players, teams, sports)
+        value = compute()
+        self._store(key, value, tags, generation)
+        return value
+
+    async def get_or_set_async(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        players: Iterable[UUID] = (),
+        teams: Iterable[int] = (),
+        sports: Iterable[int] = (),
+    ) -> Any:
+        """Async variant of get_or_set for coroutine-producing computations."""
+        found, value, generation = self._lookup(key)
+        if found:
+            return value
+        tags = _tags(players, teams, sports)
+        value = await compute()
+        self._store(key, value, tags, generation)
+        return value
+
+    def invalidate(
+        self,
+        players: Iterable[UUID] = (),
+        teams: Iterable[Optional[int]] = (),
+        sports: Iterable[Optional[int]] = (),
+    ) -> None:
+        """Drop every entry computed from any of the given players, teams or sports."""
+        tags = _tags(players, teams, sports)
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                self._invalidated_at[tag] = self._generation
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._generation += 1
+            self._cleared_at = self._generation
+            # Older per-tag generations are all covered by the clear
+            self._invalidated_at.clear()
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters for sizing the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "stale_skips": self.stale_skips,
+            }
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any, int]:
+        """Find a live entry; on a miss also return the current invalidation generation."""
+        if self.max_entries <= 0:
+            return False, None, 0
+
+        self._sync_shared()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value, self._generation
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+            return False, None, self._generation
+
+    def _sync_shared(self) -> None:
+        """Clear the cache if another process bumped the shared generation."""
+        if self._shared_generation is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_sync:
+                return
+            self._next_sync = now + self.sync_seconds
+
+        try:
+            generation = self._shared_generation()
+        except Exception as e:
+            print(f"Analysis cache: could not read the shared generation: {e}")
+            return
+        with self._lock:
+            seen, self._shared_seen = self._shared_seen, generation
+        if seen is not None and generation != seen:
+            self.clear()
+
+    def _store(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Set[Tag],
+        generation: int,
+    ) -> None:
+        if self.max_entries <= 0 or not value:
+            return
+
+        with self._lock:
+            if self._cleared_at > generation or any(
+                self._invalidated_at.get(tag, 0) > generation for tag in tags
+            ):
+                self.stale_skips += 1
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+def read_shared_generation() -> int:
+    """Read the cache generation shared by all processes."""
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT generation FROM analysis.cache_generation WHERE id = 1")
+        ).scalar() or 0
+
+
+def bump_shared_generation(db: Session) -> None:
+    """Make every process clear its analysis cache once the caller commits.
+
+    Use for writes that affect all analyses, e.g. rescoring; the caller
+    still clears this process's cache with analysis_cache.clear().
+    """
+    db.execute(text("""
+        INSERT INTO analysis.cache_generation (id, generation, updated_at)
+        VALUES (1, 1, now())
+        ON CONFLICT (id) DO UPDATE
+        SET generation = analysis.cache_generation.generation + 1, updated_at = now()
+    """))
+
+
+analysis_cache = AnalysisCache(
+    max_entries=settings.ANALYSIS_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ANALYSIS_CACHE_TTL_SECONDS,
+    shared_generation=read_shared_generation,
+    sync_seconds=settings.ANALYSIS_CACHE_SYNC_SECONDS,
+)
+
+
+def invalidate_player_analysis(db: Session, player_id: UUID) -> None:
+    """Invalidate cached analysis for a player and their team and sport."""
+    player = db.query(Player.team_id, Player.sport_id).filter(Player.id == player_id).first()
+    analysis_cache.invalidate(
+        players=[player_id],
+        teams=[player.team_id] if player else [],
+        sports=[player.sport_id] if player else [],
+    )
+
+
+def invalidate_session_analysis(db: Session, session_id: UUID) -> None:
+    """Invalidate cached analysis affected by a write to a session or its results."""
+    row = (
+        db.query(Player.id, Player.team_id, Player.sport_id)
+        .join(AssessmentSession, AssessmentSession.player_id == Player.id)
+        .filter(AssessmentSession.id == session_id)
+        .first()
+    )
+    if row:
+        analysis_cache.invalidate(players=[row.id], teams=[row.team_id], sports=[row.sport_id])
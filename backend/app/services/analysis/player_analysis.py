@@ -1,9 +1,12 @@
 from typing import Optional, List, Dict, Any
 from datetime import date
-from sqlalchemy.orm import Session
+from decimal import Decimal
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func
 from uuid import UUID
 
 from app.models import Player, AssessmentSession, OnBaseUResult, PitcherOnBaseUResult, TPIPowerResult, SprintResult, KAMSResult
+from app.services.analysis.analytics_cube import AnalyticsCubeService
 from app.services.assessment import (
     OnBaseUScoringService,
     PitcherOnBaseUScoringService,
@@ -12,6 +15,16 @@ from app.services.assessment import (
     KAMSScoringService,
 )
 
+ASSESSMENT_TYPES = ["onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"]
+
+RESULT_MODELS = {
+    "onbaseu": OnBaseUResult,
+    "pitcher_onbaseu": PitcherOnBaseUResult,
+    "tpi_power": TPIPowerResult,
+    "sprint": SprintResult,
+    "kams": KAMSResult,
+}
+
 
 class PlayerAnalysisService:
     """Service for player analysis and progress tracking."""
@@ -47,8 +60,7 @@ class PlayerAnalysisService:
 
         progress_data = []
         for session in sessions:
-            results = self._get_session_results(session)
-            scores = self._calculate_scores(assessment_type, results)
+            scores = self.get_session_scores(session)
 
             progress_data.append({
                 "date": session.assessment_date.isoformat(),
@@ -97,8 +109,7 @@ class PlayerAnalysisService:
             )
 
             if latest:
-                results = self._get_session_results(latest)
-                scores = self._calculate_scores(assess_type, results)
+                scores = self.get_session_scores(latest)
 
                 summary["assessments"][assess_type] = {
                     "latest_date": latest.assessment_date.isoformat(),
@@ -115,34 +126,44 @@ class PlayerAnalysisService:
         assessment_type: str,
         as_of_date: Optional[date] = None,
     ) -> Dict[str, Any]:
-        """Compare multiple players on an assessment."""
-        comparison_data = {}
-
-        for player_id in player_ids:
-            query = self.db.query(AssessmentSession).filter(
-                AssessmentSession.player_id == player_id,
-                AssessmentSession.assessment_type == assessment_type,
-                AssessmentSession.is_complete == True,
-            )
-
-            if as_of_date:
-                query = query.filter(AssessmentSession.assessment_date <= as_of_date)
-
-            session = query.order_by(AssessmentSession.assessment_date.desc()).first()
+        """Compare multiple players on an assessment.
+
+        Latest sessions (with players and teams) come from a single windowed
+        query; results are only loaded, in bulk, for sessions without stored
+        scores. Players are ranked overall and per category.
+        """
+        sessions = self._get_latest_sessions(
+            player_ids, [assessment_type], as_of_date, with_players=True
+        )
+        sessions_by_player = {session.player_id: session for session in sessions}
+        results_by_session = self._get_results_for_sessions(
+            [session for session in sessions if session.overall_score is None]
+        )
 
-            if session:
-                player = self.db.query(Player).filter(Player.id == player_id).first()
-                results = self._get_session_results(session)
-                scores = self._calculate_scores(assessment_type, results)
+        comparison_data = {}
+        category_scores: Dict[str, List[tuple]] = {}
+        for player_id in dict.fromkeys(player_ids):
+            session = sessions_by_player.get(player_id)
+            if not session:
+                continue
+
+            player = session.player
+            scores = self.get_session_scores(session, results_by_session.get(session.id))
+            categories = scores.get("categories", {})
+
+            comparison_data[str(player_id)] = {
+                "player_name": player.full_name if player else "Unknown",
+                "team_name": player.team.name if player and player.team else None,
+                "assessment_date": session.assessment_date.isoformat(),
+                "overall_score": scores.get("overall", 0),
+                "category_scores": categories,
+                "color": scores.get("color", "red"),
+            }
 
-                comparison_data[str(player_id)] = {
-                    "player_name": player.full_name if player else "Unknown",
-                    "team_name": player.team.name if player and player.team else None,
-                    "assessment_date": session.assessment_date.isoformat(),
-                    "overall_score": scores.get("overall", 0),
-                    "category_scores": scores.get("categories", {}),
-                    "color": scores.get("color", "red"),
-                }
+            for category, value in categories.items():
+                score = value.get("score") if isinstance(value, dict) else value
+                if score is not None:
+                    category_scores.setdefault(category, []).append((str(player_id), score))
 
         # Rank players
         rankings = sorted(
@@ -155,8 +176,177 @@ class PlayerAnalysisService:
             "assessment_type": assessment_type,
             "comparison_data": comparison_data,
             "rankings": [{"player_id": pid, "rank": i + 1} for i, (pid, _) in enumerate(rankings)],
+            "category_rankings": {
+                category: [
+                    {"player_id": pid, "score": score, "rank": i + 1}
+                    for i, (pid, score) in enumerate(
+                        sorted(scored, key=lambda x: x[1], reverse=True)
+                    )
+                ]
+                for category, scored in category_scores.items()
+            },
         }
 
+    def get_session_scores(
+        self, session: AssessmentSession, results: Optional[List[Dict]] = None
+    ) -> Dict[str, Any]:
+        """Get a session's scores, preferring the persisted values.
+
+        Falls back to rescoring the session's results for sessions that
+        have not been scored yet.
+        """
+        if session.overall_score is not None:
+            return {
+                "overall": float(session.overall_score),
+                "color": session.color,
+                "categories": session.category_scores or {},
+            }
+
+        if results is None:
+            results = self._get_session_results(session)
+        return self._calculate_scores(session.assessment_type, results)
+
+    def refresh_session_scores(
+        self, session_id: UUID, refresh_cube: bool = True
+    ) -> Optional[AssessmentSession]:
+        """Recalculate and persist the scores for a session.
+
+        Pending result changes are flushed first so the new scores reflect
+        them, and the analytics cube slice is refreshed for completed
+        sessions. The caller is responsible for committing.
+        """
+        self.db.flush()
+
+        session = self.db.get(AssessmentSession, session_id)
+        if not session:
+            return None
+
+        model = RESULT_MODELS.get(session.assessment_type)
+        results = []
+        if model is not None:
+            # Reload flushed rows so edited values come back as stored (Decimal), not as assigned
+            rows = (
+                self.db.query(model)
+                .filter(model.session_id == session_id)
+                .populate_existing()
+                .all()
+            )
+            results = [self._result_to_dict(r) for r in rows]
+
+        scores = self._calculate_scores(session.assessment_type, results)
+        session.overall_score = _to_json_safe(scores.get("overall", 0))
+        session.color = scores.get("color")
+        session.category_scores = _to_json_safe(scores.get("categories", {}))
+
+        if refresh_cube and session.is_complete:
+            self.db.flush()
+            AnalyticsCubeService(self.db).refresh_slice(
+                session.assessment_date, session.assessment_type
+            )
+
+        return session
+
+    def refresh_many_session_scores(
+        self, sessions: List[AssessmentSession], refresh_cube: bool = True
+    ) -> None:
+        """Recalculate and persist the scores for many sessions at once.
+
+        Same as refresh_session_scores for each session, but results are
+        loaded with one query per assessment type and each affected cube
+        slice is refreshed once. The caller is responsible for committing.
+        """
+        self.db.flush()
+
+        by_type: Dict[str, List[AssessmentSession]] = {}
+        for session in sessions:
+            by_type.setdefault(session.assessment_type, []).append(session)
+
+        slices = set()
+        for assessment_type, type_sessions in by_type.items():
+            results_by_session: Dict[UUID, List[Dict]] = {s.id: [] for s in type_sessions}
+            model = RESULT_MODELS.get(assessment_type)
+            if model is not None:
+                rows = (
+                    self.db.query(model)
+                    .filter(model.session_id.in_(list(results_by_session)))
+                    .populate_existing()
+                    .all()
+                )
+                for row in rows:
+                    results_by_session[row.session_id].append(self._result_to_dict(row))
+
+            for session in type_sessions:
+                scores = self._calculate_scores(assessment_type, results_by_session[session.id])
+                session.overall_score = _to_json_safe(scores.get("overall", 0))
+                session.color = scores.get("color")
+                session.category_scores = _to_json_safe(scores.get("categories", {}))
+                if refresh_cube and session.is_complete:
+                    slices.add((session.assessment_date, assessment_type))
+
+        if slices:
+            self.db.flush()
+            AnalyticsCubeService(self.db).refresh_slices(slices)
+
+    def _get_latest_sessions(
+        self,
+        player_ids: List[UUID],
+        assessment_types: Optional[List[str]] = None,
+        as_of_date: Optional[date] = None,
+        with_players: bool = False,
+    ) -> List[AssessmentSession]:
+        """Get each player's latest complete session per assessment type in one query.
+
+        With ``with_players`` the session's player and team are joined in the
+        same query.
+        """
+        if not player_ids:
+            return []
+
+        row_number = func.row_number().over(
+            partition_by=(AssessmentSession.player_id, AssessmentSession.assessment_type),
+            order_by=AssessmentSession.assessment_date.desc(),
+        ).label("rn")
+
+        ranked = self.db.query(AssessmentSession.id, row_number).filter(
+            AssessmentSession.player_id.in_(player_ids),
+            AssessmentSession.is_complete == True,
+        )
+        if assessment_types:
+            ranked = ranked.filter(AssessmentSession.assessment_type.in_(assessment_types))
+        if as_of_date:
+            ranked = ranked.filter(AssessmentSession.assessment_date <= as_of_date)
+        ranked = ranked.subquery()
+
+        query = (
+            self.db.query(AssessmentSession)
+            .join(ranked, ranked.c.id == AssessmentSession.id)
+            .filter(ranked.c.rn == 1)
+        )
+        if with_players:
+            query = query.options(
+                joinedload(AssessmentSession.player).joinedload(Player.team)
+            )
+        return query.all()
+
+    def _get_results_for_sessions(
+        self, sessions: List[AssessmentSession]
+    ) -> Dict[UUID, List[Dict]]:
+        """Bulk-load results for many sessions, one query per result table."""
+        session_ids_by_type: Dict[str, List[UUID]] = {}
+        for session in sessions:
+            session_ids_by_type.setdefault(session.assessment_type, []).append(session.id)
+
+        results_by_session: Dict[UUID, List[Dict]] = {session.id: [] for session in sessions}
+        for assess_type, session_ids in session_ids_by_type.items():
+            model = RESULT_MODELS.get(assess_type)
+            if model is None:
+                continue
+            rows = self.db.query(model).filter(model.session_id.in_(session_ids)).all()
+            for row in rows:
+                results_by_session[row.session_id].append(self._result_to_dict(row))
+
+        return results_by_session
+
     def _get_session_results(self, session: AssessmentSession) -> List[Dict]:
         """Get results for a session based on assessment type."""
         if session.assessment_type == "onbaseu":
@@ -241,3 +431,14 @@ class PlayerAnalysisService:
             "first_score": first_score,
             "last_score": last_score,
         }
+
+
+def _to_json_safe(value: Any) -> Any:
+    """Convert Decimal values (from Numeric columns) to floats for JSONB storage."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _to_json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_json_safe(v) for v in value]
+    return value
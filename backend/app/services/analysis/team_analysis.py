@@ -3,8 +3,14 @@ from datetime import date
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from app.models import Player, Team, AssessmentSession
-from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.models import Player, Team, Sport, AssessmentSession
+from app.services.analysis.analytics_cube import AnalyticsCubeService
+from app.services.analysis.asymmetry import (
+    ASYMMETRY_THRESHOLDS,
+    build_asymmetry_query,
+    build_asymmetry_report,
+)
+from app.services.analysis.player_analysis import PlayerAnalysisService, ASSESSMENT_TYPES
 
 
 class TeamAnalysisService:
@@ -13,6 +19,7 @@ class TeamAnalysisService:
     def __init__(self, db: Session):
         self.db = db
         self.player_analysis = PlayerAnalysisService(db)
+        self.analytics_cube = AnalyticsCubeService(db)
 
     def get_team_overview(self, team_id: int) -> Dict[str, Any]:
         """Get comprehensive team overview."""
@@ -39,24 +46,42 @@ class TeamAnalysisService:
             .all()
         )
 
-        # Calculate team averages for each assessment type
-        team_averages = {}
-        assessment_types = ["onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"]
+        # Latest complete session per player and type, with results bulk-loaded
+        latest_sessions = self.player_analysis._get_latest_sessions(
+            [player.id for player in players], ASSESSMENT_TYPES
+        )
+        results_by_session = self.player_analysis._get_results_for_sessions(
+            [s for s in latest_sessions if s.overall_score is None]
+        )
+
+        # Accumulate count, sum, min and max per assessment type in one pass
+        aggregates: Dict[str, Dict[str, float]] = {}
+        for session in latest_sessions:
+            scores = self.player_analysis.get_session_scores(
+                session, results_by_session.get(session.id)
+            )
+            score = scores.get("overall", 0)
 
-        for assess_type in assessment_types:
-            scores = []
-            for player in players:
-                summary = self.player_analysis.get_player_summary(player.id)
-                if assess_type in summary.get("assessments", {}):
-                    score = summary["assessments"][assess_type].get("overall_score", 0)
-                    scores.append(score)
+            agg = aggregates.get(session.assessment_type)
+            if agg is None:
+                aggregates[session.assessment_type] = {
+                    "total": score, "count": 1, "min": score, "max": score,
+                }
+            else:
+                agg["total"] += score
+                agg["count"] += 1
+                agg["min"] = min(agg["min"], score)
+                agg["max"] = max(agg["max"], score)
 
-            if scores:
+        team_averages = {}
+        for assess_type in ASSESSMENT_TYPES:
+            agg = aggregates.get(assess_type)
+            if agg:
                 team_averages[assess_type] = {
-                    "average": sum(scores) / len(scores),
-                    "player_count": len(scores),
-                    "min": min(scores),
-                    "max": max(scores),
+                    "average": agg["total"] / agg["count"],
+                    "player_count": agg["count"],
+                    "min": agg["min"],
+                    "max": agg["max"],
                 }
 
         return {
@@ -82,44 +107,11 @@ class TeamAnalysisService:
         if not team:
             return {}
 
-        # Get all sessions for team players
-        query = (
-            self.db.query(AssessmentSession)
-            .join(Player)
-            .filter(
-                Player.team_id == team_id,
-                AssessmentSession.assessment_type == assessment_type,
-                AssessmentSession.is_complete == True,
-            )
+        # Daily averages come straight from the pre-aggregated cube
+        trend_data = self.analytics_cube.get_team_daily_scores(
+            team_id, assessment_type, start_date, end_date
         )
 
-        if start_date:
-            query = query.filter(AssessmentSession.assessment_date >= start_date)
-        if end_date:
-            query = query.filter(AssessmentSession.assessment_date <= end_date)
-
-        sessions = query.order_by(AssessmentSession.assessment_date).all()
-
-        # Group by date and calculate daily averages
-        date_scores = {}
-        for session in sessions:
-            date_str = session.assessment_date.isoformat()
-            results = self.player_analysis._get_session_results(session)
-            scores = self.player_analysis._calculate_scores(assessment_type, results)
-
-            if date_str not in date_scores:
-                date_scores[date_str] = []
-            date_scores[date_str].append(scores.get("overall", 0))
-
-        # Calculate daily averages
-        trend_data = []
-        for date_str, scores in sorted(date_scores.items()):
-            trend_data.append({
-                "date": date_str,
-                "average_score": sum(scores) / len(scores),
-                "assessment_count": len(scores),
-            })
-
         # Calculate overall trend
         if len(trend_data) >= 2:
             first_avg = trend_data[0]["average_score"]
@@ -179,8 +171,7 @@ class TeamAnalysisService:
             )
 
             if session:
-                results = self.player_analysis._get_session_results(session)
-                scores = self.player_analysis._calculate_scores(assessment_type, results)
+                scores = self.player_analysis.get_session_scores(session)
 
                 player_scores.append({
                     "player_id": str(player.id),
@@ -203,3 +194,52 @@ class TeamAnalysisService:
             "rankings": player_scores,
             "total_players": len(player_scores),
         }
+
+    def get_sport_dashboard(
+        self,
+        sport_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Get sport-wide score statistics per assessment type."""
+        sport = self.db.query(Sport).filter(Sport.id == sport_id).first()
+        if not sport:
+            return {}
+
+        return {
+            "sport_id": sport_id,
+            "sport_name": sport.name,
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+            "assessments": self.analytics_cube.get_sport_dashboard(sport_id, start_date, end_date),
+        }
+
+    def get_asymmetry_report(
+        self,
+        team_id: Optional[int] = None,
+        sport_id: Optional[int] = None,
+        include_unflagged: bool = False,
+    ) -> Dict[str, Any]:
+        """Rank a team's or sport's athletes by left/right asymmetry.
+
+        Every left/right pair in each active player's latest complete
+        session of every assessment type is compared in a single query.
+        """
+        if team_id is not None:
+            scope = self.db.query(Team.name).filter(Team.id == team_id).scalar()
+        else:
+            scope = self.db.query(Sport.name).filter(Sport.id == sport_id).scalar()
+        if scope is None:
+            return {}
+
+        rows = self.db.execute(build_asymmetry_query(team_id, sport_id)).all()
+        athletes = build_asymmetry_report(rows, include_unflagged)
+        return {
+            "team_id": team_id,
+            "sport_id": sport_id,
+            "name": scope,
+            "thresholds": ASYMMETRY_THRESHOLDS,
+            "players_assessed": len({row.player_id for row in rows}),
+            "players_flagged": sum(1 for athlete in athletes if athlete["flagged_count"]),
+            "athletes": athletes,
+        }
@@ -1,7 +1,12 @@
 from typing import Literal, Tuple, Optional
+import numpy as np
 
 ColorResult = Literal["green", "yellow", "red", "blue"]
 
+# Color codes used by the batch scoring APIs (indexes into BATCH_COLORS)
+BATCH_COLORS = np.array([None, "blue", "green", "yellow", "red"], dtype=object)
+COLOR_NONE, COLOR_BLUE, COLOR_GREEN, COLOR_YELLOW, COLOR_RED = range(5)
+
 
 class BaseScoringService:
     """Base scoring service with common functionality."""
@@ -0,0 +1,245 @@
+import csv
+import json
+import typing
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Set, TextIO, Tuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+
+from app.models import AssessmentSession, Player
+from app.schemas.assessment.imports import ImportRowError, ResultImportSummary
+from app.services.analysis.analytics_cube import AnalyticsCubeService
+from app.services.analysis.player_analysis import PlayerAnalysisService
+from app.services.assessment.bulk_ingest import (
+    BulkConflictMode,
+    SESSION_KEY,
+    copy_upsert_rows,
+    upsert_rows,
+)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# Rows listed in the summary's errors; later failures are only counted
+MAX_REPORTED_ERRORS = 1000
+
+# (line, player_code, assessment_date, validated result)
+_ParsedRow = Tuple[int, str, date, BaseModel]
+
+
+def _is_json_field(annotation: Any) -> bool:
+    if typing.get_origin(annotation) is typing.Union:
+        return any(_is_json_field(arg) for arg in typing.get_args(annotation))
+    return annotation in (dict, list) or typing.get_origin(annotation) in (dict, list)
+
+
+def _error_message(error: ValueError) -> str:
+    if isinstance(error, ValidationError):
+        first = error.errors()[0]
+        location = ".".join(str(part) for part in first["loc"])
+        return f"{location}: {first['msg']}" if location else first["msg"]
+    return str(error)
+
+
+class ResultImportService:
+    """Import a CSV or NDJSON file of results for one assessment type.
+
+    Each row is one result (the fields of the type's create schema) plus
+    the ``player_code`` and ``assessment_date`` of its session. Rows are
+    read one at a time and handled in batches: players are resolved by
+    code, sessions created or resumed with one upsert, results scored per
+    session and loaded through COPY into a staging table that is merged
+    into the results table. Memory stays bounded by the batch size, not
+    the file size.
+
+    Rows that fail validation or name an unknown player are reported and
+    skipped. Batches are only cut between sessions, so a session's results
+    are scored together as long as its rows are contiguous in the file.
+    Everything runs in the caller's transaction: commit to keep the
+    import, roll back for a dry run.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        assessment_type: str,
+        schema: Type[BaseModel],
+        model,
+        key_columns: List[str],
+        score_rows: Callable[[UUID, List[BaseModel]], List[Dict[str, Any]]],
+        assessed_by: Optional[UUID] = None,
+        on_conflict: BulkConflictMode = "skip",
+        complete: bool = True,
+        dry_run: bool = False,
+        batch_size: int = 5000,
+    ):
+        self.db = db
+        self.assessment_type = assessment_type
+        self.schema = schema
+        self.model = model
+        self.key_columns = key_columns
+        self.score_rows = score_rows
+        self.assessed_by = assessed_by
+        self.on_conflict = on_conflict
+        self.complete = complete
+        self.batch_size = batch_size
+        self.summary = ResultImportSummary(assessment_type=assessment_type, dry_run=dry_run)
+
+        # CSV cells holding JSON objects, e.g. KAMS measurements
+        self._json_fields = {
+            name for name, field in schema.model_fields.items() if _is_json_field(field.annotation)
+        }
+        # Player ids by code, None for codes known not to exist
+        self._player_ids: Dict[str, Optional[UUID]] = {}
+        self._created_sessions: Set[UUID] = set()
+        self._seen_sessions: Set[UUID] = set()
+        self._slices: Set[Tuple[date, str]] = set()
+
+    def run(self, stream: TextIO, file_format: ImportFormat) -> ResultImportSummary:
+        """Import every row of the stream and refresh the affected cube slices."""
+        batch: List[_ParsedRow] = []
+        last_session = None
+        for line, record, error in self._read(stream, file_format):
+            self.summary.rows_read += 1
+            if error is None:
+                try:
+                    player_code, assessment_date, result = self._parse(record, file_format == "csv")
+                except ValueError as e:
+                    error = _error_message(e)
+            if error is not None:
+                player_code = record.get("player_code") if isinstance(record, dict) else None
+                self._fail(line, player_code, error)
+                continue
+
+            session = (player_code, assessment_date)
+            if len(batch) >= self.batch_size and session != last_session:
+                self._import_batch(batch)
+                batch = []
+            batch.append((line, player_code, assessment_date, result))
+            last_session = session
+
+        if batch:
+            self._import_batch(batch)
+
+        AnalyticsCubeService(self.db).refresh_slices(self._slices)
+
+        # Unknown players are only found once their batch is imported
+        self.summary.errors.sort(key=lambda error: error.line)
+        return self.summary
+
+    def _read(
+        self, stream: TextIO, file_format: ImportFormat
+    ) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+        """Yield (line, record, error) for each row of the file."""
+        if file_format == "csv":
+            reader = csv.DictReader(stream)
+            try:
+                for record in reader:
+                    if None in record:
+                        yield reader.line_num, record, "Row has more fields than the header"
+                    else:
+                        yield reader.line_num, record, None
+            except csv.Error as e:
+                raise ValueError(f"Line {reader.line_num}: {e}")
+            return
+
+        for line, text in enumerate(stream, 1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except ValueError as e:
+                yield line, None, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield line, None, "Each line must be a JSON object"
+                continue
+            yield line, record, None
+
+    def _parse(self, record: Dict[str, Any], from_csv: bool) -> Tuple[str, date, BaseModel]:
+        values = dict(record)
+        if from_csv:
+            # Empty cells are missing values
+            values = {name: value for name, value in values.items() if value not in (None, "")}
+            for name in self._json_fields & values.keys():
+                try:
+                    values[name] = json.loads(values[name])
+                except ValueError:
+                    raise ValueError(f"{name}: Invalid JSON")
+
+        player_code = values.pop("player_code", None)
+        if not player_code:
+            raise ValueError("player_code is required")
+        try:
+            assessment_date = date.fromisoformat(str(values.pop("assessment_date", None)))
+        except ValueError:
+            raise ValueError("assessment_date must be a YYYY-MM-DD date")
+
+        return str(player_code), assessment_date, self.schema.model_validate(values)
+
+    def _fail(self, line: int, player_code: Optional[str], error: str) -> None:
+        self.summary.rows_failed += 1
+        if len(self.summary.errors) < MAX_REPORTED_ERRORS:
+            self.summary.errors.append(ImportRowError(line=line, player_code=player_code, error=error))
+        else:
+            self.summary.errors_truncated = True
+
+    def _import_batch(self, batch: List[_ParsedRow]) -> None:
+        unresolved = {player_code for _, player_code, _, _ in batch} - self._player_ids.keys()
+        if unresolved:
+            self._player_ids.update(dict.fromkeys(unresolved))
+            self._player_ids.update(
+                self.db.query(Player.player_code, Player.id).filter(Player.player_code.in_(unresolved))
+            )
+
+        results_by_session: Dict[Tuple[UUID, date], List[BaseModel]] = {}
+        for line, player_code, assessment_date, result in batch:
+            player_id = self._player_ids[player_code]
+            if player_id is None:
+                self._fail(line, player_code, "Unknown player_code")
+                continue
+            results_by_session.setdefault((player_id, assessment_date), []).append(result)
+        if not results_by_session:
+            return
+
+        # Existing sessions are resumed as they are, never overwritten
+        stored_sessions = upsert_rows(
+            self.db,
+            AssessmentSession,
+            [
+                dict(
+                    player_id=player_id,
+                    assessment_type=self.assessment_type,
+                    assessment_date=assessment_date,
+                    assessed_by=self.assessed_by,
+                )
+                for player_id, assessment_date in results_by_session
+            ],
+            SESSION_KEY,
+        )
+
+        rows = []
+        sessions = []
+        for (session, created), results in zip(stored_sessions, results_by_session.values()):
+            if created:
+                self._created_sessions.add(session.id)
+            self._seen_sessions.add(session.id)
+            if self.complete:
+                session.is_complete = True
+            rows += self.score_rows(session.id, results)
+            sessions.append(session)
+
+        inserted, existing = copy_upsert_rows(self.db, self.model, rows, self.key_columns, self.on_conflict)
+        self.summary.results_inserted += inserted
+        self.summary.results_existing += existing
+        self.summary.sessions_created = len(self._created_sessions)
+        self.summary.sessions_existing = len(self._seen_sessions - self._created_sessions)
+
+        PlayerAnalysisService(self.db).refresh_many_session_scores(sessions, refresh_cube=False)
+        self._slices.update(
+            (session.assessment_date, session.assessment_type) for session in sessions if session.is_complete
+        )
+        self.db.flush()
+        # Keep the identity map from growing with the file
+        self.db.expunge_all()
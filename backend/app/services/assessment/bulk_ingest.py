@@ -0,0 +1,190 @@
+import io
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Sequence, Tuple
+
+from fastapi import Response
+from sqlalchemy import UniqueConstraint, literal_column, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+# What a bulk submission does with results that already exist for its keys
+BulkConflictMode = Literal["skip", "overwrite"]
+
+# Response headers reporting how a bulk submission was applied
+INSERTED_HEADER = "X-Results-Inserted"
+EXISTING_HEADER = "X-Results-Existing"
+
+# Unique key of an assessment session
+SESSION_KEY = ["player_id", "assessment_type", "assessment_date"]
+
+# Never rewritten when overwriting an existing result
+_PRESERVED_COLUMNS = {"id", "session_id", "created_at"}
+
+# Client-side column defaults that COPY does not apply
+_COPY_DEFAULTS = {"id": uuid.uuid4, "created_at": datetime.utcnow}
+
+
+def _unique_constraint(model, key_columns: Sequence[str]) -> UniqueConstraint:
+    for constraint in model.__table__.constraints:
+        if isinstance(constraint, UniqueConstraint) and [c.name for c in constraint.columns] == list(key_columns):
+            return constraint
+    raise ValueError(f"{model.__name__} has no unique constraint on {', '.join(key_columns)}")
+
+
+def _unique_rows(
+    rows: List[Dict[str, Any]], key_columns: Sequence[str], on_conflict: BulkConflictMode
+) -> Dict[tuple, Dict[str, Any]]:
+    # One row per key: the first wins when skipping, the last when overwriting
+    batch: Dict[tuple, Dict[str, Any]] = {}
+    for row in rows:
+        key = tuple(row.get(column) for column in key_columns)
+        if on_conflict == "overwrite" or key not in batch:
+            batch[key] = row
+    return batch
+
+
+def _copy_value(value: Any) -> str:
+    """Format a value as a field of COPY's text format."""
+    if value is None:
+        return r"\N"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def upsert_rows(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    key_columns: Sequence[str],
+    on_conflict: BulkConflictMode = "skip",
+) -> List[Tuple[Any, bool]]:
+    """Write a batch of rows with one INSERT ... ON CONFLICT statement.
+
+    Rows are matched on the model's unique constraint over ``key_columns``.
+    With "skip" an existing row is left untouched; with "overwrite" its
+    submitted columns are replaced. Either way every submitted key comes
+    back from RETURNING, so the caller gets the stored rows without a
+    follow-up query.
+
+    Returns ``(stored row, inserted)`` pairs in submission order.
+    """
+    batch = _unique_rows(rows, key_columns, on_conflict)
+    if not batch:
+        return []
+
+    stmt = insert(model).values(list(batch.values()))
+    if on_conflict == "overwrite":
+        submitted = set().union(*(row.keys() for row in batch.values()))
+        set_ = {
+            column: stmt.excluded[column]
+            for column in submitted - _PRESERVED_COLUMNS - set(key_columns)
+        }
+    else:
+        # No-op update rather than DO NOTHING, so existing rows are returned too
+        set_ = {key_columns[0]: stmt.excluded[key_columns[0]]}
+    stmt = (
+        stmt.on_conflict_do_update(constraint=_unique_constraint(model, key_columns), set_=set_)
+        # xmax is 0 only on freshly inserted row versions
+        .returning(model, literal_column("xmax = 0").label("inserted"))
+    )
+
+    stored = db.execute(stmt, execution_options={"populate_existing": True}).all()
+    by_key = {tuple(getattr(row, column) for column in key_columns): (row, inserted) for row, inserted in stored}
+    return [by_key[key] for key in batch]
+
+
+def upsert_results(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    key_columns: Sequence[str],
+    on_conflict: BulkConflictMode = "skip",
+) -> Tuple[List[Any], int]:
+    """Upsert a scored batch of results (see upsert_rows).
+
+    Returns the stored results in submission order and how many of them
+    already existed.
+    """
+    stored = upsert_rows(db, model, rows, key_columns, on_conflict)
+    return [result for result, _ in stored], sum(1 for _, inserted in stored if not inserted)
+
+
+def copy_upsert_rows(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    key_columns: Sequence[str],
+    on_conflict: BulkConflictMode = "skip",
+) -> Tuple[int, int]:
+    """Write a large batch of rows through COPY and a set-based merge.
+
+    The rows are streamed with ``COPY`` into a temporary staging table
+    (created on first use, dropped at commit) and merged into the model's
+    table with one ``INSERT ... SELECT ... ON CONFLICT`` on the unique
+    constraint over ``key_columns``. Conflicts behave as in upsert_rows,
+    but no rows are returned, so this suits imports rather than API
+    responses.
+
+    Returns how many rows were inserted and how many already existed.
+    """
+    batch = _unique_rows(rows, key_columns, on_conflict)
+    if not batch:
+        return 0, 0
+
+    table = model.__table__
+    submitted = set().union(*(row.keys() for row in batch.values()))
+    columns = [
+        column.name for column in table.columns
+        if column.name in submitted or column.name in _COPY_DEFAULTS
+    ]
+    defaults = {name: factory for name, factory in _COPY_DEFAULTS.items() if name not in submitted}
+
+    buffer = io.StringIO()
+    for row in batch.values():
+        row = {**{name: factory() for name, factory in defaults.items()}, **row}
+        buffer.write("\t".join(_copy_value(row.get(name)) for name in columns) + "\n")
+    buffer.seek(0)
+
+    staging = f"import_{table.name}"
+    column_list = ", ".join(columns)
+    db.execute(text(
+        f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging} "
+        f"(LIKE {table.schema}.{table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+    ))
+    db.execute(text(f"TRUNCATE {staging}"))
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN", buffer)
+
+    if on_conflict == "overwrite":
+        action = "DO UPDATE SET " + ", ".join(
+            f"{name} = EXCLUDED.{name}"
+            for name in columns
+            if name not in _PRESERVED_COLUMNS and name not in key_columns
+        )
+    else:
+        action = "DO NOTHING"
+    inserted = db.execute(text(f"""
+        WITH merged AS (
+            INSERT INTO {table.schema}.{table.name} ({column_list})
+            SELECT {column_list} FROM {staging}
+            ON CONFLICT ON CONSTRAINT {_unique_constraint(model, key_columns).name} {action}
+            RETURNING xmax = 0 AS inserted
+        )
+        SELECT count(*) FILTER (WHERE inserted) FROM merged
+    """)).scalar()
+    return inserted, len(batch) - inserted
+
+
+def set_ingest_headers(response: Response, results: Sequence, existing: int) -> None:
+    """Report how many submitted results were new and how many already existed."""
+    response.headers[INSERTED_HEADER] = str(len(results) - existing)
+    response.headers[EXISTING_HEADER] = str(existing)
@@ -0,0 +1,199 @@
+"""Threshold and asymmetry filters over KAMS measurements, evaluated in SQL.
+
+``measurements`` is a JSONB document per result. Every numeric field listed
+in ``KAMS_TESTS`` and every left/right asymmetry has a partial expression
+index per test type (``create_measurement_indexes``), built from the same
+expressions the queries filter on, so a filter is an index range scan
+rather than a read of every document.
+"""
+import operator
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Numeric, and_, case, cast, column, func, intersect, literal_column, or_, select, text, union
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Query, Session, aliased
+
+from app.models import AssessmentSession, KAMSResult, Player
+from app.schemas.assessment.kams import (
+    KAMS_MEASUREMENT_FIELDS,
+    KAMS_MEASUREMENT_PAIRS,
+    KAMSMeasurementFilter,
+    KAMSMeasurementQuery,
+)
+
+_OPERATORS = {
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "eq": operator.eq,
+}
+
+
+def _literal(value: str):
+    # Inlined rather than bound, so the planner sees the same expression as
+    # the index definition. Only field names from KAMS_TESTS get here.
+    return literal_column(f"'{value}'")
+
+
+def measurement_value(measurements, field):
+    """A measurement as a number; NULL when it is missing or not numeric.
+
+    ``field`` is a field name, or a SQL expression giving one.
+    """
+    key = _literal(field) if isinstance(field, str) else field
+    return case(
+        (
+            func.jsonb_typeof(measurements.op("->")(key)) == _literal("number"),
+            cast(measurements.op("->>")(key), Numeric),
+        ),
+    )
+
+
+def asymmetry_pct(left, right):
+    """Left/right difference as a percentage of the larger side.
+
+    The sides are non-negative measurements (degrees, distances, times).
+    The asymmetry report uses this too, so its percentages and flags match
+    the measurement index expressions built from it.
+    """
+    return func.abs(left - right) * literal_column("100") / func.nullif(func.greatest(left, right), 0)
+
+
+def measurement_asymmetry(measurements, left_field, right_field):
+    """Asymmetry percentage of a pair of measurements (see asymmetry_pct)."""
+    return asymmetry_pct(
+        measurement_value(measurements, left_field),
+        measurement_value(measurements, right_field),
+    )
+
+
+def _filter_expression(measurements, measurement_filter: KAMSMeasurementFilter):
+    if measurement_filter.metric == "asymmetry":
+        left_field, right_field = KAMS_MEASUREMENT_PAIRS[measurement_filter.test_type][measurement_filter.field]
+        return measurement_asymmetry(measurements, left_field, right_field)
+    return measurement_value(measurements, measurement_filter.field)
+
+
+def filter_key(measurement_filter: KAMSMeasurementFilter) -> str:
+    """Name of a filter's value in query results."""
+    key = f"{measurement_filter.test_type}.{measurement_filter.field}"
+    return f"{key}.asymmetry" if measurement_filter.metric == "asymmetry" else key
+
+
+def measurement_indexes() -> List[Tuple[str, str, str]]:
+    """(index name, test type, indexed expression) of every measurement index."""
+    measurements = column("measurements", JSONB)
+    dialect = postgresql.dialect()
+    expressions = []
+    for test_type, fields in KAMS_MEASUREMENT_FIELDS.items():
+        for field in fields:
+            expressions.append((f"ix_kams_{test_type}_{field}", test_type, measurement_value(measurements, field)))
+        for name, (left_field, right_field) in KAMS_MEASUREMENT_PAIRS[test_type].items():
+            expressions.append((
+                f"ix_kams_{test_type}_{name}_asymmetry",
+                test_type,
+                measurement_asymmetry(measurements, left_field, right_field),
+            ))
+    return [
+        (name, test_type, str(expression.compile(dialect=dialect, compile_kwargs={"literal_binds": True})))
+        for name, test_type, expression in expressions
+    ]
+
+
+def create_measurement_indexes(db: Session) -> None:
+    """Create the partial expression indexes behind measurement queries.
+
+    The planner ignores the statistics of partial indexes, so each
+    expression also gets extended statistics; without them every filter is
+    estimated to match a third of the rows and index scans lose to walking
+    sessions in date order.
+    """
+    existing = db.execute(text(
+        "SELECT count(*) FROM pg_statistic_ext WHERE stxname LIKE 'st_kams_%'"
+    )).scalar()
+    definitions = measurement_indexes()
+    for name, test_type, expression in definitions:
+        db.execute(text(f"""
+            CREATE INDEX IF NOT EXISTS {name}
+            ON assessments.kams_results (({expression}))
+            WHERE test_type = '{test_type}'
+        """))
+        db.execute(text(f"""
+            CREATE STATISTICS IF NOT EXISTS assessments.st{name[2:]}
+            ON ({expression}) FROM assessments.kams_results
+        """))
+    if existing < len(definitions):
+        db.execute(text("ANALYZE assessments.kams_results"))
+
+
+def build_measurement_query(db: Session, query: KAMSMeasurementQuery) -> Query:
+    """Select the KAMS sessions whose measurements match the query's filters.
+
+    Sessions are found per test type from the measurement indexes (all of a
+    test's filters combined with AND or OR), then the test types' matches
+    are intersected ("all") or unioned ("any"). Rows carry the session,
+    its player and the value of every filter, labelled by ``filter_key``.
+    """
+    filters_by_test: Dict[str, List[KAMSMeasurementFilter]] = {}
+    for measurement_filter in query.filters:
+        filters_by_test.setdefault(measurement_filter.test_type, []).append(measurement_filter)
+
+    combine = and_ if query.match == "all" else or_
+    matching = [
+        select(KAMSResult.session_id).where(
+            KAMSResult.test_type == _literal(test_type),
+            combine(*(
+                _OPERATORS[f.op](_filter_expression(KAMSResult.measurements, f), f.value)
+                for f in filters
+            )),
+        )
+        for test_type, filters in filters_by_test.items()
+    ]
+    if len(matching) == 1:
+        session_ids = matching[0]
+    else:
+        session_ids = (intersect if query.match == "all" else union)(*matching)
+
+    results = {test_type: aliased(KAMSResult, name=f"kams_{test_type}") for test_type in filters_by_test}
+    values = [
+        _filter_expression(results[f.test_type].measurements, f).label(filter_key(f))
+        for f in query.filters
+    ]
+    stmt = (
+        db.query(
+            AssessmentSession.id.label("session_id"),
+            AssessmentSession.assessment_date,
+            AssessmentSession.player_id,
+            Player.player_code,
+            Player.first_name,
+            Player.last_name,
+            Player.team_id,
+            *values,
+        )
+        .join(Player, AssessmentSession.player_id == Player.id)
+        .filter(
+            AssessmentSession.assessment_type == "kams",
+            AssessmentSession.id.in_(session_ids),
+        )
+    )
+    for test_type, result in results.items():
+        stmt = stmt.outerjoin(
+            result, and_(result.session_id == AssessmentSession.id, result.test_type == test_type)
+        )
+
+    if query.team_id is not None:
+        stmt = stmt.filter(Player.team_id == query.team_id)
+    if query.sport_id is not None:
+        stmt = stmt.filter(Player.sport_id == query.sport_id)
+    if query.player_id is not None:
+        stmt = stmt.filter(AssessmentSession.player_id == query.player_id)
+    if query.start_date:
+        stmt = stmt.filter(AssessmentSession.assessment_date >= query.start_date)
+    if query.end_date:
+        stmt = stmt.filter(AssessmentSession.assessment_date <= query.end_date)
+    if query.is_complete is not None:
+        stmt = stmt.filter(AssessmentSession.is_complete == query.is_complete)
+
+    return stmt
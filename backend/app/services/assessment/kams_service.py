@@ -1,10 +1,12 @@
 from typing import Tuple, Optional, Dict, Any
+from app.core.metrics import timed_scoring
 from app.services.assessment.base_service import BaseScoringService, ColorResult
 
 
 class KAMSScoringService(BaseScoringService):
     """KAMS assessment scoring service."""
 
+    @timed_scoring
     def score_result(
         self, test_type: str, measurements: Dict[str, Any]
     ) -> Tuple[Optional[float], Optional[float]]:
@@ -157,6 +159,7 @@ class KAMSScoringService(BaseScoringService):
 
         return overall_score, symmetry_score
 
+    @timed_scoring
     def calculate_overall_assessment_score(
         self, results: list
     ) -> Tuple[float, ColorResult]:
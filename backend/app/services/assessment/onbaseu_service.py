@@ -1,10 +1,12 @@
 from typing import Tuple
+from app.core.metrics import timed_scoring
 from app.services.assessment.base_service import BaseScoringService, ColorResult
 
 
 class OnBaseUScoringService(BaseScoringService):
     """OnBaseU assessment scoring service."""
 
+    @timed_scoring
     def score_result(self, result: str) -> Tuple[int, ColorResult]:
         """Score an OnBaseU test result.
 
@@ -18,6 +20,7 @@ class OnBaseUScoringService(BaseScoringService):
         color = self.score_to_color(score)
         return score, color
 
+    @timed_scoring
     def calculate_category_score(self, results: list) -> float:
         """Calculate average score for a category.
 
@@ -35,6 +38,7 @@ class OnBaseUScoringService(BaseScoringService):
 
         return (total_score / max_score) * 100 if max_score > 0 else 0.0
 
+    @timed_scoring
     def calculate_overall_score(self, results: list) -> Tuple[float, ColorResult]:
         """Calculate overall assessment score.
 
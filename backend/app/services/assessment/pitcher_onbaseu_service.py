@@ -1,10 +1,12 @@
 from typing import Tuple
+from app.core.metrics import timed_scoring
 from app.services.assessment.base_service import BaseScoringService, ColorResult
 
 
 class PitcherOnBaseUScoringService(BaseScoringService):
     """Pitcher OnBaseU assessment scoring service."""
 
+    @timed_scoring
     def score_result(self, result: str) -> Tuple[int, ColorResult]:
         """Score a Pitcher OnBaseU test result.
 
@@ -18,6 +20,7 @@ class PitcherOnBaseUScoringService(BaseScoringService):
         color = self.score_to_color(score)
         return score, color
 
+    @timed_scoring
     def calculate_category_score(self, results: list) -> float:
         """Calculate average score for a category."""
         if not results:
@@ -28,6 +31,7 @@ class PitcherOnBaseUScoringService(BaseScoringService):
 
         return (total_score / max_score) * 100 if max_score > 0 else 0.0
 
+    @timed_scoring
     def calculate_overall_score(self, results: list) -> Tuple[float, ColorResult]:
         """Calculate overall assessment score."""
         percentage = self.calculate_category_score(results)
@@ -40,6 +44,7 @@ class PitcherOnBaseUScoringService(BaseScoringService):
         right_score = self.result_to_score(right_result)
         return left_score != right_score
 
+    @timed_scoring
     def analyze_throwing_arm_vs_glove_arm(
         self, results: list, throws: str
     ) -> dict:
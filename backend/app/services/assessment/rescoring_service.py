@@ -0,0 +1,296 @@
+from typing import Optional, List, Dict, Any, Callable, Sequence
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+import math
+import numpy as np
+from sqlalchemy import select, text, func
+from sqlalchemy.orm import Session, aliased
+
+from app.models import (
+    RescoreCheckpoint,
+    OnBaseUResult,
+    PitcherOnBaseUResult,
+    TPIPowerResult,
+    SprintResult,
+    KAMSResult,
+)
+from app.services.assessment.onbaseu_service import OnBaseUScoringService
+from app.services.assessment.pitcher_onbaseu_service import PitcherOnBaseUScoringService
+from app.services.assessment.tpi_power_service import TPIPowerScoringService
+from app.services.assessment.sprint_service import SprintScoringService
+from app.services.assessment.kams_service import KAMSScoringService
+from app.services.analysis.analytics_cube import AnalyticsCubeService
+from app.services.analysis.cache import analysis_cache, bump_shared_generation
+from app.services.analysis.player_analysis import PlayerAnalysisService
+
+RESCORE_RESULT_TYPES = ["onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"]
+
+# Result model and the scored columns written back, with their SQL types
+_TARGETS = {
+    "onbaseu": (OnBaseUResult, [("score", "integer"), ("color", "varchar")]),
+    "pitcher_onbaseu": (PitcherOnBaseUResult, [("score", "integer"), ("color", "varchar")]),
+    "tpi_power": (TPIPowerResult, [("score_percentage", "numeric"), ("color", "varchar")]),
+    "sprint": (SprintResult, [("score_percentage", "numeric"), ("color", "varchar")]),
+    "kams": (KAMSResult, [("overall_score", "numeric"), ("symmetry_score", "numeric")]),
+}
+
+
+class RescoringService:
+    """Rescore stored results against the current scoring thresholds.
+
+    Rows are streamed in primary-key order through a server-side cursor,
+    rescored one batch at a time and written back with a single
+    ``UPDATE ... FROM (VALUES ...)`` per batch. Each batch commits together
+    with its checkpoint, so an interrupted run resumes after the last
+    committed batch.
+    """
+
+    def __init__(self, db: Session, batch_size: int = 1000):
+        self.db = db
+        self.batch_size = batch_size
+        self.onbaseu_scoring = OnBaseUScoringService()
+        self.pitcher_onbaseu_scoring = PitcherOnBaseUScoringService()
+        self.tpi_scoring = TPIPowerScoringService()
+        self.sprint_scoring = SprintScoringService()
+        self.kams_scoring = KAMSScoringService()
+
+    def get_status(self, job_name: str) -> List[RescoreCheckpoint]:
+        """Get the checkpoints for a rescoring job."""
+        return (
+            self.db.query(RescoreCheckpoint)
+            .filter(RescoreCheckpoint.job_name == job_name)
+            .order_by(RescoreCheckpoint.id)
+            .all()
+        )
+
+    def prepare(
+        self, job_name: str, result_types: Sequence[str], restart: bool = False
+    ) -> List[RescoreCheckpoint]:
+        """Create (or reset, when restarting) the checkpoints for a job.
+
+        The caller is responsible for committing.
+        """
+        existing = {cp.result_type: cp for cp in self.get_status(job_name)}
+        checkpoints = []
+        for result_type in result_types:
+            checkpoint = existing.get(result_type)
+            if checkpoint is None:
+                checkpoint = RescoreCheckpoint(job_name=job_name, result_type=result_type)
+                self.db.add(checkpoint)
+            if checkpoint.status is None or restart:
+                checkpoint.status = "pending"
+                checkpoint.last_id = None
+                checkpoint.total_rows = None
+                checkpoint.rows_processed = 0
+                checkpoint.rows_changed = 0
+                checkpoint.error = None
+                checkpoint.started_at = None
+                checkpoint.completed_at = None
+            checkpoints.append(checkpoint)
+        self.db.flush()
+        return checkpoints
+
+    def run(
+        self,
+        job_name: str,
+        result_types: Sequence[str] = RESCORE_RESULT_TYPES,
+        restart: bool = False,
+        progress: Optional[Callable[[RescoreCheckpoint], None]] = None,
+    ) -> List[RescoreCheckpoint]:
+        """Rescore every requested result type, resuming from saved checkpoints."""
+        checkpoints = self.prepare(job_name, result_types, restart=restart)
+        self.db.commit()
+        for checkpoint in checkpoints:
+            if checkpoint.status == "completed":
+                continue
+            try:
+                self._run_checkpoint(checkpoint, progress)
+            except Exception as e:
+                self.db.rollback()
+                checkpoint.status = "failed"
+                checkpoint.error = str(e)
+                self.db.commit()
+                raise
+
+        # Includes rows changed before an interruption
+        if any(checkpoint.rows_changed for checkpoint in checkpoints):
+            AnalyticsCubeService(self.db).rebuild()
+            bump_shared_generation(self.db)
+            self.db.commit()
+            analysis_cache.clear()
+
+        return checkpoints
+
+    def _run_checkpoint(
+        self,
+        checkpoint: RescoreCheckpoint,
+        progress: Optional[Callable[[RescoreCheckpoint], None]],
+    ) -> None:
+        model, columns = _TARGETS[checkpoint.result_type]
+        score_rows = getattr(self, f"_score_{checkpoint.result_type}")
+        session_scores = PlayerAnalysisService(self.db)
+
+        stmt = self._select_rows(checkpoint.result_type)
+        count_stmt = select(func.count()).select_from(model)
+        if checkpoint.last_id is not None:
+            stmt = stmt.where(model.id > checkpoint.last_id)
+            count_stmt = count_stmt.where(model.id > checkpoint.last_id)
+
+        checkpoint.status = "running"
+        checkpoint.started_at = checkpoint.started_at or datetime.utcnow()
+        remaining = self.db.execute(count_stmt).scalar()
+        checkpoint.total_rows = checkpoint.rows_processed + remaining
+        self.db.commit()
+
+        # Read on a dedicated connection so per-batch commits don't close the cursor
+        with self.db.get_bind().connect() as read_conn:
+            result = read_conn.execution_options(
+                stream_results=True, yield_per=self.batch_size
+            ).execute(stmt.order_by(model.id))
+
+            for rows in result.partitions():
+                updates = []
+                affected_sessions = set()
+                for row, new_values in zip(rows, score_rows(rows)):
+                    old_values = tuple(getattr(row, name) for name, _ in columns)
+                    if not _same_values(old_values, new_values):
+                        updates.append((row.id, *new_values))
+                        affected_sessions.add(row.session_id)
+
+                if updates:
+                    self._write_batch(model.__table__.fullname, columns, updates)
+                    for session_id in affected_sessions:
+                        session_scores.refresh_session_scores(session_id, refresh_cube=False)
+
+                checkpoint.last_id = rows[-1].id
+                checkpoint.rows_processed += len(rows)
+                checkpoint.rows_changed += len(updates)
+                self.db.commit()
+
+                if progress:
+                    progress(checkpoint)
+
+        checkpoint.status = "completed"
+        checkpoint.completed_at = datetime.utcnow()
+        self.db.commit()
+        if progress:
+            progress(checkpoint)
+
+    def _select_rows(self, result_type: str):
+        """Build the streaming SELECT for a result type."""
+        if result_type in ("onbaseu", "pitcher_onbaseu"):
+            model = _TARGETS[result_type][0]
+            return select(model.id, model.session_id, model.result, model.score, model.color)
+        if result_type == "tpi_power":
+            vj = aliased(TPIPowerResult)
+            vertical_jump = (
+                select(vj.result_value)
+                .where(vj.session_id == TPIPowerResult.session_id, vj.test_code == "TPI-01")
+                .limit(1)
+                .scalar_subquery()
+            )
+            return select(
+                TPIPowerResult.id,
+                TPIPowerResult.session_id,
+                TPIPowerResult.test_name,
+                TPIPowerResult.result_value,
+                TPIPowerResult.side,
+                TPIPowerResult.score_percentage,
+                TPIPowerResult.color,
+                vertical_jump.label("vertical_jump"),
+            )
+        if result_type == "sprint":
+            return select(
+                SprintResult.id,
+                SprintResult.session_id,
+                SprintResult.test_name,
+                SprintResult.best_time,
+                SprintResult.score_percentage,
+                SprintResult.color,
+            )
+        if result_type == "kams":
+            return select(
+                KAMSResult.id,
+                KAMSResult.session_id,
+                KAMSResult.test_type,
+                KAMSResult.measurements,
+                KAMSResult.overall_score,
+                KAMSResult.symmetry_score,
+            )
+        raise ValueError(f"Unknown result type: {result_type}")
+
+    def _score_onbaseu(self, rows) -> List[tuple]:
+        return [self.onbaseu_scoring.score_result(row.result) for row in rows]
+
+    def _score_pitcher_onbaseu(self, rows) -> List[tuple]:
+        return [self.pitcher_onbaseu_scoring.score_result(row.result) for row in rows]
+
+    def _score_tpi_power(self, rows) -> List[tuple]:
+        percentages, colors = self.tpi_scoring.score_batch(
+            np.array([row.test_name for row in rows], dtype=object),
+            np.array([float(row.result_value) for row in rows]),
+            np.array([
+                float(row.vertical_jump) if row.vertical_jump is not None else np.nan
+                for row in rows
+            ]),
+            np.array([row.side == "left" for row in rows]),
+        )
+        return list(zip(_nan_to_none(percentages), colors))
+
+    def _score_sprint(self, rows) -> List[tuple]:
+        percentages, colors = self.sprint_scoring.score_batch(
+            np.array([row.test_name for row in rows], dtype=object),
+            np.array([float(row.best_time) if row.best_time else np.nan for row in rows]),
+        )
+        return list(zip(_nan_to_none(percentages), colors))
+
+    def _score_kams(self, rows) -> List[tuple]:
+        return [self.kams_scoring.score_result(row.test_type, row.measurements) for row in rows]
+
+    def _write_batch(self, table: str, columns: List[tuple], updates: List[tuple]) -> None:
+        """Write a batch of new scores with one UPDATE ... FROM (VALUES ...)."""
+        params: Dict[str, Any] = {}
+        value_rows = []
+        for i, values in enumerate(updates):
+            placeholders = [f"CAST(:id_{i} AS uuid)"]
+            params[f"id_{i}"] = str(values[0])
+            for j, (name, sql_type) in enumerate(columns):
+                placeholders.append(f"CAST(:{name}_{i} AS {sql_type})")
+                params[f"{name}_{i}"] = values[j + 1]
+            value_rows.append(f"({', '.join(placeholders)})")
+
+        column_names = [name for name, _ in columns]
+        self.db.execute(
+            text(f"""
+                UPDATE {table} AS t
+                SET {', '.join(f'{name} = v.{name}' for name in column_names)}
+                FROM (VALUES {', '.join(value_rows)}) AS v(id, {', '.join(column_names)})
+                WHERE t.id = v.id
+            """),
+            params,
+        )
+
+
+def _nan_to_none(values: np.ndarray) -> List[Optional[float]]:
+    return [None if math.isnan(v) else float(v) for v in values]
+
+
+def _same_values(old: tuple, new: tuple) -> bool:
+    """Compare stored and recomputed scores at the stored (2 decimal) precision."""
+    for old_value, new_value in zip(old, new):
+        if old_value is None or new_value is None:
+            if old_value is not new_value:
+                return False
+        elif isinstance(new_value, str) or isinstance(old_value, str):
+            if old_value != new_value:
+                return False
+        elif _to_stored_precision(old_value) != _to_stored_precision(new_value):
+            return False
+    return True
+
+
+def _to_stored_precision(value) -> Decimal:
+    """Round half-up to 2 decimals, as PostgreSQL does when casting to NUMERIC(5, 2)."""
+    return Decimal(repr(value) if isinstance(value, float) else str(value)).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
@@ -0,0 +1,155 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterator, List, Literal, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, String, cast, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+
+from app.db.session import engine
+from app.models import AssessmentSession, Player
+from app.services.analysis.player_analysis import RESULT_MODELS
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Result columns left out of exports (the session columns cover them)
+_SKIPPED_RESULT_COLUMNS = {"session_id"}
+
+
+def _exported(column, name: str):
+    # Ids go out as text; parsing them into UUID objects only to print them is costly
+    if isinstance(column.type, PG_UUID):
+        return cast(column, String).label(name)
+    return column.label(name)
+
+
+def build_export_query(
+    assessment_type: str,
+    team_id: Optional[int] = None,
+    sport_id: Optional[int] = None,
+    player_id: Optional[UUID] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    is_complete: Optional[bool] = None,
+) -> Select:
+    """Select one assessment type's results with their session and player.
+
+    Rows start with ``player_code`` and ``assessment_date`` followed by the
+    result's own columns, so an export can be imported again as is. They
+    are ordered by session, keeping each session's results together.
+    """
+    model = RESULT_MODELS[assessment_type]
+    result_columns = [
+        _exported(column, "result_id" if column.name == "id" else column.name)
+        for column in model.__table__.columns
+        if column.name not in _SKIPPED_RESULT_COLUMNS
+    ]
+    stmt = (
+        select(
+            Player.player_code,
+            AssessmentSession.assessment_date,
+            _exported(AssessmentSession.id, "session_id"),
+            _exported(AssessmentSession.player_id, "player_id"),
+            Player.first_name,
+            Player.last_name,
+            Player.team_id,
+            Player.sport_id,
+            AssessmentSession.is_complete,
+            AssessmentSession.overall_score.label("session_score"),
+            AssessmentSession.color.label("session_color"),
+            *result_columns,
+        )
+        .join(AssessmentSession, model.session_id == AssessmentSession.id)
+        .join(Player, AssessmentSession.player_id == Player.id)
+        .where(AssessmentSession.assessment_type == assessment_type)
+    )
+
+    if team_id is not None:
+        stmt = stmt.where(Player.team_id == team_id)
+    if sport_id is not None:
+        stmt = stmt.where(Player.sport_id == sport_id)
+    if player_id is not None:
+        stmt = stmt.where(AssessmentSession.player_id == player_id)
+    if start_date:
+        stmt = stmt.where(AssessmentSession.assessment_date >= start_date)
+    if end_date:
+        stmt = stmt.where(AssessmentSession.assessment_date <= end_date)
+    if is_complete is not None:
+        stmt = stmt.where(AssessmentSession.is_complete == is_complete)
+
+    return stmt.order_by(AssessmentSession.assessment_date, AssessmentSession.id, model.id)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_rows(
+    rows: List[Any], columns: List[str], json_columns: List[int], file_format: ExportFormat, header: bool
+) -> str:
+    if file_format == "ndjson":
+        return "".join(
+            json.dumps(dict(zip(columns, row)), default=_json_default) + "\n" for row in rows
+        )
+
+    if json_columns:
+        rows = [list(row) for row in rows]
+        for row in rows:
+            for index in json_columns:
+                row[index] = json.dumps(row[index], default=_json_default)
+    buffer = io.StringIO()
+    # csv writes None as an empty cell and everything else through str()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def stream_export(
+    stmt: Select,
+    file_format: ExportFormat,
+    compress: bool = False,
+    batch_size: int = 2000,
+) -> Iterator[bytes]:
+    """Encode the rows of an export query as they are read.
+
+    Rows come from a server-side cursor one batch at a time and each batch
+    is encoded (and optionally gzip-compressed) before the next is read, so
+    memory stays flat however large the export. The query runs on its own
+    connection: a streamed response outlives the request's database session.
+    """
+    # wbits=31 writes a gzip container rather than a bare zlib stream
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+        columns = list(result.keys())
+        json_columns = [
+            index for index, column in enumerate(stmt.selected_columns) if isinstance(column.type, JSONB)
+        ]
+        header = True
+        for rows in result.partitions():
+            chunk = _encode_rows(rows, columns, json_columns, file_format, header).encode()
+            header = False
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+        if header:
+            # No rows: still write the CSV header
+            chunk = _encode_rows([], columns, json_columns, file_format, True).encode()
+            yield compressor.compress(chunk) if compressor else chunk
+
+    if compressor:
+        yield compressor.flush()
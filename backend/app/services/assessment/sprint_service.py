@@ -1,5 +1,15 @@
 from typing import Tuple, Optional
-from app.services.assessment.base_service import BaseScoringService, ColorResult
+import numpy as np
+from app.core.metrics import timed_scoring
+from app.services.assessment.base_service import (
+    BaseScoringService,
+    ColorResult,
+    BATCH_COLORS,
+    COLOR_NONE,
+    COLOR_GREEN,
+    COLOR_YELLOW,
+    COLOR_RED,
+)
 
 
 class SprintScoringService(BaseScoringService):
@@ -13,6 +23,7 @@ class SprintScoringService(BaseScoringService):
         "Curvilinear Sprint": {"optimal": 2.00, "adequate": 2.20},
     }
 
+    @timed_scoring
     def score_result(
         self, test_name: str, time: float
     ) -> Tuple[Optional[float], Optional[ColorResult]]:
@@ -47,6 +58,60 @@ class SprintScoringService(BaseScoringService):
             percentage = max(0, 70 - overage * 100)
             return percentage, "red"
 
+    @timed_scoring
+    def score_batch(
+        self, test_names: np.ndarray, times: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score many sprint results at once.
+
+        Produces exactly the same values as calling ``score_result`` per row.
+
+        Args:
+            test_names: Array of test names
+            times: Array of best times in seconds (NaN when missing)
+
+        Returns:
+            Tuple of (percentages, colors); unscoreable rows are NaN / None
+        """
+        test_names = np.asarray(test_names, dtype=object)
+        times = np.asarray(times, dtype=np.float64)
+        n = times.shape[0]
+
+        index = self._compile_batch_table()
+        codes = np.fromiter((index.get(name, -1) for name in test_names), np.int64, n)
+
+        percentages = np.full(n, np.nan)
+        color_codes = np.full(n, COLOR_NONE, dtype=np.int8)
+
+        scored = (codes >= 0) & ~np.isnan(times)
+        if scored.any():
+            t = times[scored]
+            optimal, adequate = self._batch_table[codes[scored]].T
+            conditions = [t <= optimal, t <= adequate]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                percentages[scored] = np.select(
+                    conditions,
+                    [100.0, 85 + (1 - (t - optimal) / (adequate - optimal)) * 15],
+                    default=np.maximum(0, 70 - ((t - adequate) / adequate) * 100),
+                )
+            color_codes[scored] = np.select(conditions, [COLOR_GREEN, COLOR_YELLOW], default=COLOR_RED)
+
+        return percentages, BATCH_COLORS[color_codes]
+
+    def _compile_batch_table(self) -> dict:
+        """Compile THRESHOLDS into a NumPy lookup table, recompiling when it changes."""
+        key = tuple((name, tuple(t.items())) for name, t in self.THRESHOLDS.items())
+        if getattr(self, "_batch_table_key", None) != key:
+            names = list(self.THRESHOLDS)
+            self._batch_table = np.array(
+                [[self.THRESHOLDS[name]["optimal"], self.THRESHOLDS[name]["adequate"]] for name in names],
+                dtype=np.float64,
+            ).reshape(-1, 2)
+            self._batch_index = {name: i for i, name in enumerate(names)}
+            self._batch_table_key = key
+        return self._batch_index
+
+    @timed_scoring
     def calculate_category_scores(self, results: list) -> dict:
         """Calculate scores by sprint category.
 
@@ -80,6 +145,7 @@ class SprintScoringService(BaseScoringService):
 
         return scores
 
+    @timed_scoring
     def calculate_overall_score(self, results: list) -> Tuple[float, ColorResult]:
         """Calculate overall sprint score.
 
@@ -99,6 +165,7 @@ class SprintScoringService(BaseScoringService):
 
         return avg_percentage, color
 
+    @timed_scoring
     def analyze_directional_balance(self, results: list) -> dict:
         """Analyze balance between directional sprint directions.
 
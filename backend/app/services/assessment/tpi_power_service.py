@@ -1,5 +1,16 @@
 from typing import Tuple, Optional
-from app.services.assessment.base_service import BaseScoringService, ColorResult
+import numpy as np
+from app.core.metrics import timed_scoring
+from app.services.assessment.base_service import (
+    BaseScoringService,
+    ColorResult,
+    BATCH_COLORS,
+    COLOR_NONE,
+    COLOR_BLUE,
+    COLOR_GREEN,
+    COLOR_YELLOW,
+    COLOR_RED,
+)
 
 
 class TPIPowerScoringService(BaseScoringService):
@@ -18,6 +29,7 @@ class TPIPowerScoringService(BaseScoringService):
 
     OFF_SIDE_FACTOR = 0.9
 
+    @timed_scoring
     def score_result(
         self,
         test_name: str,
@@ -47,6 +59,112 @@ class TPIPowerScoringService(BaseScoringService):
 
         return None, None
 
+    @timed_scoring
+    def score_batch(
+        self,
+        test_names: np.ndarray,
+        values: np.ndarray,
+        vertical_jumps: Optional[np.ndarray] = None,
+        is_off_side: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score many TPI Power results at once.
+
+        Produces exactly the same values as calling ``score_result`` per row.
+
+        Args:
+            test_names: Array of test names
+            values: Array of measured values in inches
+            vertical_jumps: Array of vertical jump references (NaN when missing)
+            is_off_side: Boolean array flagging off-side shot put throws
+
+        Returns:
+            Tuple of (percentages, colors); unscoreable rows are NaN / None
+        """
+        test_names = np.asarray(test_names, dtype=object)
+        values = np.asarray(values, dtype=np.float64)
+        n = values.shape[0]
+        if vertical_jumps is None:
+            vertical_jumps = np.full(n, np.nan)
+        vertical_jumps = np.asarray(vertical_jumps, dtype=np.float64)
+        if is_off_side is None:
+            is_off_side = np.zeros(n, dtype=bool)
+        is_off_side = np.asarray(is_off_side, dtype=bool)
+
+        # Map test names to rows of the compiled threshold tables
+        absolute_idx, relative_idx = self._compile_batch_tables()
+        abs_code = np.fromiter((absolute_idx.get(name, -1) for name in test_names), np.int64, n)
+        rel_code = np.fromiter((relative_idx.get(name, -1) for name in test_names), np.int64, n)
+
+        percentages = np.full(n, np.nan)
+        color_codes = np.full(n, COLOR_NONE, dtype=np.int8)
+
+        # Absolute tests (vertical jump, broad jump)
+        is_abs = abs_code >= 0
+        if is_abs.any():
+            v = values[is_abs]
+            blue, green, yellow = self._batch_absolute_table[abs_code[is_abs]].T
+            with np.errstate(divide="ignore", invalid="ignore"):
+                conditions = [v >= blue, v >= green, v >= yellow]
+                percentages[is_abs] = np.select(
+                    conditions,
+                    [
+                        100.0,
+                        85.0 + ((v - green) / (blue - green)) * 15,
+                        70.0 + ((v - yellow) / (green - yellow)) * 15,
+                    ],
+                    default=np.maximum(0, (v / yellow) * 70),
+                )
+            color_codes[is_abs] = np.select(conditions, [COLOR_BLUE, COLOR_GREEN, COLOR_YELLOW], default=COLOR_RED)
+
+        # Tests scored relative to vertical jump
+        is_rel = (rel_code >= 0) & ~np.isnan(vertical_jumps)
+        if is_rel.any():
+            v = values[is_rel]
+            codes = rel_code[is_rel]
+            threshold = self._batch_relative_table[codes]
+            off_side = is_off_side[is_rel] & (codes == relative_idx.get("Baseline Shot Put", -1))
+            threshold = np.where(off_side, threshold * self.OFF_SIDE_FACTOR, threshold)
+            target = vertical_jumps[is_rel] * threshold
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pct = np.where(target > 0, (v / target) * 100, 0.0)
+            pct = np.minimum(pct, 100.0)
+            percentages[is_rel] = pct
+            color_codes[is_rel] = np.select(
+                [pct >= 100, pct >= 85, pct >= 70], [COLOR_BLUE, COLOR_GREEN, COLOR_YELLOW], default=COLOR_RED
+            )
+
+        return percentages, BATCH_COLORS[color_codes]
+
+    def _compile_batch_tables(self) -> Tuple[dict, dict]:
+        """Compile the threshold dictionaries into NumPy lookup tables.
+
+        Recompiled only when the threshold dictionaries change.
+        """
+        key = (
+            tuple((name, tuple(t.items())) for name, t in self.THRESHOLDS.items()),
+            tuple(self.RELATIVE_THRESHOLDS.items()),
+        )
+        if getattr(self, "_batch_tables_key", None) != key:
+            absolute_names = list(self.THRESHOLDS)
+            relative_names = list(self.RELATIVE_THRESHOLDS)
+            self._batch_absolute_table = np.array(
+                [
+                    [self.THRESHOLDS[name]["blue"], self.THRESHOLDS[name]["green"], self.THRESHOLDS[name]["yellow"]]
+                    for name in absolute_names
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 3)
+            self._batch_relative_table = np.array(
+                [self.RELATIVE_THRESHOLDS[name] for name in relative_names], dtype=np.float64
+            )
+            self._batch_indexes = (
+                {name: i for i, name in enumerate(absolute_names)},
+                {name: i for i, name in enumerate(relative_names)},
+            )
+            self._batch_tables_key = key
+        return self._batch_indexes
+
     def _score_vertical_jump(self, value: float) -> Tuple[float, ColorResult]:
         """Score vertical jump test."""
         thresholds = self.THRESHOLDS["Vertical Jump"]
@@ -124,6 +242,7 @@ class TPIPowerScoringService(BaseScoringService):
         color = self.percentage_to_color(percentage, include_blue=True)
         return percentage, color
 
+    @timed_scoring
     def calculate_overall_score(self, results: list) -> Tuple[float, ColorResult]:
         """Calculate overall TPI Power score.
 
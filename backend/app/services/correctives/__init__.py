@@ -0,0 +1,3 @@
+from app.services.correctives.recommendations import CorrectiveRecommendationService, mapping_index
+
+__all__ = ["CorrectiveRecommendationService", "mapping_index"]
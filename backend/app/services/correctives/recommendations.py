@@ -0,0 +1,304 @@
+import time
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import (
+    AssessmentSession,
+    Exercise,
+    ExerciseMapping,
+    OnBaseUResult,
+    PitcherOnBaseUResult,
+    Player,
+    Team,
+)
+from app.schemas.corrective import (
+    CorrectiveFinding,
+    ExerciseRecommendation,
+    SessionRecommendations,
+    TeamExerciseRecommendation,
+    TeamRecommendations,
+)
+from app.services.analysis.player_analysis import PlayerAnalysisService
+
+settings = get_settings()
+
+# Assessment types whose results map to corrective exercises
+CORRECTIVE_RESULT_MODELS = {
+    "onbaseu": OnBaseUResult,
+    "pitcher_onbaseu": PitcherOnBaseUResult,
+}
+
+# Result score (1=Fail, 2=Neutral, 3=Pass) to the mapping condition it triggers
+SCORE_CONDITIONS = {1: "fail", 2: "neutral"}
+
+# Findings and equally prioritised exercises are listed most severe first
+CONDITION_SEVERITY = {"fail": 0, "asymmetry": 1, "neutral": 2}
+
+MappingKey = Tuple[str, str, str]
+
+
+class MappedExercise(NamedTuple):
+    exercise_id: int
+    name: str
+    body_part: Optional[str]
+    movement_category: Optional[str]
+    difficulty_level: Optional[str]
+    video_url: Optional[str]
+    priority: int
+
+
+class MappingIndex:
+    """Exercise mappings keyed by (assessment_type, test_code, result_condition).
+
+    The whole mapping table is loaded with one query on first use, each
+    key's exercises sorted by priority. The index is per process: mapping
+    writes call invalidate() so this process reloads on next use, and other
+    processes reload once the TTL has passed.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._mappings: Optional[Dict[MappingKey, List[MappedExercise]]] = None
+        self._expires_at = 0.0
+        self._lock = Lock()
+        self.loads = 0
+
+    def get(self, db: Session) -> Dict[MappingKey, List[MappedExercise]]:
+        """Get the index, loading it if it is missing or expired."""
+        with self._lock:
+            if self._mappings is None or time.monotonic() >= self._expires_at:
+                self._mappings = self._load(db)
+                self._expires_at = time.monotonic() + self.ttl_seconds
+                self.loads += 1
+            return self._mappings
+
+    def invalidate(self) -> None:
+        """Reload the index on next use."""
+        with self._lock:
+            self._mappings = None
+
+    @staticmethod
+    def _load(db: Session) -> Dict[MappingKey, List[MappedExercise]]:
+        priority = func.coalesce(ExerciseMapping.priority, 1).label("priority")
+        rows = (
+            db.query(
+                ExerciseMapping.assessment_type,
+                ExerciseMapping.test_code,
+                ExerciseMapping.result_condition,
+                priority,
+                Exercise.id,
+                Exercise.name,
+                Exercise.body_part,
+                Exercise.movement_category,
+                Exercise.difficulty_level,
+                Exercise.video_url,
+            )
+            .join(Exercise, ExerciseMapping.exercise_id == Exercise.id)
+            .order_by(priority, Exercise.name, Exercise.id)
+            .all()
+        )
+
+        mappings: Dict[MappingKey, List[MappedExercise]] = {}
+        for row in rows:
+            mappings.setdefault(
+                (row.assessment_type, row.test_code, row.result_condition), []
+            ).append(MappedExercise(
+                row.id,
+                row.name,
+                row.body_part,
+                row.movement_category,
+                row.difficulty_level,
+                row.video_url,
+                row.priority,
+            ))
+        return mappings
+
+
+mapping_index = MappingIndex(settings.CORRECTIVE_INDEX_TTL_SECONDS)
+
+
+def find_conditions(results: List[Any]) -> List[CorrectiveFinding]:
+    """Failing, neutral and left/right asymmetric results of one session.
+
+    ``results`` need ``test_code``, ``test_name``, ``side``, ``result`` and
+    ``score``. A bilateral test is asymmetric when its sides scored
+    differently. Findings are ordered most severe first.
+    """
+    findings = []
+    sides: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        condition = SCORE_CONDITIONS.get(result.score)
+        if condition:
+            findings.append(CorrectiveFinding(
+                test_code=result.test_code,
+                test_name=result.test_name,
+                side=result.side,
+                condition=condition,
+                result=result.result,
+            ))
+        if result.side in ("left", "right"):
+            sides.setdefault(result.test_code, {})[result.side] = result
+
+    for test_code, by_side in sides.items():
+        left, right = by_side.get("left"), by_side.get("right")
+        if left is not None and right is not None and left.score != right.score:
+            findings.append(CorrectiveFinding(
+                test_code=test_code,
+                test_name=left.test_name,
+                condition="asymmetry",
+                result=f"{left.result}/{right.result}",
+            ))
+
+    findings.sort(key=lambda f: (CONDITION_SEVERITY[f.condition], f.test_code, f.side or ""))
+    return findings
+
+
+def recommend_exercises(
+    assessment_type: str,
+    findings: List[CorrectiveFinding],
+    mappings: Dict[MappingKey, List[MappedExercise]],
+) -> Tuple[List[ExerciseRecommendation], List[CorrectiveFinding]]:
+    """Turn findings into prioritised exercises, plus the findings nothing maps to.
+
+    An exercise recommended for several findings is listed once, with every
+    finding as a reason and the best priority among its mappings. Exercises
+    are ordered by priority, then by their most severe reason, then by how
+    many findings they address.
+    """
+    exercises: Dict[int, ExerciseRecommendation] = {}
+    unmapped = []
+    for finding in findings:
+        mapped = mappings.get((assessment_type, finding.test_code, finding.condition))
+        if not mapped:
+            unmapped.append(finding)
+            continue
+        for exercise in mapped:
+            recommendation = exercises.get(exercise.exercise_id)
+            if recommendation is None:
+                exercises[exercise.exercise_id] = ExerciseRecommendation(
+                    exercise_id=exercise.exercise_id,
+                    name=exercise.name,
+                    body_part=exercise.body_part,
+                    movement_category=exercise.movement_category,
+                    difficulty_level=exercise.difficulty_level,
+                    video_url=exercise.video_url,
+                    priority=exercise.priority,
+                    reasons=[finding],
+                )
+            else:
+                recommendation.priority = min(recommendation.priority, exercise.priority)
+                recommendation.reasons.append(finding)
+
+    ordered = sorted(
+        exercises.values(),
+        key=lambda r: (r.priority, CONDITION_SEVERITY[r.reasons[0].condition], -len(r.reasons), r.name),
+    )
+    return ordered, unmapped
+
+
+class CorrectiveRecommendationService:
+    """Corrective exercise recommendations for sessions and teams."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def for_session(self, session: AssessmentSession, player_name: Optional[str] = None) -> SessionRecommendations:
+        """Recommend exercises for one OnBaseU or Pitcher OnBaseU session."""
+        return self._recommend_sessions([session], {session.player_id: player_name})[0]
+
+    def for_team(self, team: Team) -> TeamRecommendations:
+        """Recommend exercises for every active player on a team.
+
+        Uses each player's latest complete OnBaseU and Pitcher OnBaseU
+        session. Sessions and results are bulk-loaded (one query per result
+        table) and the whole roster is matched against the mapping index in
+        one pass.
+        """
+        players = (
+            self.db.query(Player.id, Player.first_name, Player.last_name)
+            .filter(Player.team_id == team.id, Player.is_active == True)
+            .order_by(Player.last_name, Player.first_name, Player.id)
+            .all()
+        )
+        names = {player.id: f"{player.first_name} {player.last_name}" for player in players}
+        order = {player.id: index for index, player in enumerate(players)}
+
+        sessions = PlayerAnalysisService(self.db)._get_latest_sessions(
+            list(names), list(CORRECTIVE_RESULT_MODELS)
+        )
+        sessions.sort(key=lambda s: (order[s.player_id], s.assessment_type))
+        recommendations = self._recommend_sessions(sessions, names)
+
+        # Roster-wide view: which players need each exercise
+        team_exercises: Dict[int, TeamExerciseRecommendation] = {}
+        for session in recommendations:
+            for exercise in session.exercises:
+                entry = team_exercises.get(exercise.exercise_id)
+                if entry is None:
+                    team_exercises[exercise.exercise_id] = TeamExerciseRecommendation(
+                        **exercise.model_dump(exclude={"reasons"}),
+                        player_count=1,
+                        player_ids=[session.player_id],
+                    )
+                else:
+                    entry.priority = min(entry.priority, exercise.priority)
+                    if session.player_id not in entry.player_ids:
+                        entry.player_ids.append(session.player_id)
+                        entry.player_count += 1
+
+        return TeamRecommendations(
+            team_id=team.id,
+            team_name=team.name,
+            exercises=sorted(
+                team_exercises.values(), key=lambda e: (-e.player_count, e.priority, e.name)
+            ),
+            players=recommendations,
+        )
+
+    def _recommend_sessions(
+        self, sessions: List[AssessmentSession], names: Dict[UUID, Optional[str]]
+    ) -> List[SessionRecommendations]:
+        results_by_session = self._load_results(sessions)
+        mappings = mapping_index.get(self.db)
+
+        recommendations = []
+        for session in sessions:
+            findings = find_conditions(results_by_session[session.id])
+            exercises, unmapped = recommend_exercises(session.assessment_type, findings, mappings)
+            recommendations.append(SessionRecommendations(
+                session_id=session.id,
+                player_id=session.player_id,
+                player_name=names.get(session.player_id),
+                assessment_type=session.assessment_type,
+                assessment_date=session.assessment_date,
+                exercises=exercises,
+                unmapped=unmapped,
+            ))
+        return recommendations
+
+    def _load_results(self, sessions: List[AssessmentSession]) -> Dict[UUID, List[Any]]:
+        """Load the scored results of many sessions, one query per result table."""
+        session_ids_by_type: Dict[str, List[UUID]] = {}
+        for session in sessions:
+            session_ids_by_type.setdefault(session.assessment_type, []).append(session.id)
+
+        results_by_session: Dict[UUID, List[Any]] = {session.id: [] for session in sessions}
+        for assess_type, session_ids in session_ids_by_type.items():
+            model = CORRECTIVE_RESULT_MODELS[assess_type]
+            rows = self.db.query(
+                model.session_id,
+                model.test_code,
+                model.test_name,
+                model.side,
+                model.result,
+                model.score,
+            ).filter(model.session_id.in_(session_ids))
+            for row in rows:
+                results_by_session[row.session_id].append(row)
+
+        return results_by_session
@@ -0,0 +1,4 @@
+from app.services.jobs.queue import enqueue_job, cancel_job, find_active_job, JobCancelled
+from app.services.jobs.handlers import JOB_HANDLERS, job_handler
+
+__all__ = ["enqueue_job", "cancel_job", "find_active_job", "JobCancelled", "JOB_HANDLERS", "job_handler"]
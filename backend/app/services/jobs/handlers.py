@@ -0,0 +1,54 @@
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.services.analysis.analytics_cube import AnalyticsCubeService
+from app.services.analysis.cache import analysis_cache, bump_shared_generation
+from app.services.assessment.rescoring_service import RescoringService, RESCORE_RESULT_TYPES
+
+# progress(current, total=None, message=None); raises JobCancelled once the job is cancelled
+JobProgress = Callable[..., None]
+
+# A handler runs one job on its own database session, commits its own work
+# and returns a JSON-serialisable result (or None). Raising fails the
+# attempt; the job is retried with backoff until it runs out of attempts.
+JobHandler = Callable[[Session, Dict[str, Any], JobProgress], Optional[Dict[str, Any]]]
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """Register a function as the handler for a job type."""
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[job_type] = handler
+        return handler
+    return register
+
+
+@job_handler("rescore")
+def run_rescore(db: Session, payload: Dict[str, Any], progress: JobProgress) -> Dict[str, Any]:
+    """Rescore stored results; payload as the rescore endpoint's request."""
+    service = RescoringService(db, batch_size=payload.get("batch_size", 1000))
+    checkpoints = service.run(
+        payload["job_name"],
+        payload.get("result_types", RESCORE_RESULT_TYPES),
+        restart=payload.get("restart", False),
+        progress=lambda checkpoint: progress(
+            checkpoint.rows_processed,
+            checkpoint.total_rows,
+            f"{checkpoint.result_type}: {checkpoint.status}",
+        ),
+    )
+    return {
+        "rows_processed": sum(checkpoint.rows_processed for checkpoint in checkpoints),
+        "rows_changed": sum(checkpoint.rows_changed for checkpoint in checkpoints),
+    }
+
+
+@job_handler("rebuild_analytics_cube")
+def run_rebuild_analytics_cube(db: Session, payload: Dict[str, Any], progress: JobProgress) -> None:
+    """Recompute the analytics cube from all completed sessions."""
+    AnalyticsCubeService(db).rebuild()
+    bump_shared_generation(db)
+    db.commit()
+    analysis_cache.clear()
@@ -0,0 +1,303 @@
+import json
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import case, func, select, text, update
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import Job
+
+settings = get_settings()
+
+# Statuses a job never leaves
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+# Serialises find_active_job() callers checking the same job type and payload
+_ACTIVE_JOB_LOCK_ID = 0x5350_0003
+
+
+class JobCancelled(Exception):
+    """Raised in a running handler, at its next progress report, once its job is cancelled."""
+
+
+class JobLockLost(Exception):
+    """Raised when a worker no longer holds the job it is running.
+
+    The job was released as stale (and may have been claimed by another
+    worker) or otherwise left the running state, so this worker must not
+    record anything on it.
+    """
+
+
+def worker_name() -> str:
+    """Identify this worker process in the jobs it claims."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt: doubles per attempt, capped."""
+    seconds = settings.JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_MAX_SECONDS))
+
+
+def enqueue_job(
+    db: Session,
+    job_type: str,
+    payload: Optional[Dict[str, Any]] = None,
+    priority: int = 0,
+    max_attempts: Optional[int] = None,
+    run_at: Optional[datetime] = None,
+    created_by: Optional[UUID] = None,
+) -> Job:
+    """Add a job to the queue. The caller is responsible for committing."""
+    job = Job(
+        job_type=job_type,
+        payload=payload or {},
+        status="queued",
+        priority=priority,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=run_at or datetime.utcnow(),
+        created_by=created_by,
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+
+def find_active_job(db: Session, job_type: str, payload_match: Dict[str, Any]) -> Optional[Job]:
+    """The queued or running job of a type whose payload contains ``payload_match``.
+
+    Takes a transaction-level advisory lock on the type and match first, so
+    a caller that enqueues when nothing is active holds off concurrent
+    callers until it commits, and they then see its job. A running job
+    whose worker died stays active until another worker's heartbeat
+    releases it (see requeue_stale_jobs), then it is retried.
+    """
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(:jobs, hashtext(:key))"),
+        {"jobs": _ACTIVE_JOB_LOCK_ID, "key": f"{job_type}:{json.dumps(payload_match, sort_keys=True)}"},
+    )
+    return (
+        db.query(Job)
+        .filter(
+            Job.job_type == job_type,
+            Job.status.in_(("queued", "running")),
+            Job.payload.contains(payload_match),
+        )
+        .order_by(Job.created_at)
+        .first()
+    )
+
+
+def claim_job(db: Session, worker: str, job_types: Optional[Sequence[str]] = None) -> Optional[Job]:
+    """Claim the next due job, or return None when there is none.
+
+    The candidate is locked with ``FOR UPDATE SKIP LOCKED``, so concurrent
+    workers (threads, processes or nodes) each claim a different job without
+    waiting on each other. The job is returned detached from ``db``.
+    """
+    now = datetime.utcnow()
+    candidate = (
+        select(Job.id)
+        .where(Job.status == "queued", Job.run_at <= now)
+        .order_by(Job.priority.desc(), Job.run_at, Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if job_types:
+        candidate = candidate.where(Job.job_type.in_(job_types))
+
+    job = db.scalars(
+        update(Job)
+        .where(Job.id == candidate.scalar_subquery())
+        .values(
+            status="running",
+            attempts=Job.attempts + 1,
+            locked_by=worker,
+            heartbeat_at=now,
+            started_at=func.coalesce(Job.started_at, now),
+            updated_at=now,
+        )
+        .returning(Job),
+        execution_options={"synchronize_session": False, "populate_existing": True},
+    ).one_or_none()
+    if job is not None:
+        # Detached, so the commit doesn't expire it: the worker keeps the
+        # attempt it claimed rather than reloading whatever claim is current
+        db.expunge(job)
+    db.commit()
+    return job
+
+
+def _held_by(job: Job, worker: str):
+    """Match a job only while this worker's claim (this attempt) still holds it."""
+    return (
+        Job.id == job.id,
+        Job.status == "running",
+        Job.locked_by == worker,
+        Job.attempts == job.attempts,
+    )
+
+
+def report_progress(
+    db: Session,
+    job: Job,
+    worker: str,
+    current: Optional[int] = None,
+    total: Optional[int] = None,
+    message: Optional[str] = None,
+) -> None:
+    """Record a running job's progress (also a heartbeat).
+
+    Raises JobCancelled if the job has been cancelled meanwhile, and
+    JobLockLost if this worker no longer holds it.
+    """
+    now = datetime.utcnow()
+    row = db.execute(
+        update(Job)
+        .where(*_held_by(job, worker))
+        .values(
+            progress_current=current,
+            progress_total=total,
+            progress_message=message[:255] if message else None,
+            heartbeat_at=now,
+            updated_at=now,
+        )
+        .returning(Job.cancel_requested),
+        execution_options={"synchronize_session": False},
+    ).one_or_none()
+    db.commit()
+    if row is None:
+        raise JobLockLost()
+    if row.cancel_requested:
+        raise JobCancelled()
+
+
+def heartbeat(db: Session, worker: str) -> None:
+    """Mark every job this worker is running as still alive."""
+    db.execute(
+        update(Job)
+        .where(Job.status == "running", Job.locked_by == worker)
+        .values(heartbeat_at=datetime.utcnow()),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
+
+
+def finish_job(
+    db: Session,
+    job: Job,
+    worker: str,
+    status: str,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> None:
+    """Record a job this worker is running as completed, failed or cancelled.
+
+    Raises JobLockLost, recording nothing, if this worker no longer holds it.
+    """
+    now = datetime.utcnow()
+    finished = db.execute(
+        update(Job)
+        .where(*_held_by(job, worker))
+        .values(
+            status=status,
+            result=result,
+            last_error=error,
+            locked_by=None,
+            finished_at=now,
+            updated_at=now,
+        ),
+        execution_options={"synchronize_session": False},
+    ).rowcount
+    db.commit()
+    if not finished:
+        raise JobLockLost()
+
+
+def retry_or_fail_job(db: Session, job: Job, worker: str, error: str) -> bool:
+    """Requeue a job that raised, with backoff, until it runs out of attempts.
+
+    A job whose cancellation was requested is cancelled instead. Returns
+    whether the job will be retried; raises JobLockLost, recording nothing,
+    if this worker no longer holds it.
+    """
+    if job.attempts >= job.max_attempts:
+        finish_job(db, job, worker, "failed", error=error)
+        return False
+
+    now = datetime.utcnow()
+    status = db.execute(
+        update(Job)
+        .where(*_held_by(job, worker))
+        .values(
+            status=case((Job.cancel_requested, "cancelled"), else_="queued"),
+            finished_at=case((Job.cancel_requested, now), else_=None),
+            run_at=now + retry_delay(job.attempts),
+            last_error=error,
+            locked_by=None,
+            heartbeat_at=None,
+            updated_at=now,
+        )
+        .returning(Job.status),
+        execution_options={"synchronize_session": False},
+    ).scalar()
+    db.commit()
+    if status is None:
+        raise JobLockLost()
+    return status == "queued"
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """Retry (or fail, if out of attempts) running jobs whose worker stopped heartbeating.
+
+    Returns the number of jobs released.
+    """
+    now = datetime.utcnow()
+    out_of_attempts = Job.attempts >= Job.max_attempts
+    released = db.execute(
+        update(Job)
+        .where(
+            Job.status == "running",
+            Job.heartbeat_at < now - timedelta(seconds=settings.JOB_STALE_SECONDS),
+        )
+        .values(
+            status=case((out_of_attempts, "failed"), else_="queued"),
+            finished_at=case((out_of_attempts, now), else_=None),
+            run_at=now,
+            last_error="Worker stopped responding",
+            locked_by=None,
+            heartbeat_at=None,
+            updated_at=now,
+        ),
+        execution_options={"synchronize_session": False},
+    ).rowcount
+    db.commit()
+    return released
+
+
+def cancel_job(db: Session, job: Job) -> bool:
+    """Cancel a queued job now, or ask a running one to stop at its next progress report.
+
+    One conditional UPDATE decides on the job's current status, so a job
+    claimed after ``job`` was read is asked to stop rather than marked
+    cancelled while it runs. Returns False, changing nothing, if the job
+    has finished meanwhile. The caller is responsible for committing.
+    """
+    queued = Job.status == "queued"
+    now = datetime.utcnow()
+    return bool(db.execute(
+        update(Job)
+        .where(Job.id == job.id, Job.status.in_(("queued", "running")))
+        .values(
+            status=case((queued, "cancelled"), else_=Job.status),
+            finished_at=case((queued, now), else_=Job.finished_at),
+            cancel_requested=case((queued, Job.cancel_requested), else_=True),
+            updated_at=now,
+        ),
+        execution_options={"synchronize_session": False},
+    ).rowcount)
@@ -0,0 +1,161 @@
+"""Run background jobs from the jobs.jobs table.
+
+Usage:
+    python -m app.worker [--concurrency N] [--types rescore rebuild_analytics_cube]
+
+Each worker thread claims one job at a time; start more processes (on any
+node with access to the database) to scale out. SIGINT/SIGTERM stop
+claiming new jobs and wait for the running ones to finish.
+"""
+import argparse
+import signal
+import threading
+import time
+import traceback
+from typing import List, Optional, Sequence
+
+from app.config import get_settings
+from app.db.session import SessionLocal
+from app.models import Job
+from app.services.jobs.handlers import JOB_HANDLERS
+from app.services.jobs.queue import (
+    JobCancelled,
+    JobLockLost,
+    claim_job,
+    finish_job,
+    heartbeat,
+    report_progress,
+    requeue_stale_jobs,
+    retry_or_fail_job,
+    worker_name,
+)
+
+settings = get_settings()
+
+
+class Worker:
+    """A pool of threads claiming and running jobs, plus a heartbeat."""
+
+    def __init__(
+        self,
+        concurrency: int = settings.JOB_WORKER_CONCURRENCY,
+        job_types: Optional[Sequence[str]] = None,
+        poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS,
+    ):
+        self.concurrency = concurrency
+        self.job_types = list(job_types) if job_types else None
+        self.poll_interval = poll_interval
+        self.name = worker_name()
+        self.stopping = threading.Event()
+
+    def run(self) -> None:
+        """Run until stop() is called, then wait for running jobs to finish."""
+        threads: List[threading.Thread] = [
+            threading.Thread(target=self._work, name=f"job-worker-{n}")
+            for n in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        print(f"Worker {self.name}: {self.concurrency} threads, job types: "
+              f"{', '.join(self.job_types or sorted(JOB_HANDLERS))}")
+
+        db = SessionLocal()
+        try:
+            while not self.stopping.wait(settings.JOB_HEARTBEAT_SECONDS):
+                try:
+                    heartbeat(db, self.name)
+                    released = requeue_stale_jobs(db)
+                    if released:
+                        print(f"Worker {self.name}: released {released} jobs of unresponsive workers")
+                except Exception as e:
+                    db.rollback()
+                    print(f"Worker {self.name}: heartbeat failed: {e}")
+        finally:
+            db.close()
+
+        for thread in threads:
+            thread.join()
+        print(f"Worker {self.name}: stopped")
+
+    def stop(self, *args) -> None:
+        if not self.stopping.is_set():
+            print(f"Worker {self.name}: stopping after running jobs finish")
+        self.stopping.set()
+
+    def _work(self) -> None:
+        db = SessionLocal()
+        try:
+            while not self.stopping.is_set():
+                try:
+                    job = claim_job(db, self.name, self.job_types)
+                except Exception as e:
+                    db.rollback()
+                    print(f"Worker {self.name}: could not claim a job: {e}")
+                    job = None
+                if job is None:
+                    self.stopping.wait(self.poll_interval)
+                    continue
+                self._run_job(db, job)
+        finally:
+            db.close()
+
+    def _run_job(self, db, job: Job) -> None:
+        try:
+            self._run_claimed_job(db, job)
+        except JobLockLost:
+            db.rollback()
+            print(f"Job {job.id} ({job.job_type}) was released by this worker as stale; "
+                  f"its outcome here was not recorded")
+
+    def _run_claimed_job(self, db, job: Job) -> None:
+        handler = JOB_HANDLERS.get(job.job_type)
+        if handler is None:
+            finish_job(db, job, self.name, "failed", error=f"Unknown job type: {job.job_type}")
+            return
+
+        print(f"Job {job.id} ({job.job_type}) attempt {job.attempts}/{job.max_attempts} started")
+        start = time.perf_counter()
+        work_db = SessionLocal()
+        try:
+            result = handler(
+                work_db,
+                job.payload,
+                lambda current=None, total=None, message=None: report_progress(
+                    db, job, self.name, current, total, message
+                ),
+            )
+        except JobLockLost:
+            work_db.rollback()
+            raise
+        except JobCancelled:
+            work_db.rollback()
+            finish_job(db, job, self.name, "cancelled")
+            print(f"Job {job.id} ({job.job_type}) cancelled")
+        except Exception:
+            work_db.rollback()
+            db.rollback()
+            error = traceback.format_exc(limit=5)
+            retried = retry_or_fail_job(db, job, self.name, error)
+            print(f"Job {job.id} ({job.job_type}) failed, {'will retry' if retried else 'giving up'}:\n{error}")
+        else:
+            finish_job(db, job, self.name, "completed", result=result)
+            print(f"Job {job.id} ({job.job_type}) completed in {time.perf_counter() - start:.1f}s")
+        finally:
+            work_db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background jobs.")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY)
+    parser.add_argument("--types", nargs="+", choices=sorted(JOB_HANDLERS), help="Only run these job types")
+    parser.add_argument("--poll-interval", type=float, default=settings.JOB_POLL_INTERVAL_SECONDS)
+    args = parser.parse_args()
+
+    worker = Worker(args.concurrency, args.types, args.poll_interval)
+    signal.signal(signal.SIGINT, worker.stop)
+    signal.signal(signal.SIGTERM, worker.stop)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
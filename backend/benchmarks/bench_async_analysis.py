@@ -0,0 +1,113 @@
+"""Compare sync and async mode analysis endpoints under concurrent load.
+
+Starts the API twice with uvicorn against DATABASE_URL, once per mode and
+with the analysis cache disabled, then fires concurrent player summary and
+team overview requests at each and reports throughput and latency.
+
+The database must already contain players with completed sessions.
+
+Usage (from backend/):
+    python -m benchmarks.bench_async_analysis [--requests 2000] [--concurrency 50]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def start_server(port: int, async_mode: bool) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        ASYNC_DB_ENABLED="true" if async_mode else "false",
+        ANALYSIS_CACHE_MAX_ENTRIES="0",
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not start")
+
+
+async def run_load(base_url: str, args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await wait_until_ready(client)
+        token = (await client.post(
+            "/api/v1/auth/login/json", json={"email": args.email, "password": args.password}
+        )).json()["access_token"]
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        players = (await client.get("/api/v1/players", params={"limit": 100})).json()
+        team_ids = sorted({p["team_id"] for p in players if p.get("team_id")})
+        urls = [f"/api/v1/analysis/player/{p['id']}/summary" for p in players]
+        urls += [f"/api/v1/analysis/team/{team_id}/overview" for team_id in team_ids]
+
+        latencies = []
+        errors = 0
+        queue = asyncio.Queue()
+        for i in range(args.requests):
+            queue.put_nowait(urls[i % len(urls)])
+
+        async def worker():
+            nonlocal errors
+            while not queue.empty():
+                url = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(url)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": args.requests / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--email", default="admin@sportsperformance.com")
+    parser.add_argument("--password", default="admin123")
+    args = parser.parse_args()
+
+    for label, async_mode, port in [("sync", False, args.port), ("async", True, args.port + 1)]:
+        server = start_server(port, async_mode)
+        try:
+            stats = asyncio.run(run_load(f"http://127.0.0.1:{port}", args))
+        finally:
+            server.terminate()
+            server.wait()
+        print(f"{label:<6} {args.requests} requests x{args.concurrency}  "
+              f"{stats['rps']:8.1f} req/s  p50 {stats['p50']:7.1f}ms  "
+              f"p95 {stats['p95']:7.1f}ms  errors {stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
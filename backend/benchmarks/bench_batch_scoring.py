@@ -0,0 +1,94 @@
+"""Compare scalar and batch TPI Power / Sprint scoring.
+
+Checks that ``score_batch`` matches ``score_result`` row for row, then
+reports the time taken by each path.
+
+Usage (from backend/):
+    python -m benchmarks.bench_batch_scoring [--rows 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.services.assessment import TPIPowerScoringService, SprintScoringService
+
+
+def _check_equal(label, scalar, batch_pct, batch_colors):
+    for i, (pct, color) in enumerate(scalar):
+        expected_pct = np.nan if pct is None else pct
+        if not (expected_pct == batch_pct[i] or (np.isnan(expected_pct) and np.isnan(batch_pct[i]))):
+            raise AssertionError(f"{label} row {i}: percentage {pct} != {batch_pct[i]}")
+        if color != batch_colors[i]:
+            raise AssertionError(f"{label} row {i}: color {color} != {batch_colors[i]}")
+
+
+def bench_tpi(rows: int, rng: np.random.Generator) -> None:
+    service = TPIPowerScoringService()
+    names = np.array(
+        ["Vertical Jump", "Broad Jump", "Seated Chest Pass", "Sit Up Throw", "Baseline Shot Put", "Unknown"],
+        dtype=object,
+    )[rng.integers(0, 6, rows)]
+    values = rng.uniform(0, 130, rows).round(2)
+    vertical_jumps = rng.uniform(10, 35, rows).round(2)
+    vertical_jumps[rng.random(rows) < 0.05] = np.nan
+    off_side = rng.random(rows) < 0.5
+
+    start = time.perf_counter()
+    scalar = [
+        service.score_result(
+            names[i],
+            float(values[i]),
+            vertical_jump=None if np.isnan(vertical_jumps[i]) else float(vertical_jumps[i]),
+            is_off_side=bool(off_side[i]),
+        )
+        for i in range(rows)
+    ]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pct, colors = service.score_batch(names, values, vertical_jumps, off_side)
+    batch_time = time.perf_counter() - start
+
+    _check_equal("tpi_power", scalar, pct, colors)
+    print(f"TPI Power  {rows:>9} rows  scalar {scalar_time:7.3f}s  batch {batch_time:7.3f}s  "
+          f"speedup {scalar_time / batch_time:6.1f}x")
+
+
+def bench_sprint(rows: int, rng: np.random.Generator) -> None:
+    service = SprintScoringService()
+    names = np.array(list(service.THRESHOLDS) + ["Unknown"], dtype=object)[
+        rng.integers(0, len(service.THRESHOLDS) + 1, rows)
+    ]
+    times = rng.uniform(0.8, 4.5, rows).round(3)
+    times[rng.random(rows) < 0.05] = np.nan
+
+    start = time.perf_counter()
+    scalar = [
+        (None, None) if np.isnan(times[i]) else service.score_result(names[i], float(times[i]))
+        for i in range(rows)
+    ]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pct, colors = service.score_batch(names, times)
+    batch_time = time.perf_counter() - start
+
+    _check_equal("sprint", scalar, pct, colors)
+    print(f"Sprint     {rows:>9} rows  scalar {scalar_time:7.3f}s  batch {batch_time:7.3f}s  "
+          f"speedup {scalar_time / batch_time:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    bench_tpi(args.rows, rng)
+    bench_sprint(args.rows, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Time a streaming CSV import of historical sprint results.
+
+Generates a CSV of sprint results (several tests per session, one session
+per player every four weeks) for synthetic players and runs it through
+the import service against DATABASE_URL, reporting result rows per
+minute. The import is rolled back unless --keep is given.
+
+--seed adds synthetic players (codes starting "BENCH"); --cleanup removes
+them again along with their sessions.
+
+Usage (from backend/):
+    python -m benchmarks.bench_bulk_import --seed 2000 [--sessions 50] [--batch-size 5000] [--keep]
+    python -m benchmarks.bench_bulk_import --cleanup
+"""
+import argparse
+import io
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from app.api.v1.assessments import sprint
+from app.db.session import SessionLocal
+from app.models import SprintResult
+from app.schemas.assessment.sprint import SprintResultCreate
+from app.services.assessment.bulk_import import ResultImportService
+
+TESTS = [
+    ("SPR-01", "81 ft Sprint", "linear"),
+    ("SPR-02", "5-yard Directional - Left", "directional"),
+    ("SPR-03", "5-yard Directional - Right", "directional"),
+    ("SPR-04", "Curvilinear - Left", "curvilinear"),
+    ("SPR-05", "Curvilinear - Right", "curvilinear"),
+]
+
+
+def seed(db, players: int) -> None:
+    db.execute(
+        text("""
+            INSERT INTO organization.players (id, player_code, first_name, last_name,
+                                              is_pitcher, is_position_player, is_active)
+            SELECT gen_random_uuid(), 'BENCH' || lpad(n::text, 6, '0'),
+                   'Bench' || (n % 97), 'Player' || lpad(n::text, 6, '0'), false, true, true
+            FROM generate_series(1, :players) AS n
+        """),
+        {"players": players},
+    )
+    db.commit()
+
+
+def cleanup(db) -> None:
+    db.execute(text("""
+        DELETE FROM assessments.sessions
+        WHERE player_id IN (SELECT id FROM organization.players WHERE player_code LIKE 'BENCH%')
+    """))
+    db.execute(text("DELETE FROM organization.players WHERE player_code LIKE 'BENCH%'"))
+    db.commit()
+
+
+def build_csv(codes, sessions: int) -> io.StringIO:
+    out = io.StringIO()
+    out.write("player_code,assessment_date,test_code,test_name,test_category,run_1_time,run_2_time\n")
+    for code in codes:
+        for n in range(sessions):
+            day = date(2025, 1, 6) - timedelta(weeks=4 * n)
+            for i, (test_code, test_name, category) in enumerate(TESTS):
+                base = 2.7 + (hash((code, n, i)) % 60) / 100 if i == 0 else 1.0 + (hash((code, n, i)) % 30) / 100
+                out.write(f"{code},{day},{test_code},{test_name},{category},{base:.3f},{base + 0.05:.3f}\n")
+    out.seek(0)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, metavar="PLAYERS")
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--sessions", type=int, default=50, help="Sessions per player")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--keep", action="store_true", help="Commit the import instead of rolling it back")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.cleanup:
+            cleanup(db)
+            return
+        if args.seed:
+            seed(db, args.seed)
+
+        codes = [row.player_code for row in db.execute(text(
+            "SELECT player_code FROM organization.players WHERE player_code LIKE 'BENCH%' ORDER BY player_code"
+        ))]
+        if not codes:
+            parser.error("no BENCH players; run with --seed first")
+        stream = build_csv(codes, args.sessions)
+
+        service = ResultImportService(
+            db, "sprint", SprintResultCreate, SprintResult, sprint.RESULT_KEY, sprint.score_bulk_results,
+            dry_run=not args.keep, batch_size=args.batch_size,
+        )
+        start = time.perf_counter()
+        summary = service.run(stream, "csv")
+        elapsed = time.perf_counter() - start
+        if args.keep:
+            db.commit()
+        else:
+            db.rollback()
+
+        print(f"rows {summary.rows_read}  failed {summary.rows_failed}  sessions {summary.sessions_created} new "
+              f"/ {summary.sessions_existing} existing  results {summary.results_inserted} new "
+              f"/ {summary.results_existing} existing")
+        print(f"{elapsed:.1f}s  {summary.rows_read / elapsed * 60:,.0f} rows/min")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measure cold start to first healthy /health for each startup mode.
+
+Starts the API under uvicorn against DATABASE_URL repeatedly and polls
+/health until it answers, once per STARTUP_SCHEMA_MODE. The "fingerprint"
+runs after the first measure the skip path.
+
+Usage (from backend/):
+    python -m benchmarks.bench_cold_start [--runs 5] [--modes always fingerprint]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def time_to_healthy(mode: str, port: int, timeout: float = 60.0) -> float:
+    env = dict(os.environ, STARTUP_SCHEMA_MODE=mode)
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                    return time.perf_counter() - start
+            except httpx.TransportError:
+                pass
+            time.sleep(0.005)
+        raise RuntimeError(f"Server did not become healthy within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modes", nargs="+", default=["always", "fingerprint", "none"])
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        times = [time_to_healthy(mode, args.port) for _ in range(args.runs)]
+        print(f"{mode:<12} runs {args.runs}  median {statistics.median(times) * 1000:7.1f}ms  "
+              f"min {min(times) * 1000:7.1f}ms  max {max(times) * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
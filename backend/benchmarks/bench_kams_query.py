@@ -0,0 +1,161 @@
+"""Measure KAMS measurement queries against the expression indexes.
+
+Runs threshold, asymmetry and combined measurement queries against
+DATABASE_URL through the same query builder the endpoint uses, first page
+of 100 sessions newest first, and reports the median time of each. With
+--python it also times the old approach for the threshold query: loading
+every ROM result and filtering the measurements in Python.
+
+--seed adds synthetic players (codes starting "BENCH") with a KAMS session
+every four weeks over several seasons, each with ROM and balance results;
+--cleanup removes them.
+
+Usage (from backend/):
+    python -m benchmarks.bench_kams_query --seed 2000 [--seasons 4] [--python]
+    python -m benchmarks.bench_kams_query --cleanup
+"""
+import argparse
+import statistics
+import time
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.api.pagination import paginate
+from app.db.session import SessionLocal
+from app.main import create_kams_measurement_indexes
+from app.models import AssessmentSession, KAMSResult
+from app.schemas.assessment.kams import KAMSMeasurementQuery
+from app.services.assessment.kams_query import build_measurement_query
+
+QUERIES = {
+    "hip IR < 30": [
+        {"test_type": "rom", "field": "hip_internal_rotation_left", "op": "lt", "value": 30},
+    ],
+    "ankle DF asymmetry > 15%": [
+        {"test_type": "rom", "field": "ankle_dorsiflexion", "metric": "asymmetry", "op": "gt", "value": 15},
+    ],
+    "hip IR < 30 and balance < 10s": [
+        {"test_type": "rom", "field": "hip_internal_rotation_left", "op": "lt", "value": 30},
+        {"test_type": "balance", "field": "time_left", "op": "lt", "value": 10},
+    ],
+}
+
+
+def seed(db, players: int, seasons: int) -> None:
+    db.execute(
+        text("""
+            INSERT INTO organization.players (id, player_code, first_name, last_name,
+                                              is_pitcher, is_position_player, is_active)
+            SELECT gen_random_uuid(), 'BENCH' || lpad(n::text, 6, '0'),
+                   'Bench' || (n % 97), 'Player' || lpad(n::text, 6, '0'), false, true, true
+            FROM generate_series(1, :players) AS n
+        """),
+        {"players": players},
+    )
+    db.execute(
+        text("""
+            INSERT INTO assessments.sessions (id, player_id, assessment_type, assessment_date, is_complete)
+            SELECT gen_random_uuid(), p.id, 'kams', DATE '2025-01-06' - w * 28, true
+            FROM organization.players p
+            CROSS JOIN generate_series(0, :weeks - 1) AS w
+            WHERE p.player_code LIKE 'BENCH%'
+        """),
+        {"weeks": seasons * 13},
+    )
+    db.execute(text("""
+        INSERT INTO assessments.kams_results (id, session_id, test_type, measurements, created_at)
+        SELECT gen_random_uuid(), s.id, t.test_type,
+               CASE t.test_type
+                   WHEN 'rom' THEN jsonb_build_object(
+                       'hip_internal_rotation_left', round((25 + random() * 25)::numeric, 1),
+                       'hip_internal_rotation_right', round((25 + random() * 25)::numeric, 1),
+                       'ankle_dorsiflexion_left', round((30 + random() * 15)::numeric, 1),
+                       'ankle_dorsiflexion_right', round((30 + random() * 15)::numeric, 1))
+                   ELSE jsonb_build_object(
+                       'time_left', round((random() * 30)::numeric, 1),
+                       'time_right', round((random() * 30)::numeric, 1))
+               END,
+               now()
+        FROM assessments.sessions s
+        JOIN organization.players p ON p.id = s.player_id
+        CROSS JOIN (VALUES ('rom'), ('balance')) AS t(test_type)
+        WHERE p.player_code LIKE 'BENCH%' AND s.assessment_type = 'kams'
+    """))
+    db.commit()
+    db.execute(text("ANALYZE organization.players"))
+    db.execute(text("ANALYZE assessments.sessions"))
+    db.execute(text("ANALYZE assessments.kams_results"))
+    db.commit()
+
+
+def cleanup(db) -> None:
+    db.execute(text("""
+        DELETE FROM assessments.sessions
+        WHERE player_id IN (SELECT id FROM organization.players WHERE player_code LIKE 'BENCH%')
+    """))
+    db.execute(text("DELETE FROM organization.players WHERE player_code LIKE 'BENCH%'"))
+    db.commit()
+
+
+def time_query(db, filters, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        paginate(
+            build_measurement_query(db, KAMSMeasurementQuery(filters=filters)),
+            [AssessmentSession.assessment_date, AssessmentSession.id],
+            [date, UUID],
+            None,
+            0,
+            100,
+            descending=True,
+        ).all()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def time_python_filter(db) -> float:
+    start = time.perf_counter()
+    matches = [
+        session_id
+        for session_id, measurements in db.query(KAMSResult.session_id, KAMSResult.measurements)
+        .filter(KAMSResult.test_type == "rom")
+        if (measurements.get("hip_internal_rotation_left") or 1e9) < 30
+    ]
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  ({len(matches)} matching results)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, metavar="PLAYERS")
+    parser.add_argument("--seasons", type=int, default=4)
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--python", action="store_true", help="Also time filtering in Python")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.cleanup:
+            cleanup(db)
+            return
+        if args.seed:
+            seed(db, args.seed, args.seasons)
+        create_kams_measurement_indexes()
+
+        results = db.execute(text("SELECT count(*) FROM assessments.kams_results")).scalar()
+        print(f"{results} KAMS results")
+        for label, filters in QUERIES.items():
+            print(f"{label:<32} {time_query(db, filters, args.repeat):8.1f} ms")
+        if args.python:
+            print(f"{'hip IR < 30 (Python filter)':<32} {time_python_filter(db):8.1f} ms")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
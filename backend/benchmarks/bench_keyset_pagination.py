@@ -0,0 +1,124 @@
+"""Compare deep-page offset and cursor pagination of the list queries.
+
+Walks the session and player list queries page by page against
+DATABASE_URL, once with offset paging and once following the cursor, and
+reports the time per page at increasing depths.
+
+--seed adds synthetic players (codes starting "BENCH") with several seasons
+of sessions every four weeks; --cleanup removes them again.
+
+Usage (from backend/):
+    python -m benchmarks.bench_keyset_pagination --seed 2000 [--pages 400] [--limit 50]
+    python -m benchmarks.bench_keyset_pagination --cleanup
+"""
+import argparse
+import time
+from uuid import UUID
+from datetime import date
+
+from sqlalchemy import text
+
+from app.api.pagination import encode_cursor, paginate
+from app.db.session import SessionLocal
+from app.models import AssessmentSession, Player
+
+
+def seed(db, players: int, seasons: int) -> None:
+    db.execute(
+        text("""
+            INSERT INTO organization.players (id, player_code, first_name, last_name,
+                                              is_pitcher, is_position_player, is_active)
+            SELECT gen_random_uuid(), 'BENCH' || lpad(n::text, 6, '0'),
+                   'Bench' || (n % 97), 'Player' || lpad((n % 1013)::text, 4, '0'), false, true, true
+            FROM generate_series(1, :players) AS n
+        """),
+        {"players": players},
+    )
+    # One session of each type every 4 weeks over the given seasons
+    db.execute(
+        text("""
+            INSERT INTO assessments.sessions (id, player_id, assessment_type, assessment_date, is_complete)
+            SELECT gen_random_uuid(), p.id, t.assessment_type,
+                   DATE '2025-01-06' - (w * 28 + t.offset_days), true
+            FROM organization.players p
+            CROSS JOIN generate_series(0, :weeks - 1) AS w
+            CROSS JOIN (VALUES ('onbaseu', 0), ('sprint', 1), ('kams', 2), ('tpi_power', 3))
+                AS t(assessment_type, offset_days)
+            WHERE p.player_code LIKE 'BENCH%'
+        """),
+        {"weeks": seasons * 13},
+    )
+    db.commit()
+    db.execute(text("ANALYZE organization.players"))
+    db.execute(text("ANALYZE assessments.sessions"))
+    db.commit()
+
+
+def cleanup(db) -> None:
+    db.execute(text("""
+        DELETE FROM assessments.sessions
+        WHERE player_id IN (SELECT id FROM organization.players WHERE player_code LIKE 'BENCH%')
+    """))
+    db.execute(text("DELETE FROM organization.players WHERE player_code LIKE 'BENCH%'"))
+    db.commit()
+
+
+def walk(db, label, query_fn, columns, types, key, pages, limit, descending) -> None:
+    checkpoints = sorted({1, pages // 10, pages // 4, pages // 2, pages} - {0})
+    for mode in ("offset", "cursor"):
+        cursor = None
+        timings = {}
+        for page in range(1, pages + 1):
+            start = time.perf_counter()
+            rows = paginate(
+                query_fn(db), columns, types,
+                cursor if mode == "cursor" else None,
+                (page - 1) * limit, limit, descending,
+            ).all()
+            timings[page] = time.perf_counter() - start
+            db.expunge_all()
+            if len(rows) < limit:
+                break
+            cursor = encode_cursor(*key(rows[-1]))
+        line = "  ".join(
+            f"p{page} {timings[page] * 1000:6.1f}ms"
+            for page in sorted({p for p in checkpoints if p in timings} | {max(timings)})
+        )
+        print(f"{label:<9} {mode:<7} {line}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, metavar="PLAYERS")
+    parser.add_argument("--seasons", type=int, default=4)
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.cleanup:
+            cleanup(db)
+            return
+        if args.seed:
+            seed(db, args.seed, args.seasons)
+
+        print(f"sessions: {db.query(AssessmentSession).count()}  players: {db.query(Player).count()}  "
+              f"page size {args.limit}")
+        walk(
+            db, "sessions", lambda db: db.query(AssessmentSession),
+            [AssessmentSession.assessment_date, AssessmentSession.id], [date, UUID],
+            lambda s: (s.assessment_date, s.id), args.pages, args.limit, True,
+        )
+        walk(
+            db, "players", lambda db: db.query(Player.id, Player.first_name, Player.last_name),
+            [Player.last_name, Player.first_name, Player.id], [str, str, UUID],
+            lambda p: (p.last_name, p.first_name, p.id), args.pages, args.limit, False,
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Time player search as a type-ahead, one request per keystroke.
+
+Types each query a character at a time (from the minimum length) against
+the search endpoint handler on DATABASE_URL and reports per-keystroke
+latency. Also times the same keystrokes through the list endpoint's
+search filter for comparison.
+
+--seed adds synthetic players (codes starting "BENCH") across the existing
+sports; --cleanup removes them again. Run the API once first so the
+pg_trgm indexes exist.
+
+Usage (from backend/):
+    python -m benchmarks.bench_player_search --seed 50000 [--queries chouinard smith P2025]
+    python -m benchmarks.bench_player_search --cleanup
+"""
+import argparse
+import statistics
+import time
+
+from fastapi import Response
+from sqlalchemy import text
+
+from app.api.v1 import players
+from app.db.session import SessionLocal
+
+FIRST_NAMES = ["Aidan", "Ty", "Leo", "Isaac", "Randy", "Marcus", "Owen", "Caleb", "Nolan", "Jack"]
+LAST_NAMES = ["Chouinard", "Book", "Boehringer", "Braegelmann", "Dodig", "Smith", "Johnson",
+              "Kowalski", "Nguyen", "Okafor", "Martinez", "Schmidt", "O'Brien", "Lindqvist"]
+
+
+def seed(db, count: int) -> None:
+    db.execute(
+        text("""
+            INSERT INTO organization.players (id, player_code, first_name, last_name, sport_id,
+                                              is_pitcher, is_position_player, is_active)
+            SELECT gen_random_uuid(), 'BENCH' || lpad(n::text, 6, '0'),
+                   (:first_names)[1 + n % cardinality(:first_names)],
+                   (:last_names)[1 + (n / 7) % cardinality(:last_names)] || (n % 997),
+                   (SELECT id FROM organization.sports ORDER BY id OFFSET n % 4 LIMIT 1),
+                   n % 5 = 0, n % 5 <> 0, true
+            FROM generate_series(1, :count) AS n
+        """),
+        {"count": count, "first_names": FIRST_NAMES, "last_names": LAST_NAMES},
+    )
+    db.commit()
+    db.execute(text("ANALYZE organization.players"))
+    db.commit()
+
+
+def cleanup(db) -> None:
+    db.execute(text("DELETE FROM organization.players WHERE player_code LIKE 'BENCH%'"))
+    db.commit()
+
+
+def type_ahead(db, label: str, query: str, search) -> None:
+    timings = []
+    for end in range(2, len(query) + 1):
+        start = time.perf_counter()
+        results = search(query[:end])
+        timings.append(time.perf_counter() - start)
+        db.rollback()
+    print(f"{label:<7} {query!r:<14} keystrokes {len(timings):2}  "
+          f"median {statistics.median(timings) * 1000:6.1f}ms  max {max(timings) * 1000:6.1f}ms  "
+          f"last page {len(results)} results")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, metavar="PLAYERS")
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--queries", nargs="+", default=["chouinard", "schmidt", "kowalsky", "BENCH0123"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.cleanup:
+            cleanup(db)
+            return
+        if args.seed:
+            seed(db, args.seed)
+
+        trigram = players._has_trigram_search(db)
+        print(f"players: {db.execute(text('SELECT count(*) FROM organization.players')).scalar()}  "
+              f"pg_trgm: {'yes' if trigram else 'no (substring fallback)'}")
+        for query in args.queries:
+            type_ahead(db, "search", query, lambda q: players.search_players(
+                q=q, limit=20, team_id=None, sport_id=None, is_active=True, db=db, current_user=None,
+            ))
+            type_ahead(db, "list", query, lambda q: players.list_players(
+                response=Response(), skip=0, limit=20, cursor=None, team_id=None, sport_id=None,
+                is_pitcher=None, is_active=True, search=q, db=db, current_user=None,
+            ))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
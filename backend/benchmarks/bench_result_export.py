@@ -0,0 +1,108 @@
+"""Measure streaming export throughput and memory.
+
+Streams the sprint results export from DATABASE_URL through the same
+generator the endpoint uses, once per format, and reports rows per
+second, output size and the process's peak resident memory.
+
+--seed adds synthetic players (codes starting "BENCH") with a sprint
+session every four weeks over several seasons; --cleanup removes them.
+
+Usage (from backend/):
+    python -m benchmarks.bench_result_export --seed 2000 [--seasons 4] [--batch-size 2000]
+    python -m benchmarks.bench_result_export --cleanup
+"""
+import argparse
+import resource
+import time
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.services.assessment.result_export import build_export_query, stream_export
+
+
+def seed(db, players: int, seasons: int) -> None:
+    db.execute(
+        text("""
+            INSERT INTO organization.players (id, player_code, first_name, last_name,
+                                              is_pitcher, is_position_player, is_active)
+            SELECT gen_random_uuid(), 'BENCH' || lpad(n::text, 6, '0'),
+                   'Bench' || (n % 97), 'Player' || lpad(n::text, 6, '0'), false, true, true
+            FROM generate_series(1, :players) AS n
+        """),
+        {"players": players},
+    )
+    db.execute(
+        text("""
+            INSERT INTO assessments.sessions (id, player_id, assessment_type, assessment_date, is_complete)
+            SELECT gen_random_uuid(), p.id, 'sprint', DATE '2025-01-06' - w * 28, true
+            FROM organization.players p
+            CROSS JOIN generate_series(0, :weeks - 1) AS w
+            WHERE p.player_code LIKE 'BENCH%'
+        """),
+        {"weeks": seasons * 13},
+    )
+    db.execute(text("""
+        INSERT INTO assessments.sprint_results (id, session_id, test_code, test_name, test_category,
+                                                run_1_time, best_time, score_percentage, color, created_at)
+        SELECT gen_random_uuid(), s.id, t.code, t.name, t.category,
+               t.base + random(), t.base + random(), 50 + random() * 50, 'green', now()
+        FROM assessments.sessions s
+        JOIN organization.players p ON p.id = s.player_id
+        CROSS JOIN (VALUES ('SPR-01', '81 ft Sprint', 'linear', 2.7),
+                           ('SPR-02', '5-yard Directional - Left', 'directional', 1.0),
+                           ('SPR-03', '5-yard Directional - Right', 'directional', 1.0),
+                           ('SPR-04', 'Curvilinear - Left', 'curvilinear', 1.2),
+                           ('SPR-05', 'Curvilinear - Right', 'curvilinear', 1.2))
+            AS t(code, name, category, base)
+        WHERE p.player_code LIKE 'BENCH%' AND s.assessment_type = 'sprint'
+    """))
+    db.commit()
+    db.execute(text("ANALYZE assessments.sessions"))
+    db.execute(text("ANALYZE assessments.sprint_results"))
+    db.commit()
+
+
+def cleanup(db) -> None:
+    db.execute(text("""
+        DELETE FROM assessments.sessions
+        WHERE player_id IN (SELECT id FROM organization.players WHERE player_code LIKE 'BENCH%')
+    """))
+    db.execute(text("DELETE FROM organization.players WHERE player_code LIKE 'BENCH%'"))
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, metavar="PLAYERS")
+    parser.add_argument("--seasons", type=int, default=4)
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.cleanup:
+            cleanup(db)
+            return
+        if args.seed:
+            seed(db, args.seed, args.seasons)
+    finally:
+        db.close()
+
+    stmt = build_export_query("sprint")
+    print(f"peak RSS before export {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    for file_format, compress in (("csv", False), ("ndjson", False), ("csv", True)):
+        start = time.perf_counter()
+        size = 0
+        for chunk in stream_export(stmt, file_format, compress=compress, batch_size=args.batch_size):
+            size += len(chunk)
+        elapsed = time.perf_counter() - start
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        label = file_format + (".gz" if compress else "")
+        print(f"{label:<7} {elapsed:6.1f}s  {size / 1e6:8.1f} MB  peak RSS {peak_rss:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
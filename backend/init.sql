@@ -4,6 +4,10 @@ CREATE SCHEMA IF NOT EXISTS organization;
 CREATE SCHEMA IF NOT EXISTS assessments;
 CREATE SCHEMA IF NOT EXISTS correctives;
 CREATE SCHEMA IF NOT EXISTS analysis;
+CREATE SCHEMA IF NOT EXISTS jobs;
 
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+
+-- Enable trigram matching for player search
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
@@ -0,0 +1,76 @@
+"""Shared fixtures.
+
+Tests that need the database run against TEST_DATABASE_URL, which is
+bootstrapped and seeded like a normal start and then written to; point it
+at a scratch database. Without it those tests are skipped.
+
+Usage (from backend/):
+    TEST_DATABASE_URL=postgresql://localhost:5432/sports_performance_test python -m pytest -q
+"""
+import os
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+
+if os.environ.get("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+# Hash in the request thread, and keep the per-process caches out of the way
+# so statement counts don't depend on test order
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+os.environ.setdefault("AUTH_CACHE_MAX_ENTRIES", "0")
+os.environ.setdefault("ANALYSIS_CACHE_MAX_ENTRIES", "0")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.db.session import SessionLocal, engine
+
+API = "/api/v1"
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    if not os.environ.get("TEST_DATABASE_URL"):
+        pytest.skip("TEST_DATABASE_URL is not set")
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client) -> dict:
+    response = client.post(
+        f"{API}/auth/login/json",
+        json={"email": "admin@sportsperformance.com", "password": "admin123"},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def db(client):
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
+@contextmanager
+def _count(statements: List[str]) -> Iterator[List[str]]:
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def count_statements():
+    """Context manager collecting the SQL statements run on the sync engine."""
+    return lambda: _count([])
@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+from app.services.assessment.kams_query import measurement_indexes
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def scratch_engine():
+    """An empty database next to TEST_DATABASE_URL, dropped afterwards."""
+    if not os.environ.get("TEST_DATABASE_URL"):
+        pytest.skip("TEST_DATABASE_URL is not set")
+    url = make_url(os.environ["TEST_DATABASE_URL"])
+    name = f"{url.database}_alembic"
+    admin = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+            conn.execute(text(f'CREATE DATABASE "{name}"'))
+    except Exception as e:
+        admin.dispose()
+        pytest.skip(f"cannot create a scratch database: {e}")
+
+    engine = create_engine(url.set(database=name))
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        with admin.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+        admin.dispose()
+
+
+def _run(engine, fn, *args):
+    # No ini file, so env.py leaves the test run's logging alone
+    config = Config()
+    config.set_main_option("script_location", str(BACKEND / "alembic"))
+    with engine.begin() as conn:
+        config.attributes["connection"] = conn
+        fn(config, *args)
+
+
+def test_revisions_build_the_schema_the_models_describe(scratch_engine):
+    _run(scratch_engine, command.upgrade, "head")
+    # Raises if autogenerate finds any difference from the models
+    _run(scratch_engine, command.check)
+
+    with scratch_engine.connect() as conn:
+        indexes = set(conn.execute(text(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = 'assessments'"
+        )).scalars())
+    assert {name for name, _, _ in measurement_indexes()} <= indexes
+
+    _run(scratch_engine, command.downgrade, "base")
+
+    with scratch_engine.connect() as conn:
+        tables = conn.execute(text("""
+            SELECT table_schema || '.' || table_name FROM information_schema.tables
+            WHERE table_schema NOT IN ('pg_catalog', 'information_schema')
+        """)).scalars().all()
+    assert tables == ["public.alembic_version"]
@@ -0,0 +1,116 @@
+import uuid
+from collections import namedtuple
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models import AssessmentSession, KAMSResult, Player, Team, TPIPowerResult
+from app.services.analysis.asymmetry import ASYMMETRY_THRESHOLDS, build_asymmetry_query, build_asymmetry_report
+
+Row = namedtuple(
+    "Row",
+    "player_id first_name last_name player_code team_id flagged asymmetry_pct assessment_type "
+    "session_id assessment_date test_code measure left_value right_value difference",
+)
+
+ALICE, BOB, CARA, DAN = (uuid.uuid4() for _ in range(4))
+NAMES = {ALICE: ("Alice", "Adams"), BOB: ("Bob", "Brown"), CARA: ("Cara", "Cole"), DAN: ("Dan", "Diaz")}
+
+
+def _row(player_id, flagged, asymmetry_pct, assessment_type="kams", test_code="rom"):
+    first, last = NAMES[player_id]
+    return Row(
+        player_id, first, last, f"P{last.upper()}", 1, flagged,
+        None if asymmetry_pct is None else Decimal(str(asymmetry_pct)),
+        assessment_type, uuid.uuid4(), date(2024, 3, 1), test_code, "hip_ir",
+        Decimal("40"), Decimal("30"), Decimal("10"),
+    )
+
+
+ROWS = [
+    _row(ALICE, True, 12),
+    _row(ALICE, False, 5, "onbaseu"),
+    _row(BOB, True, 15),
+    _row(BOB, True, 20, "tpi_power", "vert"),
+    _row(CARA, True, 30),
+    _row(DAN, False, 40),
+    # Unflagged, so it neither counts nor sets Cara's maximum
+    _row(CARA, False, 2),
+]
+
+
+def test_athletes_ranked_by_flagged_count_then_largest_flagged_asymmetry():
+    report = build_asymmetry_report(ROWS)
+
+    assert [a["player_name"] for a in report] == ["Bob Brown", "Cara Cole", "Alice Adams"]
+    bob = report[0]
+    assert bob["flagged_count"] == 2
+    assert bob["max_asymmetry_pct"] == 20
+    assert bob["assessment_types"] == ["kams", "tpi_power"]
+    assert [p["asymmetry_pct"] for p in bob["pairs"]] == [20, 15]
+    assert bob["player_id"] == str(BOB)
+
+
+def test_unflagged_pairs_and_athletes_only_with_include_unflagged():
+    flagged_only = build_asymmetry_report(ROWS)
+    assert all(p["flagged"] for a in flagged_only for p in a["pairs"])
+
+    report = build_asymmetry_report(ROWS, include_unflagged=True)
+    assert [a["player_name"] for a in report] == ["Bob Brown", "Cara Cole", "Alice Adams", "Dan Diaz"]
+    alice = report[2]
+    # Flagged pairs first; unflagged ones don't count towards the ranking
+    assert [(p["flagged"], p["asymmetry_pct"]) for p in alice["pairs"]] == [(True, 12), (False, 5)]
+    assert (alice["flagged_count"], alice["max_asymmetry_pct"], alice["assessment_types"]) == (1, 12, ["kams"])
+    dan = report[3]
+    assert (dan["flagged_count"], dan["max_asymmetry_pct"], dan["assessment_types"]) == (0, None, [])
+
+
+def test_ties_break_on_name_and_missing_percentages_rank_last():
+    rows = [_row(DAN, True, None), _row(CARA, True, 10), _row(ALICE, True, 10)]
+
+    report = build_asymmetry_report(rows)
+    assert [a["player_name"] for a in report] == ["Alice Adams", "Cara Cole", "Dan Diaz"]
+    assert report[2]["max_asymmetry_pct"] is None
+
+
+def test_reported_percentage_and_flag_use_the_same_formula(db):
+    team = Team(name="Asymmetry Test Team")
+    db.add(team)
+    db.flush()
+    player = Player(player_code="TESTAS0001", first_name="Test", last_name="Asymmetry", team_id=team.id)
+    db.add(player)
+    db.flush()
+    tpi = AssessmentSession(player_id=player.id, assessment_type="tpi_power",
+                            assessment_date=date(2024, 3, 1), is_complete=True)
+    kams = AssessmentSession(player_id=player.id, assessment_type="kams",
+                             assessment_date=date(2024, 3, 1), is_complete=True)
+    db.add_all([tpi, kams])
+    db.flush()
+    db.add_all([
+        TPIPowerResult(session_id=tpi.id, test_code=code, test_name=code, side=side, result_value=value)
+        for code, side, value in [
+            ("SP", "left", 100), ("SP", "right", 89), ("MB", "left", 91), ("MB", "right", 100),
+        ]
+    ])
+    db.add(KAMSResult(session_id=kams.id, test_type="balance", measurements={
+        "time_left": 20, "time_right": 16, "sway_left": 9, "sway_right": 10,
+    }))
+    db.flush()
+
+    rows = db.execute(build_asymmetry_query(team_id=team.id)).all()
+
+    thresholds = {"tpi_power": ASYMMETRY_THRESHOLDS["tpi_power_pct"], "kams": ASYMMETRY_THRESHOLDS["kams_pct"]}
+    expected = {
+        ("tpi_power", "SP"): (11, True),
+        ("tpi_power", "MB"): (9, False),
+        ("kams", "balance", "time"): (20, True),
+        ("kams", "balance", "sway"): (10, False),
+    }
+    assert len(rows) == len(expected)
+    for row in rows:
+        key = (row.assessment_type, row.test_code) + ((row.measure,) if row.assessment_type == "kams" else ())
+        pct, flagged = expected[key]
+        assert float(row.asymmetry_pct) == pytest.approx(pct)
+        assert row.flagged is flagged
+        assert row.flagged == (row.asymmetry_pct > thresholds[row.assessment_type])
@@ -0,0 +1,85 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models import AssessmentSession, KAMSResult, Player
+from app.services.assessment.bulk_ingest import _copy_value, copy_upsert_rows
+
+AWKWARD_TEXT = "tab\there\nnew line\r\\N back\\slash \\t literal"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, r"\N"),
+        ("plain", "plain"),
+        (3, "3"),
+        (Decimal("1.50"), "1.50"),
+        ("a\tb\nc\rd", r"a\tb\nc\rd"),
+        ("\\N", r"\\N"),
+        ({"a": [1, "x\ty"]}, r'{"a": [1, "x\\ty"]}'),
+    ],
+)
+def test_copy_value_formats_copy_text_fields(value, expected):
+    assert _copy_value(value) == expected
+
+
+@pytest.fixture
+def session_id(db):
+    """A session on a new player, rolled back with the db fixture."""
+    player = Player(player_code=f"TESTBI{uuid.uuid4().hex[:8]}", first_name="Test", last_name="Ingest")
+    db.add(player)
+    db.flush()
+    session = AssessmentSession(player_id=player.id, assessment_type="kams", assessment_date=date(2020, 1, 1))
+    db.add(session)
+    db.flush()
+    return session.id
+
+
+def _stored(db, session_id):
+    return {
+        result.test_type: result
+        for result in db.query(KAMSResult).filter(KAMSResult.session_id == session_id).populate_existing()
+    }
+
+
+def test_copy_upsert_rows_round_trips_values(db, session_id):
+    measurements = {"note": AWKWARD_TEXT, "values": [1.5, None, "\\"], "nested": {"k": "\t"}}
+    rows = [
+        {"session_id": session_id, "test_type": "rom", "measurements": measurements,
+         "overall_score": Decimal("87.25"), "notes": AWKWARD_TEXT},
+        {"session_id": session_id, "test_type": "squat", "measurements": {}, "notes": None},
+    ]
+
+    assert copy_upsert_rows(db, KAMSResult, rows, ["session_id", "test_type"]) == (2, 0)
+
+    stored = _stored(db, session_id)
+    assert stored["rom"].measurements == measurements
+    assert stored["rom"].notes == AWKWARD_TEXT
+    assert stored["rom"].overall_score == Decimal("87.25")
+    assert stored["rom"].id is not None and stored["rom"].created_at is not None
+    assert stored["squat"].measurements == {}
+    assert stored["squat"].notes is None
+
+
+def test_copy_upsert_rows_skip_and_overwrite(db, session_id):
+    key = ["session_id", "test_type"]
+    first = {"session_id": session_id, "test_type": "rom", "measurements": {"v": 1}, "notes": "first"}
+    assert copy_upsert_rows(db, KAMSResult, [first], key) == (1, 0)
+    original_id = _stored(db, session_id)["rom"].id
+
+    second = {**first, "measurements": {"v": 2}, "notes": "second"}
+    new = {"session_id": session_id, "test_type": "lunge", "measurements": {"v": 3}}
+    assert copy_upsert_rows(db, KAMSResult, [second, new], key, "skip") == (1, 1)
+    assert _stored(db, session_id)["rom"].notes == "first"
+
+    # Within one batch the last row for a key wins when overwriting
+    third = {**first, "measurements": {"v": 4}, "notes": "third"}
+    assert copy_upsert_rows(db, KAMSResult, [second, third], key, "overwrite") == (0, 1)
+    stored = _stored(db, session_id)
+    assert stored["rom"].notes == "third"
+    assert stored["rom"].measurements == {"v": 4}
+    assert stored["rom"].id == original_id
+    assert set(stored) == {"rom", "lunge"}
@@ -0,0 +1,121 @@
+from collections import namedtuple
+
+from app.services.correctives.recommendations import (
+    MappedExercise,
+    MappingIndex,
+    find_conditions,
+    recommend_exercises,
+)
+
+Result = namedtuple("Result", "test_code test_name side result score")
+
+
+def _exercise(exercise_id: int, name: str, priority: int) -> MappedExercise:
+    return MappedExercise(exercise_id, name, "hip", "mobility", "beginner", None, priority)
+
+
+RESULTS = [
+    Result("HIP", "Hip Rotation", "left", "Fail", 1),
+    Result("HIP", "Hip Rotation", "right", "Pass", 3),
+    Result("ANK", "Ankle Mobility", "left", "Neutral", 2),
+    Result("ANK", "Ankle Mobility", "right", "Neutral", 2),
+    Result("TOE", "Toe Touch", None, "Fail", 1),
+    Result("SQT", "Overhead Squat", None, "Pass", 3),
+]
+
+
+def test_find_conditions_detects_fail_neutral_and_asymmetry_most_severe_first():
+    findings = find_conditions(RESULTS)
+
+    assert [(f.condition, f.test_code, f.side) for f in findings] == [
+        ("fail", "HIP", "left"),
+        ("fail", "TOE", None),
+        ("asymmetry", "HIP", None),
+        ("neutral", "ANK", "left"),
+        ("neutral", "ANK", "right"),
+    ]
+    asymmetry = findings[2]
+    assert (asymmetry.test_name, asymmetry.result) == ("Hip Rotation", "Fail/Pass")
+
+
+def test_find_conditions_needs_both_sides_for_asymmetry():
+    findings = find_conditions([Result("HIP", "Hip Rotation", "left", "Neutral", 2)])
+    assert [f.condition for f in findings] == ["neutral"]
+    assert find_conditions([Result("SQT", "Overhead Squat", None, "Pass", 3)]) == []
+
+
+def test_recommend_exercises_merges_an_exercise_across_findings():
+    findings = find_conditions(RESULTS)
+    stretch = _exercise(1, "Hip Stretch", 3)
+    mappings = {
+        ("onbaseu", "HIP", "fail"): [stretch, _exercise(2, "Band Walk", 2)],
+        ("onbaseu", "HIP", "asymmetry"): [stretch._replace(priority=1)],
+        ("onbaseu", "ANK", "neutral"): [stretch._replace(priority=2)],
+        # Other assessment types don't apply
+        ("pitcher_onbaseu", "TOE", "fail"): [_exercise(3, "Hamstring Floss", 1)],
+    }
+
+    exercises, unmapped = recommend_exercises("onbaseu", findings, mappings)
+
+    assert [e.exercise_id for e in exercises] == [1, 2]
+    stretch_recommendation = exercises[0]
+    # The best priority among its mappings, with every finding as a reason
+    assert stretch_recommendation.priority == 1
+    assert [(r.condition, r.test_code, r.side) for r in stretch_recommendation.reasons] == [
+        ("fail", "HIP", "left"),
+        ("asymmetry", "HIP", None),
+        ("neutral", "ANK", "left"),
+        ("neutral", "ANK", "right"),
+    ]
+    assert [(f.condition, f.test_code) for f in unmapped] == [("fail", "TOE")]
+
+
+def test_recommend_exercises_orders_by_priority_severity_reasons_then_name():
+    findings = find_conditions(RESULTS)
+    mappings = {
+        ("onbaseu", "HIP", "fail"): [_exercise(1, "Zeta", 2), _exercise(2, "Beta", 1)],
+        ("onbaseu", "TOE", "fail"): [_exercise(3, "Alpha", 2), _exercise(4, "Gamma", 2)],
+        ("onbaseu", "HIP", "asymmetry"): [_exercise(1, "Zeta", 2)],
+        ("onbaseu", "ANK", "neutral"): [_exercise(5, "Aardvark", 2), _exercise(2, "Beta", 3)],
+    }
+
+    exercises, unmapped = recommend_exercises("onbaseu", findings, mappings)
+
+    assert [e.name for e in exercises] == [
+        "Beta",      # priority 1
+        "Zeta",      # priority 2, fail, two reasons
+        "Alpha",     # priority 2, fail, one reason; name breaks the tie
+        "Gamma",
+        "Aardvark",  # priority 2, neutral
+    ]
+    assert unmapped == []
+
+
+class _CountingIndex(MappingIndex):
+    def __init__(self, ttl_seconds: float):
+        super().__init__(ttl_seconds)
+        self.version = 0
+
+    def _load(self, db):
+        self.version += 1
+        return {("onbaseu", "HIP", "fail"): [_exercise(self.version, "Hip Stretch", 1)]}
+
+
+def test_mapping_index_loads_once_until_invalidated():
+    index = _CountingIndex(ttl_seconds=300)
+
+    first = index.get(db=None)
+    assert index.get(db=None) is first
+    assert index.loads == 1
+
+    index.invalidate()
+    reloaded = index.get(db=None)
+    assert index.loads == 2
+    assert reloaded[("onbaseu", "HIP", "fail")][0].exercise_id == 2
+
+
+def test_mapping_index_reloads_after_the_ttl():
+    index = _CountingIndex(ttl_seconds=0)
+    index.get(db=None)
+    index.get(db=None)
+    assert index.loads == 2
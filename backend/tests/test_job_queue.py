@@ -0,0 +1,154 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, update
+
+from app.db.session import SessionLocal
+from app.models import Job
+from app.services.jobs.queue import (
+    JobCancelled,
+    JobLockLost,
+    cancel_job,
+    claim_job,
+    enqueue_job,
+    finish_job,
+    report_progress,
+    requeue_stale_jobs,
+    retry_or_fail_job,
+)
+
+W1 = "test-worker-1"
+W2 = "test-worker-2"
+
+
+@pytest.fixture
+def job_type(db):
+    """A job type of its own, so claims never pick up other jobs in the database."""
+    job_type = f"test_{uuid.uuid4().hex[:12]}"
+    yield job_type
+    db.rollback()
+    db.execute(delete(Job).where(Job.job_type == job_type))
+    db.commit()
+
+
+def _enqueue(db, job_type, **kwargs) -> Job:
+    job = enqueue_job(db, job_type, {"n": 1}, **kwargs)
+    db.commit()
+    return job
+
+
+def _stored(db, job: Job) -> Job:
+    db.expire_all()
+    return db.get(Job, job.id)
+
+
+def _make_due(db, job: Job) -> None:
+    db.execute(update(Job).where(Job.id == job.id).values(run_at=datetime.utcnow()))
+    db.commit()
+
+
+def test_claim_job_takes_each_due_job_once(db, job_type):
+    queued = _enqueue(db, job_type)
+    _enqueue(db, job_type, run_at=datetime.utcnow() + timedelta(hours=1))
+
+    job = claim_job(db, W1, [job_type])
+    assert job.id == queued.id
+    assert (job.status, job.attempts, job.locked_by) == ("running", 1, W1)
+    assert job.started_at is not None and job.heartbeat_at is not None
+
+    # The other job is not due yet
+    assert claim_job(db, W2, [job_type]) is None
+
+
+def test_finish_job_completes_a_held_job(db, job_type):
+    _enqueue(db, job_type)
+    job = claim_job(db, W1, [job_type])
+
+    report_progress(db, job, W1, 1, 2, "halfway")
+    finish_job(db, job, W1, "completed", result={"ok": True})
+
+    stored = _stored(db, job)
+    assert (stored.status, stored.locked_by, stored.result) == ("completed", None, {"ok": True})
+    assert (stored.progress_current, stored.progress_total, stored.progress_message) == (1, 2, "halfway")
+    assert stored.finished_at is not None
+
+
+def test_retry_or_fail_job_requeues_with_backoff_then_fails(db, job_type):
+    _enqueue(db, job_type, max_attempts=2)
+
+    job = claim_job(db, W1, [job_type])
+    assert retry_or_fail_job(db, job, W1, "boom 1") is True
+    stored = _stored(db, job)
+    assert (stored.status, stored.locked_by, stored.last_error) == ("queued", None, "boom 1")
+    assert stored.run_at > datetime.utcnow()
+    assert claim_job(db, W1, [job_type]) is None
+
+    _make_due(db, job)
+    job = claim_job(db, W1, [job_type])
+    assert job.attempts == 2
+    assert retry_or_fail_job(db, job, W1, "boom 2") is False
+    stored = _stored(db, job)
+    assert (stored.status, stored.last_error) == ("failed", "boom 2")
+    assert stored.finished_at is not None
+
+
+def test_cancel_job_cancels_queued_and_flags_running_jobs(db, job_type):
+    queued = _enqueue(db, job_type, priority=-1)
+    running_job = _enqueue(db, job_type)
+    job = claim_job(db, W1, [job_type])
+    assert job.id == running_job.id
+
+    assert cancel_job(db, queued) is True
+    assert cancel_job(db, job) is True
+    db.commit()
+    assert _stored(db, queued).status == "cancelled"
+    stored = _stored(db, job)
+    assert (stored.status, stored.cancel_requested) == ("running", True)
+
+    with pytest.raises(JobCancelled):
+        report_progress(db, job, W1, 1, 2)
+    finish_job(db, job, W1, "cancelled")
+    assert cancel_job(db, job) is False
+
+
+def test_retry_or_fail_job_cancels_a_job_cancelled_while_running(db, job_type):
+    _enqueue(db, job_type)
+    job = claim_job(db, W1, [job_type])
+    cancel_job(db, job)
+    db.commit()
+
+    assert retry_or_fail_job(db, job, W1, "boom") is False
+    stored = _stored(db, job)
+    assert stored.status == "cancelled"
+    assert stored.finished_at is not None
+
+
+# W1 again stands for another thread of the same worker process
+@pytest.mark.parametrize("reclaimed_by", [W2, W1])
+def test_worker_whose_job_was_released_records_nothing(db, job_type, reclaimed_by):
+    _enqueue(db, job_type)
+    job = claim_job(db, W1, [job_type])
+    db.execute(
+        update(Job).where(Job.id == job.id).values(heartbeat_at=datetime.utcnow() - timedelta(days=1))
+    )
+    db.commit()
+    assert requeue_stale_jobs(db) >= 1
+
+    other_db = SessionLocal()
+    try:
+        reclaimed = claim_job(other_db, reclaimed_by, [job_type])
+    finally:
+        other_db.close()
+    assert (reclaimed.id, reclaimed.attempts, reclaimed.locked_by) == (job.id, 2, reclaimed_by)
+    assert (job.attempts, job.locked_by) == (1, W1)
+
+    with pytest.raises(JobLockLost):
+        report_progress(db, job, W1, 1, 2)
+    with pytest.raises(JobLockLost):
+        retry_or_fail_job(db, job, W1, "boom")
+    with pytest.raises(JobLockLost):
+        finish_job(db, job, W1, "completed")
+
+    stored = _stored(db, job)
+    assert (stored.status, stored.locked_by, stored.progress_current) == ("running", reclaimed_by, None)
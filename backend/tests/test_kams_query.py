@@ -0,0 +1,118 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.db.session import SessionLocal
+from app.models import AssessmentSession, KAMSResult, Player
+from app.schemas.assessment.kams import KAMSMeasurementQuery
+from app.services.assessment.kams_query import build_measurement_query
+from tests.conftest import API
+
+# Session measurements, oldest first. S3's left hip flexion is not numeric
+# and S4 has no ROM result.
+SESSIONS = {
+    "S1": {"rom": {"hip_flexion_left": 120, "hip_flexion_right": 100}, "jump": {"height": 30}},
+    "S2": {"rom": {"hip_flexion_left": 100, "hip_flexion_right": 98}, "jump": {"height": 10}},
+    "S3": {"rom": {"hip_flexion_left": "n/a", "hip_flexion_right": 100}, "jump": {"height": 35}},
+    "S4": {"jump": {"height": 40}},
+}
+
+HIP_ASYMMETRY_OVER_10 = {"test_type": "rom", "field": "hip_flexion", "metric": "asymmetry", "op": "gt", "value": 10}
+JUMP_AT_LEAST_30 = {"test_type": "jump", "field": "height", "op": "gte", "value": 30}
+
+
+@pytest.fixture(scope="module")
+def kams_sessions(client):
+    """The SESSIONS on one test player: (player id, {name: session id})."""
+    db = SessionLocal()
+    player = Player(player_code="TESTKQ0001", first_name="Test", last_name="Kams")
+    db.add(player)
+    db.flush()
+    ids = {}
+    for day, (name, tests) in enumerate(SESSIONS.items(), start=1):
+        session = AssessmentSession(
+            player_id=player.id, assessment_type="kams", assessment_date=date(2024, 1, day), is_complete=True
+        )
+        session.kams_results.extend(
+            KAMSResult(test_type=test_type, measurements=measurements)
+            for test_type, measurements in tests.items()
+        )
+        db.add(session)
+        db.flush()
+        ids[name] = session.id
+    db.commit()
+    try:
+        yield player.id, ids
+    finally:
+        db.execute(text("DELETE FROM assessments.sessions WHERE player_id = :id"), {"id": player.id})
+        db.execute(text("DELETE FROM organization.players WHERE id = :id"), {"id": player.id})
+        db.commit()
+        db.close()
+
+
+def _matches(db, kams_sessions, filters, match="all"):
+    player_id, ids = kams_sessions
+    names = {session_id: name for name, session_id in ids.items()}
+    query = KAMSMeasurementQuery(filters=filters, match=match, player_id=player_id)
+    return {names[row.session_id]: row for row in build_measurement_query(db, query)}
+
+
+def test_match_all_intersects_and_any_unions_test_types(db, kams_sessions):
+    filters = [HIP_ASYMMETRY_OVER_10, JUMP_AT_LEAST_30]
+
+    assert set(_matches(db, kams_sessions, filters, "all")) == {"S1"}
+    assert set(_matches(db, kams_sessions, filters, "any")) == {"S1", "S3", "S4"}
+
+
+def test_asymmetry_and_value_filters(db, kams_sessions):
+    value = {"test_type": "rom", "field": "hip_flexion_left", "op": "gte", "value": 100}
+    balanced = {**HIP_ASYMMETRY_OVER_10, "op": "lt"}
+
+    assert set(_matches(db, kams_sessions, [value])) == {"S1", "S2"}
+    assert set(_matches(db, kams_sessions, [balanced])) == {"S2"}
+
+    row = _matches(db, kams_sessions, [HIP_ASYMMETRY_OVER_10, value])["S1"]
+    assert float(row._mapping["rom.hip_flexion.asymmetry"]) == pytest.approx(100 * 20 / 120)
+    assert row._mapping["rom.hip_flexion_left"] == 120
+
+
+def test_non_numeric_or_missing_measurement_is_null(db, kams_sessions):
+    rows = _matches(db, kams_sessions, [HIP_ASYMMETRY_OVER_10, JUMP_AT_LEAST_30], "any")
+
+    assert rows["S3"]._mapping["rom.hip_flexion.asymmetry"] is None
+    assert rows["S4"]._mapping["rom.hip_flexion.asymmetry"] is None
+    assert rows["S3"]._mapping["jump.height"] == 35
+    # A NULL never satisfies a filter, whatever the operator
+    for op in ("lt", "gte"):
+        value = {"test_type": "rom", "field": "hip_flexion_left", "op": op, "value": 1000}
+        assert "S3" not in _matches(db, kams_sessions, [value])
+
+
+def test_query_endpoint_pages_by_cursor_newest_first(client, auth_headers, kams_sessions):
+    player_id, ids = kams_sessions
+    body = {"filters": [HIP_ASYMMETRY_OVER_10, JUMP_AT_LEAST_30], "match": "any", "player_id": str(player_id)}
+
+    pages, cursor = [], None
+    while True:
+        response = client.post(
+            f"{API}/assessments/kams/query",
+            params={"limit": 1, **({"cursor": cursor} if cursor else {})},
+            json=body,
+            headers=auth_headers,
+        )
+        assert response.status_code == 200, response.text
+        pages.append([match["session_id"] for match in response.json()])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    expected = [str(ids[name]) for name in ("S4", "S3", "S1")]
+    assert [session_id for page in pages for session_id in page] == expected
+    assert all(len(page) <= 1 for page in pages)
+
+    response = client.post(f"{API}/assessments/kams/query", json=body, headers=auth_headers)
+    matches = response.json()
+    assert [match["session_id"] for match in matches] == expected
+    assert matches[0]["values"] == {"rom.hip_flexion.asymmetry": None, "jump.height": 40}
@@ -0,0 +1,89 @@
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import (
+    MetricsMiddleware,
+    http_request_db_statements,
+    http_requests_total,
+    instrument_engine,
+    metrics,
+)
+
+engine = create_engine("sqlite://")
+instrument_engine(engine)
+
+router = APIRouter()
+
+
+@router.get("/{item_id}")
+def get_item(item_id: int):
+    if item_id == 0:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return {"id": item_id}
+
+
+app = FastAPI()
+app.add_middleware(MetricsMiddleware)
+app.include_router(router, prefix="/api/items")
+
+
+@app.get("/boom")
+def boom():
+    raise RuntimeError("boom")
+
+
+@app.get("/queries")
+def queries():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+    return {}
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def _requests(method: str, route: str, status: str) -> float:
+    return http_requests_total._values.get((method, route, status), 0)
+
+
+@pytest.mark.parametrize(
+    "path, route, status",
+    [
+        ("/api/items/7", "/api/items/{item_id}", "200"),
+        ("/api/items/8", "/api/items/{item_id}", "200"),
+        ("/api/items/0", "/api/items/{item_id}", "404"),
+        ("/api/items/not-a-number", "/api/items/{item_id}", "422"),
+        ("/boom", "/boom", "500"),
+        ("/no/such/path", "unmatched", "404"),
+    ],
+)
+def test_requests_labelled_by_route_template_and_status(client, path, route, status):
+    before = _requests("GET", route, status)
+    client.get(path)
+    assert _requests("GET", route, status) == before + 1
+
+
+def test_unmatched_paths_share_one_label(client):
+    client.get("/no/such/path/1")
+    client.get("/another/path")
+    rendered = metrics.render()
+    assert "/no/such/path" not in rendered
+    assert "/another/path" not in rendered
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in rendered
+
+
+def test_statements_in_sync_endpoints_are_counted_per_request(client):
+    labels = ("GET", "/queries")
+    empty = [0] * (len(http_request_db_statements.buckets) + 2)
+    before = list(http_request_db_statements._values.get(labels, empty))
+    client.get("/queries")
+    after = http_request_db_statements._values[labels]
+    # Sum of statements, and one observation in the 2-statement bucket
+    assert after[-1] - before[-1] == 2
+    bucket = http_request_db_statements.buckets.index(2)
+    assert after[bucket] - before[bucket] == 1
@@ -0,0 +1,114 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.models import AssessmentSession, Player, TPIPowerResult
+from app.services.analysis.analytics_cube import GROUPING_ALL
+
+CONSTRAINT = "uq_tpi_power_session_test_side"
+
+
+def _nulls_not_distinct(db) -> bool:
+    return db.execute(text("""
+        SELECT i.indnullsnotdistinct
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = :name
+    """), {"name": CONSTRAINT}).scalar()
+
+
+@pytest.fixture
+def pre_migration_results(client):
+    """A session with duplicate side-less results under the old (NULLS DISTINCT) key."""
+    db = SessionLocal()
+    db.execute(text(f"""
+        ALTER TABLE assessments.tpi_power_results
+        DROP CONSTRAINT {CONSTRAINT},
+        ADD CONSTRAINT {CONSTRAINT} UNIQUE (session_id, test_code, side)
+    """))
+    player = Player(player_code="TESTMG0001", first_name="Test", last_name="Migration")
+    db.add(player)
+    db.flush()
+    session = AssessmentSession(player_id=player.id, assessment_type="tpi_power", assessment_date=date(2024, 1, 1))
+    db.add(session)
+    db.flush()
+    db.add_all(
+        TPIPowerResult(session_id=session.id, test_code=code, test_name=code, side=side,
+                       result_value=value, created_at=datetime(2024, 1, 1, hour))
+        for code, side, value, hour in [
+            ("VJ", None, 20, 9), ("VJ", None, 22, 11), ("VJ", None, 21, 10),
+            ("SP", "left", 30, 9), ("SP", "right", 31, 9), ("MB", None, 40, 9),
+        ]
+    )
+    session_id, player_id = session.id, player.id
+    db.commit()
+    try:
+        yield session_id
+    finally:
+        db.execute(text("DELETE FROM assessments.sessions WHERE id = :id"), {"id": session_id})
+        db.execute(text("DELETE FROM organization.players WHERE id = :id"), {"id": player_id})
+        if not _nulls_not_distinct(db):
+            db.execute(text(f"""
+                ALTER TABLE assessments.tpi_power_results
+                DROP CONSTRAINT {CONSTRAINT},
+                ADD CONSTRAINT {CONSTRAINT} UNIQUE NULLS NOT DISTINCT (session_id, test_code, side)
+            """))
+        db.commit()
+        db.close()
+
+
+def test_nulls_not_distinct_migration_keeps_the_newest_sideless_duplicate(db, pre_migration_results):
+    from app.main import run_migrations
+
+    assert not _nulls_not_distinct(db)
+    db.commit()
+
+    assert run_migrations() is True
+
+    assert _nulls_not_distinct(db)
+    rows = db.execute(text("""
+        SELECT test_code, side, result_value FROM assessments.tpi_power_results
+        WHERE session_id = :id ORDER BY test_code, side
+    """), {"id": pre_migration_results}).all()
+    assert [(r.test_code, r.side, float(r.result_value)) for r in rows] == [
+        ("MB", None, 40), ("SP", "left", 30), ("SP", "right", 31), ("VJ", None, 22),
+    ]
+
+
+@pytest.fixture
+def unscored_session(client):
+    """A complete session from before persisted scores, with the cube not yet filled."""
+    db = SessionLocal()
+    player = Player(player_code="TESTMG0002", first_name="Test", last_name="Backfill")
+    db.add(player)
+    db.flush()
+    session = AssessmentSession(player_id=player.id, assessment_type="tpi_power",
+                                assessment_date=date(2024, 1, 2), is_complete=True)
+    db.add(session)
+    db.flush()
+    db.add(TPIPowerResult(session_id=session.id, test_code="VJ", test_name="VJ", result_value=22))
+    db.execute(text("DELETE FROM analysis.session_score_aggregates"))
+    session_id, player_id = session.id, player.id
+    db.commit()
+    try:
+        yield session_id
+    finally:
+        db.execute(text("DELETE FROM assessments.sessions WHERE id = :id"), {"id": session_id})
+        db.execute(text("DELETE FROM organization.players WHERE id = :id"), {"id": player_id})
+        db.commit()
+        db.close()
+
+
+def test_bootstrap_backfills_session_scores_and_the_cube(db, unscored_session):
+    from app.main import backfill_analytics
+
+    assert backfill_analytics() is True
+
+    session = db.get(AssessmentSession, unscored_session)
+    assert session.overall_score is not None
+    assert db.execute(text("""
+        SELECT session_count FROM analysis.session_score_aggregates
+        WHERE grouping_id = :all AND assessment_type = 'tpi_power' AND bucket_date = '2024-01-02'
+    """), {"all": GROUPING_ALL}).scalar() >= 1
@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.models import Player, Sport, Team
+from tests.conftest import API
+
+PLAYERS = 200
+
+
+@pytest.fixture(scope="module")
+def team_of_players(client):
+    """A team with PLAYERS active players (codes starting "TESTPL")."""
+    db = SessionLocal()
+    sport = db.query(Sport).order_by(Sport.id).first()
+    team = Team(name="Query Count Test Team")
+    db.add(team)
+    db.flush()
+    db.add_all(
+        Player(
+            player_code=f"TESTPL{n:04d}",
+            first_name="Test",
+            last_name=f"Player{n:04d}",
+            team_id=team.id,
+            sport_id=sport.id if sport else None,
+            is_active=True,
+        )
+        for n in range(PLAYERS)
+    )
+    db.commit()
+    try:
+        yield team.id
+    finally:
+        db.execute(text("DELETE FROM organization.players WHERE player_code LIKE 'TESTPL%'"))
+        db.execute(text("DELETE FROM organization.teams WHERE id = :id"), {"id": team.id})
+        db.commit()
+        db.close()
+
+
+def test_player_list_statement_count_is_independent_of_page_size(
+    client, auth_headers, count_statements, team_of_players
+):
+    counts = {}
+    for limit in (5, 50, 200):
+        with count_statements() as statements:
+            response = client.get(
+                f"{API}/players",
+                params={"team_id": team_of_players, "limit": limit},
+                headers=auth_headers,
+            )
+        assert response.status_code == 200, response.text
+        assert len(response.json()) == limit
+        counts[limit] = len(statements)
+
+    assert counts[5] == counts[50] == counts[200], counts
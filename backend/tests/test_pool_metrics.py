@@ -0,0 +1,41 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+
+from app.db.pool_metrics import InstrumentedQueuePool
+
+
+def _pool(pool_size: int, max_overflow: int, timeout: float = 30) -> InstrumentedQueuePool:
+    return InstrumentedQueuePool(
+        lambda: sqlite3.connect(":memory:", check_same_thread=False),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        timeout=timeout,
+    )
+
+
+def test_unlimited_overflow_is_never_exhausted():
+    pool = _pool(pool_size=1, max_overflow=-1)
+    connections = [pool.connect() for _ in range(4)]
+
+    stats = pool.stats()
+    assert stats["checked_out"] == 4
+    assert stats["checkouts"] == 4
+    assert stats["exhausted_checkouts"] == 0
+    for connection in connections:
+        connection.close()
+
+
+def test_checkout_waiting_on_a_full_pool_is_exhausted():
+    pool = _pool(pool_size=1, max_overflow=1, timeout=0.05)
+    first, overflow = pool.connect(), pool.connect()
+    assert pool.stats()["exhausted_checkouts"] == 0
+
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+
+    stats = pool.stats()
+    assert (stats["exhausted_checkouts"], stats["checkout_timeouts"]) == (1, 1)
+    first.close()
+    overflow.close()
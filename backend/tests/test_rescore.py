@@ -0,0 +1,83 @@
+import threading
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.models import Job, RescoreCheckpoint
+from app.services.jobs import enqueue_job, find_active_job
+from tests.conftest import API
+
+
+@pytest.fixture
+def job_name(db):
+    """A rescoring job name of its own; its jobs and checkpoints are removed afterwards."""
+    job_name = f"test_{uuid.uuid4().hex[:12]}"
+    yield job_name
+    db.rollback()
+    db.execute(text("DELETE FROM jobs.jobs WHERE payload->>'job_name' = :name"), {"name": job_name})
+    db.execute(text("DELETE FROM assessments.rescore_checkpoints WHERE job_name = :name"), {"name": job_name})
+    db.commit()
+
+
+def _post(client, auth_headers, job_name, **body):
+    return client.post(
+        f"{API}/assessments/rescore",
+        json={"job_name": job_name, "result_types": ["sprint"], **body},
+        headers=auth_headers,
+    )
+
+
+def test_interrupted_run_resumes_from_its_checkpoint(client, auth_headers, db, job_name):
+    # A run whose worker died mid-way: the checkpoint still says "running"
+    last_id = uuid.uuid4()
+    db.add(RescoreCheckpoint(
+        job_name=job_name, result_type="sprint", status="running",
+        last_id=last_id, total_rows=100, rows_processed=50, rows_changed=5,
+    ))
+    db.commit()
+
+    response = _post(client, auth_headers, job_name)
+
+    assert response.status_code == 202, response.text
+    [checkpoint] = response.json()
+    assert (checkpoint["last_id"], checkpoint["rows_processed"]) == (str(last_id), 50)
+    job = db.get(Job, uuid.UUID(response.headers["Location"].rsplit("/", 1)[1]))
+    assert (job.job_type, job.status, job.payload["job_name"]) == ("rescore", "queued", job_name)
+
+
+def test_post_is_rejected_while_a_job_for_the_name_is_active(client, auth_headers, db, job_name):
+    assert _post(client, auth_headers, job_name).status_code == 202
+
+    again = _post(client, auth_headers, job_name)
+    restart = _post(client, auth_headers, job_name, restart=True)
+
+    assert again.status_code == 400
+    assert restart.status_code == 400
+    assert db.query(Job).filter(Job.payload["job_name"].astext == job_name).count() == 1
+
+
+def test_concurrent_posts_wait_for_the_first_enqueue_to_commit(db, job_name):
+    assert find_active_job(db, "rescore", {"job_name": job_name}) is None
+    job = enqueue_job(db, "rescore", {"job_name": job_name})
+    job_id = job.id
+
+    found = []
+
+    def second_post():
+        other_db = SessionLocal()
+        try:
+            active = find_active_job(other_db, "rescore", {"job_name": job_name})
+            found.append(active.id if active else None)
+        finally:
+            other_db.close()
+
+    thread = threading.Thread(target=second_post)
+    thread.start()
+    thread.join(0.5)
+    assert thread.is_alive(), "the second check should wait for the first transaction"
+
+    db.commit()
+    thread.join(5)
+    assert found == [job_id]
@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.models import (
+    AssessmentSession,
+    KAMSResult,
+    OnBaseUResult,
+    PitcherOnBaseUResult,
+    Player,
+    SprintResult,
+    TPIPowerResult,
+)
+from tests.conftest import API
+
+# Statements per request: the current user and their roles, the sessions with
+# player and assessor joined in, and (for the detail) the session's results
+SESSION_LIST_STATEMENTS = 3
+SESSION_DETAIL_STATEMENTS = 4
+
+SESSIONS_PER_TYPE = 4
+RESULTS_PER_SESSION = 5
+KAMS_TEST_TYPES = ["rom", "squat", "lunge", "balance", "jump"]
+
+
+def _results(assessment_type: str, n: int) -> list:
+    code = f"T{n:02d}"
+    if assessment_type == "onbaseu":
+        return [OnBaseUResult(test_code=code, test_name=code, test_category="mobility",
+                              result="Pass", score=3, color="green")]
+    if assessment_type == "pitcher_onbaseu":
+        return [PitcherOnBaseUResult(test_code=code, test_name=code, test_category="mobility",
+                                     result="Pass", score=3, color="green")]
+    if assessment_type == "tpi_power":
+        return [TPIPowerResult(test_code=code, test_name=code, result_value=10 + n)]
+    if assessment_type == "sprint":
+        return [SprintResult(test_code=code, test_name=code, test_category="linear")]
+    return [KAMSResult(test_type=KAMS_TEST_TYPES[n], measurements={"value": n})]
+
+
+@pytest.fixture(scope="module")
+def sessions_by_type(client):
+    """SESSIONS_PER_TYPE sessions of each assessment type, on one test player."""
+    db = SessionLocal()
+    player = Player(player_code="TESTSE0001", first_name="Test", last_name="Sessions")
+    db.add(player)
+    db.flush()
+    sessions = {}
+    for assessment_type in ("onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"):
+        for n in range(SESSIONS_PER_TYPE):
+            session = AssessmentSession(
+                player_id=player.id,
+                assessment_type=assessment_type,
+                assessment_date=date(2020, 1, 1) + timedelta(days=n),
+                is_complete=True,
+            )
+            relationship = f"{assessment_type}_results"
+            for r in range(RESULTS_PER_SESSION):
+                getattr(session, relationship).extend(_results(assessment_type, r))
+            db.add(session)
+            sessions.setdefault(assessment_type, []).append(session)
+    db.commit()
+    try:
+        yield player.id, {t: [s.id for s in ss] for t, ss in sessions.items()}
+    finally:
+        db.execute(text("DELETE FROM assessments.sessions WHERE player_id = :id"), {"id": player.id})
+        db.execute(text("DELETE FROM organization.players WHERE id = :id"), {"id": player.id})
+        db.commit()
+        db.close()
+
+
+@pytest.mark.parametrize("limit", [1, 5, 20])
+def test_session_list_statement_count(client, auth_headers, count_statements, sessions_by_type, limit):
+    player_id, _ = sessions_by_type
+    with count_statements() as statements:
+        response = client.get(
+            f"{API}/assessments/sessions",
+            params={"player_id": str(player_id), "limit": limit},
+            headers=auth_headers,
+        )
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == limit
+    assert len(statements) == SESSION_LIST_STATEMENTS, statements
+
+
+@pytest.mark.parametrize("assessment_type", ["onbaseu", "pitcher_onbaseu", "tpi_power", "sprint", "kams"])
+def test_session_detail_statement_count(
+    client, auth_headers, count_statements, sessions_by_type, assessment_type
+):
+    _, sessions = sessions_by_type
+    for session_id in sessions[assessment_type]:
+        with count_statements() as statements:
+            response = client.get(f"{API}/assessments/sessions/{session_id}", headers=auth_headers)
+        assert response.status_code == 200, response.text
+        assert len(response.json()["results"]) == RESULTS_PER_SESSION
+        assert len(statements) == SESSION_DETAIL_STATEMENTS, statements